@@ -0,0 +1,140 @@
+"""
+An on-disk cache of validation results.
+
+Results are keyed by the sha256 digest of the input together with the
+version of pywrparser, the key and version of any ruleset applied, and
+those parsing options which affect the result. A cached result is returned
+without the input being decoded or any rules evaluated.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+from pywrparser import __version__
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+CACHE_SUFFIX = ".pickle"
+
+
+class ValidationCache():
+    """
+    A directory of pickled `(network, errors, warnings)` results, in which
+    the least recently used entries are evicted once the total size of the
+    cache exceeds `max_size` bytes.
+    """
+    def __init__(self, directory, max_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            directory (str): The directory containing the cache, which is
+                created if it does not exist
+            max_size (int): The maximum total size in bytes of cached results
+        """
+        self.directory = directory
+        self.max_size = int(max_size)
+        os.makedirs(directory, exist_ok=True)
+
+
+    @staticmethod
+    def key(digest, ruleset=None, **options):
+        """
+        Returns the cache key of results for an input with the sha256 `digest`,
+        parsed with the `ruleset` and `options` given.
+        """
+        from pywrparser import rules
+        ruleset_version = (rules.get_ruleset(ruleset) or {}).get("version")
+        identity = {
+            "digest": digest,
+            "pywrparser": __version__,
+            "ruleset": ruleset,
+            "ruleset_version": ruleset_version,
+            "options": options
+        }
+        return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}{CACHE_SUFFIX}")
+
+
+    def get(self, key):
+        """
+        Returns:
+            The `(network, errors, warnings)` tuple cached for `key`,
+            or None if there is no valid entry.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fp:
+                result = pickle.load(fp)
+            # Record the use of this entry for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            log.warning(f"Discarding unreadable cache entry {path}: {err}")
+            self._remove(path)
+            return None
+
+        return result
+
+
+    def put(self, key, result):
+        """
+        Stores the `(network, errors, warnings)` tuple `result` under `key`,
+        then evicts entries as required by the size of the cache.
+        """
+        try:
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as err:
+            log.warning(f"Unable to cache validation result: {err}")
+            return
+
+        fd, tmppath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmppath, self._path(key))
+        except OSError as err:
+            log.warning(f"Unable to write cache entry: {err}")
+            self._remove(tmppath)
+            return
+
+        self.evict()
+
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the total size of the
+        cache does not exceed `max_size`.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX) and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX):
+                self._remove(entry.path)
+
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
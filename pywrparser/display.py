@@ -1,5 +1,4 @@
 import datetime
-import io
 import json
 import os
 
@@ -7,6 +6,7 @@ from rich.align import Align
 from rich.console import Console
 from rich.padding import Padding
 from rich.panel import Panel
+from rich.table import Table
 
 
 console = Console()
@@ -21,6 +21,8 @@ def write_results(filename, errors, warnings, use_emoji=True):
 
     err_plural = "" if error_total == 1 else "s"
     warn_plural = "" if warning_total == 1 else "s"
+    if not isinstance(filename, str):
+        filename = "stdin"
 
     header = Align(Panel(f"[bold green]Parser results for '{filename}':"
     f" [bold red]{error_total} error{err_plural}[/bold red],"
@@ -68,6 +70,21 @@ def write_results(filename, errors, warnings, use_emoji=True):
     console.rule(style="blue")
 
 
+def write_profile(profile):
+    table = Table(title="Rule profile", title_style="bold green", border_style="blue")
+    table.add_column("Component", style="green")
+    table.add_column("Rule", style="bold blue")
+    for heading in ("Calls", "Hits", "Failures", "Total (ms)", "Max (ms)"):
+        table.add_column(heading, justify="right")
+
+    for stats in profile.as_dict():
+        table.add_row(stats["component"], stats["rule"], str(stats["calls"]),
+                      str(stats["hits"]), str(stats["failures"]),
+                      f"{stats['total_time']*1000:.3f}", f"{stats['max_time']*1000:.3f}")
+
+    console.print(table)
+
+
 def coalesce_errors_and_warnings(errors, warnings):
     warnings = warnings if warnings else {}
     all = errors.copy() if errors else {}
@@ -93,30 +110,37 @@ def count_errors_warnings(errors, warnings):
     return error_total, warning_total
 
 
-def results_as_dict(filename, errors, warnings, include_digest=True):
+def ruleset_name(key=None):
+    """
+    Returns the name of the ruleset with the specified `key`, or of the
+    default ruleset if this is None.
+    """
+    from pywrparser import rules
+    ruleset = rules.get_ruleset_module(key) if key else None
+    return ruleset.__ruleset_name__ if ruleset else "Default"
+
+
+def results_as_dict(filename, errors, warnings, include_digest=True, decompress_digest=False,
+                    digest=None, profile=None, ruleset=None):
     error_total, warning_total = count_errors_warnings(errors, warnings)
 
-    if isinstance(filename, io.StringIO):
-        filename = "stdin"
-    fbasename = os.path.basename(filename)
-    from pywrparser import rules
-    ruleset = rules.get_ruleset_module(rules.ACTIVE_RULESET_KEY)
-    ruleset_name = ruleset.__ruleset_name__ if ruleset else "Default"
+    fbasename = os.path.basename(filename) if isinstance(filename, str) else "stdin"
 
     ret = {
         "parse_results": {
             "file": {"name": fbasename},
             "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "ruleset": ruleset_name,
+            "ruleset": ruleset_name(ruleset),
             "errors": error_total,
             "warnings": warning_total
         }
     }
 
-    if include_digest:
+    if include_digest and digest is None and isinstance(filename, str):
         from pywrparser.utils import sha256digest
-        fdigest = sha256digest(filename)
-        ret["parse_results"]["file"]["sha256"] = fdigest
+        digest = sha256digest(filename, decompress=decompress_digest)
+    if include_digest and digest is not None:
+        ret["parse_results"]["file"]["sha256"] = digest
 
     if errors:
         component_errs = {}
@@ -128,9 +152,14 @@ def results_as_dict(filename, errors, warnings, include_digest=True):
         for component, warns in warnings.items():
             component_warns[component] = [warn.as_dict() for warn in warns]
         ret["warnings"] = component_warns
+    if profile is not None:
+        ret["rule_profile"] = profile.as_dict()
 
     return ret
 
 
-def results_as_json(filename, errors, warnings, include_digest=True, indent=0):
-    return json.dumps(results_as_dict(filename, errors, warnings, include_digest), indent=indent)
+def results_as_json(filename, errors, warnings, include_digest=True, indent=0, decompress_digest=False,
+                    digest=None, profile=None, ruleset=None):
+    return json.dumps(results_as_dict(filename, errors, warnings, include_digest, decompress_digest, digest,
+                                      profile, ruleset),
+                      indent=indent)
@@ -1,4 +1,5 @@
 import argparse
+import json
 import os
 import sys
 
@@ -6,12 +7,28 @@ from pywrparser import (
     rules,
     __version__
 )
+from pywrparser.cache import (
+    DEFAULT_CACHE_SIZE,
+    ValidationCache
+)
 from pywrparser.display import (
     console,
+    results_as_dict,
     results_as_json,
+    ruleset_name,
+    write_profile,
     write_results
 )
+from pywrparser.parsers.pywrjsonparser import SECTIONS
 from pywrparser.types.network import PywrNetwork
+from pywrparser.utils import (
+    InputDigest,
+    RuleProfile
+)
+
+
+# The value of --use-ruleset which denotes the default rules
+DEFAULT_RULESET = "default"
 
 
 def configure_args(args):
@@ -24,7 +41,8 @@ def configure_args(args):
     meg = parser.add_mutually_exclusive_group()
     meg.add_argument("-f", "--filename",
         metavar="<filename>",
-        help="File containing a Pywr network in JSON format",
+        help="File containing a Pywr network in JSON format."
+        " This may be compressed with gzip, bzip2, xz or zip",
         type=str,
         default=None)
     meg.add_argument("-s", "--stdin",
@@ -41,11 +59,45 @@ def configure_args(args):
 
     validation.add_argument("--use-ruleset",
         metavar="<ruleset>",
+        action="append",
         type=str,
         default=None,
-        help="Apply the specified ruleset during parsing"
+        help="Apply the specified ruleset during parsing. This may be repeated"
+        " to validate the input against each ruleset in turn, where"
+        f" `{DEFAULT_RULESET}` denotes the default rules"
     )
 
+    validation.add_argument("--sections",
+        metavar="<section>[,<section>...]",
+        type=lambda arg: [section.strip() for section in arg.split(',')],
+        default=None,
+        help="Parse and validate only the specified comma-separated"
+        f" sections of the network: {', '.join(SECTIONS)}"
+    )
+    validation.add_argument("--max-errors",
+        metavar="<N>",
+        type=int,
+        default=None,
+        help="Stop parsing once N errors have been found"
+    )
+    validation.add_argument("--memoize",
+        action="store_true",
+        default=False,
+        help="Reuse rule outcomes for components with identical data other than name"
+    )
+    validation.add_argument("--workers",
+        metavar="<N>",
+        type=int,
+        default=None,
+        help="Validate the parameters, recorders and nodes of large networks"
+        " in N worker processes"
+    )
+    validation.add_argument("--decode-in-workers",
+        action="store_true",
+        default=False,
+        help="Decode the parameters, recorders and nodes validated by"
+        " worker processes in the workers themselves"
+    )
     validation.add_argument("--raise-on-warning",
         action="store_true",
         default=False,
@@ -97,6 +149,12 @@ def configure_args(args):
         default=False,
         help="Display only a terse report for valid networks"
     )
+    display.add_argument("--profile-rules",
+        action="store_true",
+        default=False,
+        help="Display the calls, failures and time taken of each rule,"
+        " or include these in JSON output. Implies no use of the cache"
+    )
 
     general = parser.add_argument_group("general options")
 
@@ -105,6 +163,25 @@ def configure_args(args):
         default=False,
         help="Omit sha256 digest in JSON and dict parsing reports"
     )
+    general.add_argument("--digest-decompressed",
+        action="store_true",
+        default=False,
+        help="Calculate the sha256 digest of compressed input after decompression"
+    )
+    general.add_argument("--cache-dir",
+        metavar="<directory>",
+        type=str,
+        default=None,
+        help="Cache parsing results in the specified directory, and reuse"
+        " these for unchanged input"
+    )
+    general.add_argument("--cache-size",
+        metavar="<MiB>",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // 2**20,
+        help="The maximum size of the results cache, after which the least"
+        " recently used results are discarded (default: %(default)s)"
+    )
     general.add_argument("--version",
         action="store_true",
         default=False,
@@ -125,6 +202,7 @@ def handle_args(args):
     raise_warning = args.raise_on_warning
     useemoji = not args.no_emoji if not args.no_colour else False
     include_digest = not args.no_digest
+    decompress_digest = args.digest_decompressed
     allow_duplicate_edges = not args.no_duplicate_edges
 
     if args.version:
@@ -135,62 +213,166 @@ def handle_args(args):
         print(rules.describe_rulesets(), end="")
         sys.exit(0)
 
-    if ruleset := args.use_ruleset:
-        rulesets = rules.get_rulesets()
-        if not ruleset in rulesets:
+    rulesets = [None if key == DEFAULT_RULESET else key for key in args.use_ruleset or [None]]
+    for ruleset in rulesets:
+        if ruleset is not None and ruleset not in rules.get_registry():
             print(f"No ruleset with key: {ruleset}", file=sys.stderr)
             sys.exit(1)
 
+    if args.sections and (unknown := set(args.sections) - set(SECTIONS)):
+        print(f"Unknown network sections: {', '.join(sorted(unknown))}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.max_errors is not None and args.max_errors < 1:
+        print("The value of --max-errors must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.workers is not None and args.workers < 1:
+        print("The value of --workers must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.decode_in_workers and len(rulesets) > 1:
+        print("--decode-in-workers may not be used with more than one ruleset", file=sys.stderr)
+        sys.exit(1)
+
     if args.no_colour:
         console.no_color = True
 
     if args.stdin:
-        import io
-        include_digest = False
-        filename = io.StringIO(sys.stdin.read())
+        filename = sys.stdin.buffer
+
+    if len(rulesets) > 1:
+        return handle_rulesets(args, filename, rulesets)
+    ruleset = rulesets[0]
 
+    cache = ValidationCache(args.cache_dir, max_size=args.cache_size * 2**20) if args.cache_dir else None
+    input_digest = InputDigest(decompressed=decompress_digest) if include_digest else None
+    profile = RuleProfile() if args.profile_rules else None
     network, errors, warnings = PywrNetwork.from_file(filename,
                                     raise_on_parser_error=raise_error,
                                     raise_on_parser_warning=raise_warning,
                                     ignore_warnings=args.ignore_warnings,
                                     allow_duplicate_edges=allow_duplicate_edges,
-                                    ruleset=ruleset
+                                    ruleset=ruleset,
+                                    digest=input_digest,
+                                    cache=cache,
+                                    sections=args.sections,
+                                    max_errors=args.max_errors,
+                                    memoize=args.memoize,
+                                    profile=profile,
+                                    workers=args.workers,
+                                    decode_in_workers=args.decode_in_workers
                                 )
+    digest = input_digest.hexdigest() if input_digest else None
 
     if errors or warnings:
         if not errors and args.ignore_warnings:
             """ Do nothing """
             pass
         elif args.json_output:
-            print(results_as_json(filename, errors, warnings, include_digest=include_digest))
+            print(results_as_json(filename, errors, warnings,
+                                  include_digest=include_digest,
+                                  digest=digest,
+                                  profile=profile,
+                                  ruleset=ruleset))
             return;
         else:
             write_results(filename, errors, warnings, use_emoji=useemoji)
 
     if network:
-        network.add_parameter_references()
-        network.add_recorder_references()
-        network.promote_inline_parameters()
-        network.attach_reference_parameters()
+        resolve_references(network)
         if args.terse_report:
             report = network.report()
             console.print(report)
+            if profile is not None:
+                write_profile(profile)
             return;
         if args.json_output:
-            report = results_as_json(filename, errors, warnings, include_digest=include_digest)
+            report = results_as_json(filename, errors, warnings,
+                                     include_digest=include_digest,
+                                     digest=digest,
+                                     profile=profile,
+                                     ruleset=ruleset)
             print(report)
             return;
         else:
-            report = network.verbose_report()
-            file_txt = f"[green]File:[/green] [bold blue]{os.path.basename(args.filename)}[/bold blue]"
+            fbasename = "stdin" if args.stdin else os.path.basename(args.filename)
+            file_txt = f"[green]File:[/green] [bold blue]{fbasename}[/bold blue]"
             console.print(file_txt)
             if include_digest:
-                from pywrparser.utils import sha256digest
-                digest_txt = f"[green]sha256:[/green] [blue]{sha256digest(args.filename)}[/blue]"
+                digest_txt = f"[green]sha256:[/green] [blue]{digest}[/blue]"
                 console.print(digest_txt)
 
-            for prefix, txt in report.items():
-                console.print(f"[green]{prefix}:[/green] [blue]{txt}[/blue]")
+            write_report(network)
+
+    if profile is not None and not args.json_output:
+        write_profile(profile)
+
+
+def resolve_references(network):
+    """
+    Replaces the references and inline definitions of parameters and
+    recorders in the nodes of `network` with the components themselves.
+    """
+    network.add_parameter_references()
+    network.add_recorder_references()
+    network.promote_inline_parameters()
+    network.attach_reference_parameters()
+
+
+def write_report(network):
+    for prefix, txt in network.verbose_report().items():
+        console.print(f"[green]{prefix}:[/green] [blue]{txt}[/blue]")
+
+
+def handle_rulesets(args, filename, rulesets):
+    """
+    Reports the results of validating the input against each of
+    several `rulesets`, which is decoded only once.
+    """
+    include_digest = not args.no_digest
+    cache = ValidationCache(args.cache_dir, max_size=args.cache_size * 2**20) if args.cache_dir else None
+    input_digest = InputDigest(decompressed=args.digest_decompressed) if include_digest else None
+    profile = RuleProfile() if args.profile_rules else None
+    results = PywrNetwork.from_file_rulesets(filename, rulesets,
+                                raise_on_parser_error=args.raise_on_error,
+                                raise_on_parser_warning=args.raise_on_warning,
+                                ignore_warnings=args.ignore_warnings,
+                                allow_duplicate_edges=not args.no_duplicate_edges,
+                                digest=input_digest,
+                                cache=cache,
+                                sections=args.sections,
+                                max_errors=args.max_errors,
+                                memoize=args.memoize,
+                                profile=profile,
+                                workers=args.workers
+                            )
+    digest = input_digest.hexdigest() if input_digest else None
+
+    if args.json_output:
+        reports = [results_as_dict(filename, errors, warnings,
+                                   include_digest=include_digest,
+                                   digest=digest,
+                                   profile=profile,
+                                   ruleset=ruleset)
+                   for ruleset, (network, errors, warnings) in results.items()]
+        print(json.dumps(reports, indent=0))
+        return
+
+    useemoji = not args.no_emoji if not args.no_colour else False
+    for ruleset, (network, errors, warnings) in results.items():
+        console.rule(f"[bold green]Ruleset: {ruleset_name(ruleset)}", style="blue")
+        if errors or (warnings and not args.ignore_warnings):
+            write_results(filename, errors, warnings, use_emoji=useemoji)
+        if network:
+            resolve_references(network)
+            if args.terse_report:
+                console.print(network.report())
+            else:
+                write_report(network)
+
+    if profile is not None:
+        write_profile(profile)
 
 
 def run():
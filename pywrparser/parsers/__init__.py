@@ -1 +1,3 @@
 from .pywrjsonparser import PywrJSONParser
+from .pywrjsonstreamparser import PywrJSONStreamParser
+from .pywrjsonrangeparser import PywrJSONRangeParser
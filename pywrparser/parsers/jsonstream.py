@@ -0,0 +1,362 @@
+import codecs
+import json
+import re
+
+from pywrparser.types.exceptions import PywrParserException
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRUCTURE = re.compile(r'["\[\]{}]')
+STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+# The text between the strings and nested containers of a container
+PLAIN = r'[^"\[\]{}]*'
+SCALAR = r'[-+.\w]+'
+WS = r"[ \t\n\r]*"
+# Containers nested more deeply than this are scanned by skip_value
+CONTAINER_DEPTH = 4
+# Decode failures this close to the end of the buffer may be caused by
+# a token split across reads, rather than by malformed input
+TAIL_MARGIN = 64
+
+
+def container_pattern(depth):
+    """
+    Returns a regular expression matching an object or array containing
+    up to `depth` levels of nested containers. Brackets are balanced by
+    depth rather than kind and scalars are not validated, so that as with
+    :meth:`JSONStreamReader.skip_value`, a match is the extent of a value
+    only if the text is valid JSON.
+    """
+    inner = STRING
+    for _ in range(depth):
+        container = rf'[\[{{]{PLAIN}(?:(?:{inner}){PLAIN})*[\]}}]'
+        inner = f"{STRING}|{container}"
+    return container
+
+
+CONTAINER = re.compile(container_pattern(CONTAINER_DEPTH))
+VALUE = f"{container_pattern(CONTAINER_DEPTH)}|{STRING}|{SCALAR}"
+MEMBER = re.compile(rf'{WS}({STRING}){WS}:{WS}({VALUE}){WS}([,}}])')
+ELEMENT = re.compile(rf'{WS}({VALUE}){WS}([,\]])')
+
+
+class JSONStreamReader():
+    """
+    Incremental reader for a JSON document held in a file object.
+
+    The document is read in chunks and the structure of its containers
+    is walked explicitly, such that each member of an object or array
+    may be decoded individually once its text is complete. Consumed
+    text is discarded as the buffer is refilled, so the memory used by
+    the reader is bounded by the largest single value it decodes rather
+    than the size of the document.
+    """
+    def __init__(self, fp, chunk_size=DEFAULT_CHUNK_SIZE, object_pairs_hook=None):
+        """
+        Args:
+            fp (file): A file object opened in either text or binary mode.
+                Binary input is decoded as UTF-8.
+            chunk_size (int): The size of each read from `fp`
+            object_pairs_hook (callable): Passed to the decoder of each value
+        """
+        self.fp = fp
+        self.chunk_size = int(chunk_size)
+        self.decoder = json.JSONDecoder(object_pairs_hook=object_pairs_hook)
+        self.skipper = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+        self._textdecoder = None
+
+
+    @classmethod
+    def from_str(cls, text, object_pairs_hook=None):
+        """
+        Returns a reader over the complete document `text`, which is
+        scanned in place rather than read in chunks.
+        """
+        reader = cls(None, object_pairs_hook=object_pairs_hook)
+        reader.buf = text
+        reader.eof = True
+        return reader
+
+
+    def tell(self):
+        """
+        Returns:
+            int: The character offset in the document of the next unread character
+        """
+        return self.offset + self.pos
+
+
+    def _fill(self, size=None):
+        """
+        Appends the next chunk of input to the buffer, discarding any
+        text which has already been consumed.
+
+        Returns:
+            bool: ``False`` if the input is exhausted
+        """
+        if self.eof:
+            return False
+
+        raw = self.fp.read(size or self.chunk_size)
+        if isinstance(raw, str):
+            chunk = raw
+        else:
+            if self._textdecoder is None:
+                self._textdecoder = codecs.getincrementaldecoder("utf-8-sig")()
+            try:
+                chunk = self._textdecoder.decode(raw, final=not raw)
+            except UnicodeDecodeError as err:
+                raise self._error(f"Invalid UTF-8 input: {err.reason}") from None
+
+        if not raw:
+            self.eof = True
+
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return bool(raw)
+
+
+    def _error(self, message, pos=None):
+        pos = self.tell() if pos is None else self.offset + pos
+        return PywrParserException(f"Invalid JSON document: {message} (char {pos})")
+
+
+    def _skip_ws(self):
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return
+            if not self._fill():
+                raise self._error("Unexpected end of document")
+
+
+    def peek(self):
+        """
+        Returns:
+            str: The next non-whitespace character, which is not consumed
+        """
+        self._skip_ws()
+        return self.buf[self.pos]
+
+
+    def next_char(self):
+        ch = self.peek()
+        self.pos += 1
+        return ch
+
+
+    def expect(self, expected):
+        if (ch := self.next_char()) != expected:
+            raise self._error(f"Expecting '{expected}', found '{ch}'", self.pos-1)
+
+
+    def _decode(self, decoder):
+        self._skip_ws()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as err:
+                truncated = err.msg.startswith("Unterminated string") \
+                         or err.pos >= len(self.buf) - TAIL_MARGIN
+                if not truncated or not self._fill(max(self.chunk_size, len(self.buf))):
+                    raise self._error(err.msg, err.pos) from None
+                continue
+
+            if end == len(self.buf) and not self.eof:
+                # A trailing number may continue in the next chunk
+                if self._fill(self.chunk_size):
+                    continue
+            self.pos = end
+            return value
+
+
+    def read_value(self):
+        """
+        Decodes and returns the next complete value in the document.
+        """
+        return self._decode(self.decoder)
+
+
+    def skip_value(self):
+        """
+        Consumes the next value in the document without applying
+        the `object_pairs_hook`. The contents of an object or array
+        are scanned for their closing bracket but are not decoded, and
+        so are not validated.
+        """
+        if self.peek() not in "{[":
+            self._decode(self.skipper)
+            return
+
+        if m := CONTAINER.match(self.buf, self.pos):
+            # The value is complete in the buffer and not deeply nested
+            self.pos = m.end()
+            return
+
+        depth = 0
+        pos = self.pos
+        while True:
+            if not (m := STRUCTURE.search(self.buf, pos)):
+                # Discard the scanned text and continue in the next chunk
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self._error("Unexpected end of document")
+                pos = 0
+                continue
+
+            ch = m.group()
+            if ch == '"':
+                if not (tail := STRING_TAIL.match(self.buf, m.end())):
+                    # The string continues in the next chunk
+                    self.pos = m.start()
+                    if not self._fill(max(self.chunk_size, len(self.buf))):
+                        raise self._error("Unterminated string")
+                    pos = 0
+                    continue
+                pos = tail.end()
+            elif ch in "{[":
+                depth += 1
+                pos = m.end()
+            else:
+                depth -= 1
+                pos = m.end()
+                if depth == 0:
+                    self.pos = pos
+                    return
+
+
+    def iter_members(self):
+        """
+        Iterates over the keys of the object beginning at the current position.
+        After each key is yielded, the caller must consume the corresponding
+        value before advancing the iterator.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.read_key()
+            self.expect(':')
+            yield key
+            ch = self.next_char()
+            if ch == '}':
+                return
+            if ch != ',':
+                raise self._error("Expecting ',' delimiter", self.pos-1)
+
+
+    def read_key(self):
+        key = self._decode(self.skipper)
+        if not isinstance(key, str):
+            raise self._error("Expecting property name enclosed in double quotes")
+        return key
+
+
+    def iter_values(self):
+        """
+        Iterates over the values of the array beginning at the current
+        position, decoding each as it is reached.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            yield self.read_value()
+            ch = self.next_char()
+            if ch == ']':
+                return
+            if ch != ',':
+                raise self._error("Expecting ',' delimiter", self.pos-1)
+
+
+    def iter_member_spans(self):
+        """
+        Iterates over the members of the object beginning at the current
+        position without decoding their values. For each member, a tuple
+        `(key, start, end)` is yielded in which `start` and `end` are the
+        character offsets of the text of its value in the document. The
+        reader must hold the complete document, as by :meth:`from_str`.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            if m := MEMBER.match(self.buf, self.pos):
+                key = m.group(1)
+                key = json.loads(key) if '\\' in key else key[1:-1]
+                start, end = m.span(2)
+                ch = m.group(3)
+                self.pos = m.end()
+            else:
+                if self.peek() != '"':
+                    raise self._error("Expecting property name enclosed in double quotes")
+                key = self.read_key()
+                self.expect(':')
+                self._skip_ws()
+                start = self.pos
+                self.skip_value()
+                end = self.pos
+                ch = self.next_char()
+            yield key, self.offset + start, self.offset + end
+            if ch == '}':
+                return
+            if ch != ',':
+                raise self._error("Expecting ',' delimiter", self.pos-1)
+
+
+    def iter_value_spans(self):
+        """
+        Iterates over the values of the array beginning at the current
+        position without decoding these, yielding a tuple `(start, end)`
+        of the character offsets of the text of each. The reader must hold
+        the complete document, as by :meth:`from_str`.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            if m := ELEMENT.match(self.buf, self.pos):
+                start, end = m.span(1)
+                ch = m.group(2)
+                self.pos = m.end()
+            else:
+                self._skip_ws()
+                start = self.pos
+                self.skip_value()
+                end = self.pos
+                ch = self.next_char()
+            yield self.offset + start, self.offset + end
+            if ch == ']':
+                return
+            if ch != ',':
+                raise self._error("Expecting ',' delimiter", self.pos-1)
+
+
+    def expect_end(self):
+        """
+        Raises:
+            PywrParserException: If any content other than whitespace
+                follows the current position
+        """
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                raise self._error("Extra data")
+            if not self._fill():
+                return
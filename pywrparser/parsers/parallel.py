@@ -0,0 +1,100 @@
+"""
+Validation of the members of large sections in worker processes.
+
+The members of a section are divided into contiguous chunks, each of which
+is validated by :func:`validate_members` in a worker process. Only the outcome
+of each member, its errors or warnings, is returned to the parser, which then
+creates each valid component from its data without validating it again. The
+outcomes are applied in the order of the members, as if each had been built
+in turn, and batch rules are then applied by the parser to all valid components
+of the section, such that the results are identical to those of validation in
+a single process.
+"""
+import math
+
+from pywrparser.utils import (
+    RuleMemo,
+    RuleProfile,
+    batch_validation,
+    profile_rules,
+    rule_memo,
+    trusted_construction
+)
+
+# Sections whose members may be validated in worker processes
+PARALLEL_SECTIONS = ("parameters", "recorders", "nodes")
+# The fewest members validated by a worker in one task. Sections with fewer
+# than twice this number of members are validated by the parser itself.
+MIN_CHUNK_SIZE = 500
+# The number of tasks into which a section is divided for each worker
+CHUNKS_PER_WORKER = 4
+
+
+def chunk_members(members, workers):
+    """
+    Returns `members` divided into contiguous lists for `workers` worker
+    processes, or a single list if `members` are too few to be divided.
+    """
+    size = max(MIN_CHUNK_SIZE, math.ceil(len(members) / (workers * CHUNKS_PER_WORKER)))
+    return [members[idx:idx+size] for idx in range(0, len(members), size)]
+
+
+def validate_members(component_type, members, keyed, memoize=False, profile=False, components=False):
+    """
+    Validates an instance of `component_type` built from each of `members`,
+    applying every rule other than batch rules.
+
+    Args:
+        component_type (type): The class of the components
+        members (List): The data of each component, or `(name, data)` pairs
+            if `keyed` is ``True``
+        keyed (bool): Specifies whether members are `(name, data)` pairs
+        memoize (bool): Specifies whether outcomes are reused between
+            components of identical data, as by :class:`RuleMemo`
+        profile (bool): Specifies whether rules are profiled
+        components (bool): Specifies whether valid components are returned
+            in place of their warnings
+
+    Returns:
+        outcomes, profile (:class:`Tuple[List, RuleProfile]`): in which each
+            outcome is the exception raised in building the corresponding
+            component, else either the component or a list of its warnings,
+            or None if it has none; and `profile` is None unless rules were
+            profiled.
+    """
+    outcomes = []
+    profile = RuleProfile() if profile else None
+    with rule_memo(RuleMemo() if memoize else None), profile_rules(profile), batch_validation():
+        for member in members:
+            try:
+                component = component_type(*member) if keyed else component_type(member)
+            except Exception as exc:
+                outcomes.append(exc)
+            else:
+                outcomes.append(component if components else component.warnings or None)
+
+    return outcomes, profile
+
+
+class ComponentOutcomes():
+    """
+    A callable which stands in for the class of a section's components
+    during parsing. The outcome of each member in turn, as validated by
+    a worker, is either raised, returned if it is a component, or applied
+    to a component created from the member without validation.
+    """
+    def __init__(self, component_type, outcomes):
+        self.component_type = component_type
+        self._outcomes = iter(outcomes)
+
+    def __call__(self, *member):
+        outcome = next(self._outcomes)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if isinstance(outcome, self.component_type):
+            return outcome
+        with trusted_construction():
+            component = self.component_type(*member)
+        if outcome:
+            component.warnings = outcome
+        return component
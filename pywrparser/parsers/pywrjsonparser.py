@@ -1,32 +1,121 @@
+import copy
 import json
-import re
+
 from collections import (
     defaultdict,
+    deque,
+    namedtuple,
     Counter
 )
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
+from inspect import getattr_static
 
 from pywrparser import rules
-from pywrparser.types import (
-    PywrTimestepper,
-    PywrMetadata,
-    PywrScenario,
-    PywrScenarioCombination,
-    PywrTable,
-    PywrNode,
-    PywrEdge,
-    PywrParameter,
-    PywrRecorder,
-)
 from pywrparser.types.exceptions import (
     PywrParserException,
-    PywrNetworkValidationError
+    PywrNetworkValidationError,
+    PywrTypeValidationError,
+    PywrTypeValidationErrorBundle
+)
+from pywrparser.parsers.parallel import (
+    PARALLEL_SECTIONS,
+    ComponentOutcomes,
+    chunk_members,
+    validate_members
+)
+from pywrparser.types.lazy import LazyComponentMap
+from pywrparser.utils import (
+    RuleMemo,
+    active_memo,
+    batch_validation,
+    immediate_validation,
+    profile_rules,
+    raiseorpush,
+    rule_memo
 )
-from pywrparser.utils import raiseorpush
 
-DUP_KEY_BASE = "__PywrParser_Duplicate_Key_{pattern}__"
-DUP_KEY_FLAG = DUP_KEY_BASE.format(pattern="{idx:03d}")
-DUP_KEY_RE   = r"{base}".format(base=DUP_KEY_BASE.format(pattern="[0-9]{3}"))
+DuplicateKey = namedtuple("DuplicateKey", ("section", "name", "location"))
+DuplicateKey.__doc__ = """
+A key which occurs more than once in a JSON object of the document.
+
+Attributes:
+    section (str): The top-level section containing the object, or None
+        for keys of the top-level object itself
+    name (str): The repeated key
+    location (str): A JSON pointer to the object containing the key, e.g.
+        "/parameters" for a repeated parameter name
+"""
+
+# Top-level sections of a Pywr network, in the order in which they are parsed
+SECTIONS = (
+    "metadata",
+    "timestepper",
+    "scenarios",
+    "scenario_combinations",
+    "tables",
+    "parameters",
+    "recorders",
+    "nodes",
+    "edges"
+)
+# Sections whose members are keyed by name
+MAPPING_SECTIONS = ("tables", "parameters", "recorders")
+# Sections in which a repeated member name is a network error. Repeated
+# tables are accepted, the last taking precedence.
+UNIQUE_SECTIONS = ("parameters", "recorders")
+# Sections whose members are elements of an array
+ARRAY_SECTIONS = ("scenarios", "scenario_combinations", "nodes", "edges")
+# Sections whose members may be built on first access
+LAZY_SECTIONS = ("tables", "parameters", "recorders", "nodes")
+# Exceptions reporting the errors of a component
+VALIDATION_ERRORS = (PywrTypeValidationError, PywrTypeValidationErrorBundle)
+
+
+class ErrorLimitReached(Exception):
+    """ Raised to end parsing once the error budget is exhausted """
+
+
+def pointer_token(key):
+    """ Escapes `key` for use in a JSON pointer """
+    return key.replace('~', "~0").replace('/', "~1")
+
+
+def locate_duplicates(pending, value, location):
+    """
+    Returns a :class:`DuplicateKey` for each of the `pending` `(object, key)`
+    pairs noted while decoding `value`, whose location in the document is
+    the JSON pointer `location`.
+    """
+    owners = defaultdict(list)
+    for obj, key in pending:
+        owners[id(obj)].append(key)
+
+    duplicates = []
+    queue = deque([(value, location)])
+    while queue and owners:
+        obj, loc = queue.popleft()
+        if isinstance(obj, dict):
+            section = loc.split('/')[1] if loc else None
+            for key in owners.pop(id(obj), ()):
+                duplicates.append(DuplicateKey(section, key, loc))
+            queue.extend((v, f"{loc}/{pointer_token(k)}") for k, v in obj.items())
+        elif isinstance(obj, list):
+            queue.extend((v, f"{loc}/{i}") for i, v in enumerate(obj))
+
+    return duplicates
+
+
+def buffer_to_str(buf):
+    """
+    Decodes the bytes-like object `buf` to a str without an intermediate
+    copy of its contents, as would result from `bytes(buf)`.
+    """
+    try:
+        encoding = json.detect_encoding(bytes(memoryview(buf)[:4]))
+        return str(buf, encoding, "surrogatepass")
+    except (UnicodeDecodeError, TypeError) as err:
+        raise PywrParserException(f"Invalid JSON document: {str(err)}") from None
 
 
 class PywrJSONParser():
@@ -41,15 +130,19 @@ class PywrJSONParser():
         """
         self.errors = defaultdict(list)
         self.warnings = defaultdict(list)
+        self.duplicate_keys = []
+        self._pending_duplicates = []
+        self._member_duplicates = Counter()
 
-        if ruleset:
-            self.set_parser_ruleset(ruleset)
+        self.set_parser_ruleset(ruleset)
+
+        self.src = self.decode(json_src)
+        self._reset_components()
 
-        try:
-            self.src = json.loads(json_src, object_pairs_hook=self.__class__.enforce_unique)
-        except json.decoder.JSONDecodeError as err:
-            raise PywrParserException(f"Invalid JSON document: {str(err)}")
 
+    def _reset_components(self):
+        self.metadata = None
+        self.timestepper = None
         self.nodes = {}
         self.edges = []
         self.parameters = {}
@@ -57,60 +150,139 @@ class PywrJSONParser():
         self.scenarios = []
         self.scenario_combinations = []
         self.tables = {}
+        self.sections = set(SECTIONS)
+        self.truncated = False
+        self.lazy = False
+        self.rule_profile = None
+        self._max_errors = None
+        self._executor = None
 
 
-    @staticmethod
-    def enforce_unique(ordered_pairs):
-        d = {}
-        sep = ':'
-        idx = 1
-        for k, v in ordered_pairs:
-            if k in d:
-                key = DUP_KEY_FLAG.format(idx=idx) + sep + k
-                d[key] = v
-                idx += 1
-            else:
-                d[k] = v
+    def decode(self, json_src):
+        """
+        Returns the decoded form of the `json_src` document.
+
+        Args:
+            json_src (str | bytes | bytearray | memoryview | mmap): The JSON
+                document. Binary input is decoded directly from its buffer
+                in the encoding detected by :func:`json.detect_encoding`.
+
+        Raises:
+            PywrParserException: If `json_src` is not a valid JSON document
+        """
+        if not isinstance(json_src, str):
+            json_src = buffer_to_str(json_src)
+        try:
+            src = json.loads(json_src, object_pairs_hook=self.enforce_unique)
+        except json.decoder.JSONDecodeError as err:
+            raise PywrParserException(f"Invalid JSON document: {str(err)}")
+        self.record_duplicates(src, "")
+
+        return src
+
+
+    def enforce_unique(self, ordered_pairs):
+        """
+        An `object_pairs_hook` which notes any keys repeated in `ordered_pairs`
+        for :meth:`record_duplicates`. As with Pywr, the last value of a repeated
+        key takes precedence.
+        """
+        d = dict(ordered_pairs)
+        if len(d) < len(ordered_pairs):
+            seen = set()
+            for k, _ in ordered_pairs:
+                if k in seen:
+                    self._pending_duplicates.append((d, k))
+                seen.add(k)
         return d
 
+
+    def record_duplicates(self, value, location):
+        """
+        Adds any repeated keys noted while decoding `value` to the
+        :attr:`duplicate_keys` side table.
+
+        Args:
+            value: A decoded value
+            location (str): A JSON pointer to `value` in the document
+        """
+        if not self._pending_duplicates:
+            return
+
+        for duplicate in locate_duplicates(self._pending_duplicates, value, location):
+            self.add_duplicate_key(duplicate)
+        self._pending_duplicates.clear()
+
+
+    def add_duplicate_key(self, duplicate):
+        self.duplicate_keys.append(duplicate)
+        if duplicate.section in UNIQUE_SECTIONS and duplicate.location == f"/{duplicate.section}":
+            self._member_duplicates[(duplicate.section, duplicate.name)] += 1
+
+
+    def _check_duplicate_member(self, section, name, component):
+        count = self._member_duplicates.pop((section, name), 0)
+        for _ in range(count):
+            self.errors["network"].append(PywrNetworkValidationError(f"Duplicate {component} name <{name}>"))
+
+
     def set_parser_ruleset(self, ruleset):
         """
-        Applies the specified `ruleset` to the parser.
+        Applies the specified `ruleset` to the parser. The ruleset applies
+        only to this parser, such that parsers applying different rulesets
+        may be used concurrently.
 
         Args:
-            ruleset (str): The key of a ruleset whose rules are to be applied
+            ruleset (str): The key of a ruleset whose rules are to be applied,
+                or None to apply only the default rules
+
+        Raises:
+            PywrParserException: If there is no ruleset with the key `ruleset`
+        """
+        self.typemap = rules.get_typemap(ruleset)
+        self.ruleset = ruleset
+
+
+    def for_ruleset(self, ruleset):
         """
-        rulesets = rules.get_rulesets()
-        if ruleset not in rulesets:
-            raise PywrParserException(f"No ruleset with key: {ruleset}")
-
-        import importlib
-        import pywrparser.types
-        rules.set_active_ruleset(ruleset)
-        importlib.reload(pywrparser.types)
-        from pywrparser.types import (
-            PywrTimestepper,
-            PywrMetadata,
-            PywrScenario,
-            PywrTable,
-            PywrNode,
-            PywrEdge,
-            PywrParameter,
-            PywrRecorder,
-        )
-        globals()["PywrTimestepper"] = PywrTimestepper
-        globals()["PywrMetadata"] = PywrMetadata
-        globals()["PywrScenario"] = PywrScenario
-        globals()["PywrTable"] = PywrTable
-        globals()["PywrNode"] = PywrNode
-        globals()["PywrEdge"] = PywrEdge
-        globals()["PywrParameter"] = PywrParameter
-        globals()["PywrRecorder"] = PywrRecorder
+        Returns a new, unparsed parser which applies the specified `ruleset`
+        to the document already decoded by this parser, such that several
+        rulesets may be evaluated against a document which is decoded once.
+        The parsers share the decoded document, which must not be modified,
+        other than the objects of the nodes section, of which each parser has
+        a copy such that the attributes of its nodes may be replaced.
+
+        Args:
+            ruleset (str): The key of a ruleset whose rules are to be applied,
+                or None to apply only the default rules
+
+        Raises:
+            PywrParserException: If there is no ruleset with the key `ruleset`,
+                or if this parser does not hold a decoded document
+        """
+        if self.src is None:
+            raise PywrParserException(f"{type(self).__name__} has no decoded document")
+
+        parser = copy.copy(self)
+        parser.set_parser_ruleset(ruleset)
+        if isinstance(self.src, dict) and isinstance(nodes := self.src.get("nodes"), list):
+            parser.src = {**self.src, "nodes": [dict(node) if isinstance(node, dict) else node for node in nodes]}
+        parser.errors = defaultdict(list)
+        parser.warnings = defaultdict(list)
+        parser.duplicate_keys = []
+        parser._pending_duplicates = []
+        parser._member_duplicates = Counter()
+        for duplicate in self.duplicate_keys:
+            parser.add_duplicate_key(duplicate)
+        parser._reset_components()
+
+        return parser
 
 
 
     def parse(self, raise_on_error=False, raise_on_warning=False,
-              ignore_warnings=False, allow_duplicate_edges=True):
+              ignore_warnings=False, allow_duplicate_edges=True, sections=None,
+              max_errors=None, lazy=False, memoize=False, profile=None, workers=None):
         """
         Parse the Pywr model definition that was passed to the parser on instantiation.
         Following this action, the :py:attr:`parser.errors` and :py:attr:`parser.warnings`
@@ -125,8 +297,39 @@ class PywrJSONParser():
                 in the `warnings` return value.
             allow_duplicate_edges (bool): Specifies whether duplicate edges are
                 considered as errors or are permitted in a valid networks.
+            sections (Iterable[str]): The names of those sections of the network
+                which are to be parsed. Other sections are neither built nor
+                validated. By default, all sections are parsed.
+            max_errors (int): If specified, parsing ends once this many errors have
+                been found. No further components are validated, and the
+                :py:attr:`parser.truncated` attribute is set.
+            lazy (bool): Specifies whether the tables, parameters, recorders and
+                nodes of the network are built and validated only when first
+                accessed, or by :meth:`validate_all`. These are then instances of
+                :class:`LazyComponentMap`.
+            memoize (bool | RuleMemo): Specifies whether the outcomes of rules
+                are reused for components whose data, other than their name, is
+                identical to that of a component already validated. A
+                :class:`pywrparser.utils.RuleMemo` may be given to share outcomes
+                between parses. Components built lazily are not memoized.
+            profile (RuleProfile): If provided, the number of calls to each
+                rule and warning, their failures and the time taken are recorded
+                in this :class:`pywrparser.utils.RuleProfile`, which is then the
+                :py:attr:`parser.rule_profile` attribute. Components built lazily
+                are not profiled.
+            workers (int): If greater than 1, the parameters, recorders and nodes
+                of large networks are validated in this many worker processes.
+                The results are identical to those of validation in a single
+                process. Components built lazily are validated by the parser.
+
+        Raises:
+            PywrParserException: If `sections` contains an unknown section name
         """
-        seen_nodes = set()
+        self._seen_nodes = set()
+        if sections is not None:
+            if unknown := set(sections) - set(SECTIONS):
+                raise PywrParserException(f"Unknown network sections: {', '.join(sorted(unknown))}")
+            self.sections = set(sections)
 
         """
         Only component varies between invocations, create partial
@@ -138,74 +341,39 @@ class PywrJSONParser():
                                   ignore_warnings=ignore_warnings,
                                   dest=self)
 
-        with component_exc_capture("metadata") as cc:
-            self.metadata = PywrMetadata(self.src["metadata"])
-            cc.capture_warnings(self.metadata)
-
-        with component_exc_capture("timestepper") as cc:
-            self.timestepper = PywrTimestepper(self.src["timestepper"])
-            cc.capture_warnings(self.timestepper)
-
-        for scenario in self.src.get("scenarios", []):
-            with component_exc_capture("scenarios") as cc:
-                scen = PywrScenario(scenario)
-                cc.capture_warnings(scen)
-                self.scenarios.append(scen)
-
-        for combination in self.src.get("scenario_combinations", []):
-            with component_exc_capture("scenario_combinations") as cc:
-                comb = PywrScenarioCombination(combination)
-                cc.capture_warnings(comb)
-                self.scenario_combinations.append(comb)
-
-        for table_name, table_data in self.src.get("tables", {}).items():
-            with component_exc_capture("tables") as cc:
-                t = PywrTable(table_name, table_data)
-                cc.capture_warnings(t)
-                self.tables[t.name] = t
-
-        for param_name, param_data in self.src.get("parameters", {}).items():
-            if m := re.search(DUP_KEY_RE, param_name):
-                span_end = m.span()[1]
-                raw_name = param_name[span_end+1:]
-                self.errors["network"].append(PywrNetworkValidationError(f"Duplicate parameter name <{raw_name}>"))
-            with component_exc_capture("parameters") as cc:
-                p = PywrParameter(param_name, param_data)
-                cc.capture_warnings(p)
-                self.parameters[p.name] = p
-
-        for rec_name, rec_data in self.src.get("recorders", {}).items():
-            if m := re.search(DUP_KEY_RE, rec_name):
-                span_end = m.span()[1]
-                raw_name = rec_name[span_end+1:]
-                self.errors["network"].append(PywrNetworkValidationError(f"Duplicate recorder name <{raw_name}>"))
-            with component_exc_capture("recorders") as cc:
-                r = PywrRecorder(rec_name, rec_data)
-                cc.capture_warnings(r)
-                self.recorders[r.name] = r
-
+        capture = component_exc_capture
+        if max_errors is not None:
+            def capture(component):
+                if self.error_count >= max_errors:
+                    raise ErrorLimitReached
+                return component_exc_capture(component)
+
+        self.lazy = lazy
+        self._max_errors = max_errors
+        memo = memoize if isinstance(memoize, RuleMemo) else RuleMemo() if memoize else None
+        self.rule_profile = profile
+        parsed_sections = set()
+        if workers is not None and workers > 1:
+            self._workers = workers
+            self._executor = ProcessPoolExecutor(max_workers=workers)
         try:
-            for node in self.src["nodes"]:
-                with component_exc_capture("nodes") as cc:
-                    n = PywrNode(node)
-                    cc.capture_warnings(n)
-
-                    if n.name in seen_nodes:
-                        self.errors["network"].append(PywrNetworkValidationError(f"Duplicate node name <{n.name}>"))
-                    else:
-                        self.nodes[n.name] = n
-                        seen_nodes.add(n.name)
-        except KeyError:
+            with rule_memo(memo), profile_rules(profile):
+                self._parse_sections(capture, component_exc_capture, parsed_sections)
+        except ErrorLimitReached:
+            self.truncated = True
+            self.errors["network"].append(PywrNetworkValidationError(
+                f"Parsing ended after {max_errors} error{'s' if max_errors != 1 else ''}:"
+                " remaining components were not validated"))
+            return
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+        if "nodes" in self.sections and "nodes" not in parsed_sections:
             self.errors["network"].append(PywrNetworkValidationError(f"Network contains no nodes"))
 
-
-        try:
-            for edge in self.src["edges"]:
-                with component_exc_capture("edges") as cc:
-                    e = PywrEdge(edge)
-                    cc.capture_warnings(e)
-                    self.edges.append(e)
-        except KeyError:
+        if "edges" in self.sections and "edges" not in parsed_sections:
             self.errors["network"].append(PywrNetworkValidationError(f"Network contains no edges"))
 
         if not allow_duplicate_edges and self.has_duplicate_edges:
@@ -213,6 +381,221 @@ class PywrJSONParser():
                 self.errors["network"].append(PywrNetworkValidationError(f"Duplicate edge <{edge}>"))
 
 
+    def _parse_sections(self, capture, unbounded_capture, parsed_sections):
+        for section, content in self.iter_sections():
+            if self.lazy and section in LAZY_SECTIONS:
+                # Components built on access are not subject to the error budget
+                self._defer_section(section, content, unbounded_capture)
+            else:
+                handler = getattr(self, f"_parse_{section}")
+                handler(content, capture)
+            parsed_sections.add(section)
+
+
+    def iter_sections(self):
+        """
+        Yields a `(section, content)` tuple for each selected section of the
+        network which is present in the decoded document. The members of
+        mapping and array sections are provided as an iterable of `(name, data)`
+        pairs and of elements respectively.
+        """
+        for section in SECTIONS:
+            if section not in self.src or section not in self.sections:
+                continue
+            content = self.src[section]
+            if section in MAPPING_SECTIONS:
+                content = content.items()
+            yield section, content
+
+
+    def _defer_section(self, section, content, capture):
+        """
+        Replaces the container of `section` with a :class:`LazyComponentMap`
+        of its undecoded members. Duplicate names are reported immediately.
+        """
+        members = {}
+        if section == "nodes":
+            component_type = self.typemap["PywrNode"]
+            for node in content:
+                name = node.get("name") if isinstance(node, dict) else None
+                if name in members:
+                    self.errors["network"].append(PywrNetworkValidationError(f"Duplicate node name <{name}>"))
+                else:
+                    members[name] = node
+        else:
+            component_type = self.typemap[{
+                "tables": "PywrTable",
+                "parameters": "PywrParameter",
+                "recorders": "PywrRecorder"
+            }[section]]
+            for name, data in content:
+                self._check_duplicate_member(section, name, section[:-1])
+                members[name] = data
+
+        build = partial(self._build_component, section, component_type, capture)
+        setattr(self, section, LazyComponentMap(section, members, build))
+
+
+    def _build_component(self, section, component_type, capture, name, data):
+        # Components may be first accessed within the contexts of other components
+        with immediate_validation(), capture(section) as cc:
+            component = component_type(data) if section == "nodes" else component_type(name, data)
+            cc.capture_warnings(component)
+            return component
+
+
+    def validate_all(self):
+        """
+        Builds and validates every component of a lazily parsed network
+        which has not yet been accessed.
+        """
+        for section in LAZY_SECTIONS:
+            members = getattr(self, section)
+            if isinstance(members, LazyComponentMap):
+                members.build_all()
+
+
+    def _build_section(self, section, members, build, capture):
+        """
+        Returns the components built from each of `members` by `build`
+        which pass validation. Batch rules are applied to the valid
+        components of the section in a single call each, after which
+        the outcome of each member is reported in turn: its errors if it
+        failed any rule, otherwise its warnings.
+        """
+        outcomes = []
+        # Members beyond that which follows those exhausting the error limit are not built
+        budget = None if self._max_errors is None else self._max_errors - self.error_count
+        failures = 0
+        exhausted = False
+        with batch_validation():
+            for member in members:
+                if budget is not None and failures > budget:
+                    exhausted = True
+                    break
+                try:
+                    outcomes.append(build(member))
+                except Exception as exc:
+                    outcomes.append(exc)
+                    if isinstance(exc, VALIDATION_ERRORS):
+                        failures += 1
+
+        built = [outcome for outcome in outcomes if not isinstance(outcome, Exception)]
+        bundles = {}
+        if built:
+            validator = getattr_static(built[0].__class__, "data")
+            bundles = validator.validate_batch(built)
+
+        valid = []
+        idx = 0
+        for outcome in outcomes:
+            with capture(section) as cc:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                bundle = bundles.get(idx)
+                idx += 1
+                if bundle and bundle.errors:
+                    raise bundle
+                # Includes the warnings of batch rules
+                cc.capture_warnings(outcome)
+                valid.append(outcome)
+
+        if exhausted:
+            # The limit was reached before this section, or within it with members remaining
+            raise ErrorLimitReached
+        return valid
+
+
+    def _validate_in_workers(self, section, members, component_type):
+        """
+        Validates `members` of `section` in the worker processes of the parser,
+        if these are in use and `members` are sufficiently numerous.
+
+        Returns:
+            members, component_type: The `members` and a replacement for
+                `component_type` which returns the outcome of each member
+                validated by a worker, in turn.
+        """
+        if self._executor is None or section not in PARALLEL_SECTIONS:
+            return members, component_type
+
+        members = list(members)
+        chunks = chunk_members(members, self._workers)
+        if len(chunks) < 2:
+            return members, component_type
+
+        keyed = section != "nodes"
+        memoize = active_memo.get() is not None
+        profile = self.rule_profile is not None
+        futures = [self._executor.submit(validate_members, component_type, chunk, keyed, memoize, profile)
+                   for chunk in chunks]
+        outcomes = []
+        for future in futures:
+            chunk_outcomes, chunk_profile = future.result()
+            outcomes.extend(chunk_outcomes)
+            if chunk_profile is not None:
+                self.rule_profile.merge(chunk_profile)
+
+        return members, ComponentOutcomes(component_type, outcomes)
+
+
+    def _build_member(self, section, component_type, member):
+        name, data = member
+        self._check_duplicate_member(section, name, section[:-1])
+        return component_type(name, data)
+
+
+    def _parse_metadata(self, data, capture):
+        with capture("metadata") as cc:
+            self.metadata = self.typemap["PywrMetadata"](data)
+            cc.capture_warnings(self.metadata)
+
+    def _parse_timestepper(self, data, capture):
+        with capture("timestepper") as cc:
+            self.timestepper = self.typemap["PywrTimestepper"](data)
+            cc.capture_warnings(self.timestepper)
+
+    def _parse_scenarios(self, scenarios, capture):
+        self.scenarios.extend(
+            self._build_section("scenarios", scenarios, self.typemap["PywrScenario"], capture))
+
+    def _parse_scenario_combinations(self, combinations, capture):
+        self.scenario_combinations.extend(
+            self._build_section("scenario_combinations", combinations,
+                                self.typemap["PywrScenarioCombination"], capture))
+
+    def _parse_tables(self, tables, capture):
+        build = partial(self._build_member, "tables", self.typemap["PywrTable"])
+        for t in self._build_section("tables", tables, build, capture):
+            self.tables[t.name] = t
+
+    def _parse_parameters(self, parameters, capture):
+        parameters, component_type = self._validate_in_workers(
+            "parameters", parameters, self.typemap["PywrParameter"])
+        build = partial(self._build_member, "parameters", component_type)
+        for p in self._build_section("parameters", parameters, build, capture):
+            self.parameters[p.name] = p
+
+    def _parse_recorders(self, recorders, capture):
+        recorders, component_type = self._validate_in_workers(
+            "recorders", recorders, self.typemap["PywrRecorder"])
+        build = partial(self._build_member, "recorders", component_type)
+        for r in self._build_section("recorders", recorders, build, capture):
+            self.recorders[r.name] = r
+
+    def _parse_nodes(self, nodes, capture):
+        nodes, component_type = self._validate_in_workers("nodes", nodes, self.typemap["PywrNode"])
+        for n in self._build_section("nodes", nodes, component_type, capture):
+            if n.name in self._seen_nodes:
+                self.errors["network"].append(PywrNetworkValidationError(f"Duplicate node name <{n.name}>"))
+            else:
+                self.nodes[n.name] = n
+                self._seen_nodes.add(n.name)
+
+    def _parse_edges(self, edges, capture):
+        self.edges.extend(self._build_section("edges", edges, self.typemap["PywrEdge"], capture))
+
+
     @property
     def has_errors(self):
         """
@@ -224,6 +607,15 @@ class PywrJSONParser():
         return len(self.errors) > 0
 
 
+    @property
+    def error_count(self):
+        """
+        Returns:
+            int: The total number of errors in the parsed input
+        """
+        return sum(len(errs) for errs in self.errors.values())
+
+
     @property
     def has_warnings(self):
         """
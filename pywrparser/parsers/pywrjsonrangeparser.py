@@ -0,0 +1,323 @@
+import json
+import mmap
+import os
+import tempfile
+
+from pywrparser.parsers.jsonstream import JSONStreamReader
+from pywrparser.parsers.parallel import (
+    PARALLEL_SECTIONS,
+    ComponentOutcomes,
+    chunk_members,
+    validate_members
+)
+from pywrparser.parsers.pywrjsonparser import (
+    MAPPING_SECTIONS,
+    SECTIONS,
+    DuplicateKey,
+    PywrJSONParser,
+    buffer_to_str,
+    locate_duplicates,
+    pointer_token
+)
+from pywrparser.types.exceptions import PywrParserException
+from pywrparser.utils import (
+    RulePlan,
+    active_memo
+)
+
+
+class MemberSpans(list):
+    """
+    The members of a section which are decoded by workers, as a list of
+    `(key, (start, end))` tuples in which `key` is the name of a member of
+    a mapping section or the index of an element of an array section, and
+    `start` and `end` are the byte offsets of its text in the document.
+    """
+    # The outcome of each member, where valid components are not retained
+    outcomes = None
+
+
+def decode_spans(source, section, spans):
+    """
+    Decodes the members of `section` at `spans` of the UTF-8 encoded
+    document `source`, which is either a buffer or the path of a file.
+
+    Returns:
+        members, duplicates (:class:`Tuple[List, List[DuplicateKey]]`): in
+            which `members` are `(name, data)` pairs for mapping sections and
+            the data of each element otherwise, and `duplicates` are the keys
+            repeated within the members.
+
+    Raises:
+        PywrParserException: If the text of a member is not valid JSON
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return decode_spans(buf, section, spans)
+
+    pending = []
+
+    def enforce_unique(ordered_pairs):
+        d = dict(ordered_pairs)
+        if len(d) < len(ordered_pairs):
+            seen = set()
+            for k, _ in ordered_pairs:
+                if k in seen:
+                    pending.append((d, k))
+                seen.add(k)
+        return d
+
+    decoder = json.JSONDecoder(object_pairs_hook=enforce_unique)
+    keyed = section in MAPPING_SECTIONS
+    members = []
+    duplicates = []
+    for key, (start, end) in spans:
+        text = str(source[start:end], "utf-8", "surrogatepass")
+        try:
+            value = decoder.decode(text)
+        except json.JSONDecodeError as err:
+            offset = start + len(text[:err.pos].encode("utf-8", "surrogatepass"))
+            raise PywrParserException(f"Invalid JSON document: {err.msg} (byte {offset})") from None
+        if pending:
+            location = f"/{section}/{pointer_token(key) if keyed else key}"
+            duplicates.extend(locate_duplicates(pending, value, location))
+            pending.clear()
+        members.append((key, value) if keyed else value)
+
+    return members, duplicates
+
+
+def validate_spans(component_type, source, section, spans, memoize=False, profile=False, components=False):
+    """
+    Decodes and validates the members of `section` at `spans` of `source`,
+    as by :func:`decode_spans` and :func:`validate_members`.
+
+    Returns:
+        outcomes, profile, duplicates: The outcomes and profile of
+            :func:`validate_members`, and the keys repeated within the members
+    """
+    members, duplicates = decode_spans(source, section, spans)
+    outcomes, profile = validate_members(component_type, members, section in MAPPING_SECTIONS,
+                                         memoize, profile, components)
+    return outcomes, profile, duplicates
+
+
+def utf8_spans(text, spans, base=0):
+    """
+    Returns the `(key, (start, end))` `spans` of character offsets in `text`,
+    in increasing order, as the byte offsets of the UTF-8 encoding of `text`
+    following `base` bytes of any byte order mark.
+    """
+    if len(text.encode("utf-8", "surrogatepass")) == len(text):
+        return [(key, (base+start, base+end)) for key, (start, end) in spans]
+
+    converted = []
+    pos, offset = 0, base
+    for key, (start, end) in spans:
+        offset += len(text[pos:start].encode("utf-8", "surrogatepass"))
+        length = len(text[start:end].encode("utf-8", "surrogatepass"))
+        converted.append((key, (offset, offset+length)))
+        pos, offset = end, offset + length
+
+    return converted
+
+
+class PywrJSONRangeParser(PywrJSONParser):
+    def __init__(self, json_src, ruleset=None, components=True, path=None):
+        """
+        Creates an instance of a parser in which the nodes, parameters and
+        recorders of the `json_src` document are decoded and validated by
+        worker processes.
+
+        On creation, the parser decodes the other sections of the document
+        and finds the extent of each member of these sections in its text
+        without decoding them. During parsing, each worker decodes only the
+        members assigned to it from a memory map of the document, and returns
+        the errors and warnings of each, so that the members are not sent
+        between processes. Workers map the file at `path` if this is provided,
+        else a temporary copy of the document written when first required.
+
+        Args:
+            json_src (str | bytes | bytearray | memoryview | mmap): A JSON
+                encoded representation of a Pywr network
+            ruleset (str): The key of a ruleset whose rules are to be applied
+            components (bool): Specifies whether the valid parameters and
+                recorders are returned by the workers. If ``False``, these
+                are validated but not retained by the parser. Nodes, and
+                components of classes which define batch rules, are always
+                returned.
+            path (str): The path of a file whose content is `json_src`. This is
+                not used unless `json_src` is a buffer of UTF-8 encoded text.
+        """
+        self.components = components
+        self._path = path
+        self._source = None
+        super().__init__(json_src, ruleset)
+
+
+    def decode(self, json_src):
+        """
+        Returns the decoded form of the `json_src` document in which the
+        members of the nodes, parameters and recorders sections are instead
+        :class:`MemberSpans`. The content of unrecognised top-level keys is
+        not validated.
+
+        Raises:
+            PywrParserException: If the structure of `json_src` is not valid JSON
+        """
+        if isinstance(json_src, str):
+            text, base = json_src, 0
+            self._data = json_src.encode("utf-8", "surrogatepass")
+            self._path = None
+        else:
+            text = buffer_to_str(json_src)
+            encoding = json.detect_encoding(bytes(memoryview(json_src)[:4]))
+            if encoding in ("utf-8", "utf-8-sig"):
+                base = 3 if encoding == "utf-8-sig" else 0
+                self._data = json_src
+            else:
+                base = 0
+                self._data = text.encode("utf-8", "surrogatepass")
+                self._path = None
+
+        reader = JSONStreamReader.from_str(text, object_pairs_hook=self.enforce_unique)
+        if not text.strip() or reader.peek() != '{':
+            return super().decode(json_src)
+
+        src = {}
+        for section in reader.iter_members():
+            if section in src:
+                self.add_duplicate_key(DuplicateKey(None, section, ""))
+            if section in PARALLEL_SECTIONS and reader.peek() == ('{' if section in MAPPING_SECTIONS else '['):
+                src[section] = self._find_spans(reader, section, text, base)
+            elif section in SECTIONS:
+                src[section] = reader.read_value()
+                self.record_duplicates(src[section], f"/{section}")
+            else:
+                reader.skip_value()
+        reader.expect_end()
+
+        return src
+
+
+    def _find_spans(self, reader, section, text, base):
+        if section not in MAPPING_SECTIONS:
+            return MemberSpans(utf8_spans(text, enumerate(reader.iter_value_spans()), base))
+
+        spans = [(name, (start, end)) for name, start, end in reader.iter_member_spans()]
+        members = {}
+        # As when decoded, the last of repeated members takes the place of the first
+        for name, span in utf8_spans(text, spans, base):
+            if name in members:
+                self.add_duplicate_key(DuplicateKey(section, name, f"/{section}"))
+            members[name] = span
+        return MemberSpans(members.items())
+
+
+    def iter_sections(self):
+        for section in SECTIONS:
+            if section not in self.src or section not in self.sections:
+                continue
+            content = self.src[section]
+            if section in MAPPING_SECTIONS and not isinstance(content, MemberSpans):
+                content = content.items()
+            yield section, content
+
+
+    def parse(self, raise_on_error=False, raise_on_warning=False,
+              ignore_warnings=False, allow_duplicate_edges=True, sections=None,
+              max_errors=None, lazy=False, memoize=False, profile=None, workers=None):
+        """
+        Parses the document as by :meth:`PywrJSONParser.parse`, with the
+        nodes, parameters and recorders decoded and validated by `workers`
+        worker processes. If `workers` is None or 1, these are decoded and
+        validated by the parser itself. Errors in the JSON text of these
+        members are raised as a :class:`PywrParserException`.
+
+        Raises:
+            PywrParserException: If `lazy` is ``True``, or if a member is not
+                valid JSON
+        """
+        if lazy:
+            raise PywrParserException(f"{type(self).__name__} does not support lazy parsing")
+
+        try:
+            super().parse(raise_on_error=raise_on_error,
+                          raise_on_warning=raise_on_warning,
+                          ignore_warnings=ignore_warnings,
+                          allow_duplicate_edges=allow_duplicate_edges,
+                          sections=sections,
+                          max_errors=max_errors,
+                          memoize=memoize,
+                          profile=profile,
+                          workers=workers)
+        finally:
+            if self._source is not None and self._source != self._path:
+                os.unlink(self._source)
+            self._source = None
+
+
+    def _shared_source(self):
+        """
+        Returns the path of the file which workers map to read the document,
+        first writing a temporary copy of the document if the parser has no
+        file of its content.
+        """
+        if self._source is None:
+            if self._path is not None:
+                self._source = self._path
+            else:
+                with tempfile.NamedTemporaryFile(prefix="pywrparser-", suffix=".json", delete=False) as fp:
+                    fp.write(self._data)
+                    self._source = fp.name
+        return self._source
+
+
+    def _validate_in_workers(self, section, members, component_type):
+        if not isinstance(members, MemberSpans):
+            return super()._validate_in_workers(section, members, component_type)
+
+        plan = RulePlan.for_class(component_type)
+        components = bool(self.components or section == "nodes" or plan.batch_rules or plan.batch_warnings)
+        memoize = active_memo.get() is not None
+        profile = self.rule_profile is not None
+        chunks = chunk_members(members, self._workers) if self._executor is not None else [members]
+        if len(chunks) < 2:
+            results = [validate_spans(component_type, self._data, section, members,
+                                      memoize, profile, components)]
+        else:
+            source = self._shared_source()
+            futures = [self._executor.submit(validate_spans, component_type, source, section, chunk,
+                                             memoize, profile, components)
+                       for chunk in chunks]
+            results = [future.result() for future in futures]
+
+        outcomes = []
+        for chunk_outcomes, chunk_profile, duplicates in results:
+            outcomes.extend(chunk_outcomes)
+            if chunk_profile is not None:
+                self.rule_profile.merge(chunk_profile)
+            for duplicate in duplicates:
+                self.add_duplicate_key(duplicate)
+
+        if not components:
+            # The decoded document may be shared with parsers for other rulesets
+            members = MemberSpans(members)
+            members.outcomes = outcomes
+            return members, component_type
+        return members, ComponentOutcomes(component_type, outcomes)
+
+
+    def _build_section(self, section, members, build, capture):
+        if getattr(members, "outcomes", None) is None:
+            return super()._build_section(section, members, build, capture)
+
+        # Valid components are not retained, and only their warnings applied
+        for (name, _), outcome in zip(members, members.outcomes):
+            with capture(section) as cc:
+                self._check_duplicate_member(section, name, section[:-1])
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                if outcome:
+                    cc.push_warnings(outcome)
+        return []
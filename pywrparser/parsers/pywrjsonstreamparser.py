@@ -0,0 +1,116 @@
+from pywrparser.parsers.jsonstream import (
+    DEFAULT_CHUNK_SIZE,
+    JSONStreamReader
+)
+from pywrparser.parsers.pywrjsonparser import (
+    ARRAY_SECTIONS,
+    DuplicateKey,
+    MAPPING_SECTIONS,
+    PywrJSONParser,
+    pointer_token
+)
+from pywrparser.types.exceptions import PywrParserException
+
+
+class PywrJSONStreamParser(PywrJSONParser):
+    def __init__(self, fp, ruleset=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Creates an instance of a parser which reads a Pywr network from the
+        file object `fp` incrementally during parsing.
+
+        Each node, edge, parameter, recorder and other component is decoded and
+        validated as soon as its JSON text is complete, after which the text is
+        discarded. The decoded document is never held in its entirety, such that
+        the memory required is that of the parsed network plus one component.
+
+        Args:
+            fp (file): A file object, in text or binary mode, containing a
+                JSON encoded representation of a Pywr network
+            ruleset (str): The key of a ruleset whose rules are to be applied
+            chunk_size (int): The size of each read from `fp`
+        """
+        self.reader = JSONStreamReader(fp,
+                        chunk_size=chunk_size,
+                        object_pairs_hook=self.enforce_unique)
+        super().__init__(None, ruleset)
+
+
+    def decode(self, json_src):
+        """
+        Decoding is deferred until :meth:`parse` is invoked.
+        """
+        return None
+
+
+    def iter_sections(self):
+        """
+        Yields a `(section, content)` tuple for each selected section of the
+        network in the order in which they occur in the document. The members
+        of mapping and array sections are decoded lazily as the content is
+        iterated. Sections which are not selected are skipped without being
+        decoded.
+
+        Raises:
+            PywrParserException: If the document is not valid JSON, or if a
+                selected section occurs more than once. As the earlier content
+                of the section has been parsed, the last cannot take precedence
+                as it does when the document is decoded in full.
+        """
+        seen_sections = set()
+        for section in self.reader.iter_members():
+            if section in seen_sections:
+                self.add_duplicate_key(DuplicateKey(None, section, ""))
+                if section in self.sections:
+                    raise PywrParserException(f"Network section '{section}' occurs more than once")
+            seen_sections.add(section)
+            if section not in self.sections:
+                # Unknown and unselected sections are skipped
+                self.reader.skip_value()
+                continue
+
+            if section in MAPPING_SECTIONS:
+                content = self._iter_mapping(section)
+            elif section in ARRAY_SECTIONS:
+                content = self._iter_array(section)
+            else:
+                content = self._read_value(f"/{section}")
+
+            yield section, content
+
+            if section in MAPPING_SECTIONS or section in ARRAY_SECTIONS:
+                # Consume any members which the handler did not
+                for _ in content:
+                    pass
+
+        self.reader.expect_end()
+
+
+    def _read_value(self, location):
+        value = self.reader.read_value()
+        self.record_duplicates(value, location)
+        return value
+
+
+    def _iter_mapping(self, section):
+        if self.reader.peek() != '{':
+            yield from self._read_value(f"/{section}").items()
+            return
+
+        seen = set()
+        for name in self.reader.iter_members():
+            data = self._read_value(f"/{section}/{pointer_token(name)}")
+            if name in seen:
+                self.add_duplicate_key(DuplicateKey(section, name, f"/{section}"))
+            else:
+                seen.add(name)
+            yield name, data
+
+
+    def _iter_array(self, section):
+        if self.reader.peek() != '[':
+            yield from self._read_value(f"/{section}")
+            return
+
+        for idx, value in enumerate(self.reader.iter_values()):
+            self.record_duplicates(value, f"/{section}/{idx}")
+            yield value
@@ -1,35 +1,123 @@
 import importlib
 import inspect
+import threading
 
 RULESET_BASE = "pywrparser.rulesets"
-ACTIVE_RULESET_KEY = None
 
+# Type maps by ruleset key, shared by all parsers
+_typemaps = {}
+_typemaps_lock = threading.Lock()
 
-def get_rulesets():
-    mods = get_ruleset_modules()
-    modules = {}
-    for mod in mods:
-        modules[mod[1].__key__] = {
-            "name": mod[1].__ruleset_name__,
-            "modpath": mod[0],
-            "version": mod[1].__version__,
-            "description": mod[1].__description__
+
+# The entry point group in which other packages may register rulesets
+ENTRY_POINT_GROUP = "pywrparser.rulesets"
+
+# Rulesets by key, discovered once per process
+_registry = None
+_registry_lock = threading.Lock()
+
+
+class RulesetEntry():
+    """
+    A ruleset known to the registry. The module of a ruleset registered
+    by an entry point is imported only when the ruleset is first used or
+    described.
+    """
+    def __init__(self, key, modpath, module=None, entry_point=None):
+        self.key = key
+        self.modpath = modpath
+        self._module = module
+        self._entry_point = entry_point
+
+    @property
+    def module(self):
+        if self._module is None:
+            self._module = self._entry_point.load()
+        return self._module
+
+    def describe(self):
+        module = self.module
+        return {
+            "name": module.__ruleset_name__,
+            "modpath": self.modpath,
+            "version": module.__version__,
+            "description": module.__description__
         }
 
-    return modules
+
+def get_registry():
+    """
+    Returns a mapping from the key of each available ruleset to its
+    :class:`RulesetEntry`. The rulesets of the :mod:`pywrparser.rulesets`
+    package are discovered, along with those registered by other packages
+    in the ``pywrparser.rulesets`` entry point group, when this is first
+    invoked. Built-in rulesets take precedence over others with the same key.
+    """
+    global _registry
+    if _registry is not None:
+        return _registry
+
+    with _registry_lock:
+        if _registry is None:
+            registry = {}
+            for entry_point in ruleset_entry_points():
+                registry[entry_point.name] = RulesetEntry(entry_point.name, entry_point.value,
+                                                          entry_point=entry_point)
+            for modpath, module in get_ruleset_modules():
+                registry[module.__key__] = RulesetEntry(module.__key__, modpath, module=module)
+            _registry = registry
+
+    return _registry
+
+
+def reset_registry():
+    """
+    Discards the registry and the type maps of its rulesets, such that
+    rulesets are discovered again when next required.
+    """
+    global _registry
+    with _registry_lock:
+        _registry = None
+    with _typemaps_lock:
+        _typemaps.clear()
+
+
+def ruleset_entry_points():
+    from importlib.metadata import entry_points
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=ENTRY_POINT_GROUP)
+    # Python < 3.10
+    return eps.get(ENTRY_POINT_GROUP, [])
+
+
+def get_rulesets():
+    """
+    Returns a description of each available ruleset by key. The modules
+    of all rulesets are imported.
+    """
+    return {key: entry.describe() for key, entry in get_registry().items()}
+
+
+def get_ruleset(key):
+    """
+    Returns:
+        Dict: The description of the ruleset with the specified `key`, or
+            None if there is no such ruleset
+    """
+    if entry := get_registry().get(key):
+        return entry.describe()
 
 
 def get_ruleset_modules(base=RULESET_BASE):
     importlib.invalidate_caches()
-    base = importlib.import_module(RULESET_BASE)
+    base = importlib.import_module(base)
     return inspect.getmembers(base, inspect.ismodule)
 
 
 def get_ruleset_module(key):
-    modules = (m for _, m in get_ruleset_modules())
-    for module in modules:
-        if module.__key__ == key:
-            return module
+    if entry := get_registry().get(key):
+        return entry.module
 
 
 def describe_rulesets():
@@ -47,7 +135,7 @@ def describe_rulesets():
 def identify_types(module):
     """
       Return a mapping from the default types to any
-      particular subclasses loaded by the active ruleset.
+      particular subclasses defined by the ruleset `module`.
       Types not specialised by the ruleset simply map to themselves.
     """
     from pywrparser.types.node import PywrNode
@@ -78,12 +166,38 @@ def identify_types(module):
     return typemap
 
 
-def set_active_ruleset(key):
-    global ACTIVE_RULESET_KEY
-    ACTIVE_RULESET_KEY = key
+def get_typemap(key=None):
+    """
+    Returns the mapping from each default type to that of the ruleset with
+    the specified `key`, as by :func:`identify_types`. Each ruleset's type
+    map is created once and shared thereafter, such that parsers applying
+    different rulesets may be used concurrently.
+
+    Args:
+        key (str): The key of a ruleset, or None for the default types
+
+    Raises:
+        PywrParserException: If there is no ruleset with the specified `key`
+    """
+    try:
+        return _typemaps[key]
+    except KeyError:
+        pass
+
+    with _typemaps_lock:
+        if key not in _typemaps:
+            module = None
+            if key is not None:
+                module = get_ruleset_module(key)
+                if module is None:
+                    from pywrparser.types.exceptions import PywrParserException
+                    raise PywrParserException(f"No ruleset with key: {key}")
+            _typemaps[key] = identify_types(module)
+
+    return _typemaps[key]
 
 
 class Ruleset():
-    def __init__(self):
-        module = get_ruleset_module(ACTIVE_RULESET_KEY)
-        self.typemap = identify_types(module)
+    def __init__(self, key=None):
+        self.key = key
+        self.typemap = get_typemap(key)
@@ -27,7 +27,7 @@ class MasterParameter(PywrParameter):
         assert ik_key in self.data and "kind" in self.data[ik_key], \
                 f"{self.data['type']} parameter must contain valid {ik_key} attribute"
 
-    @match("Dataframe", fuzzy=True)
-    def rule_nopandas_kwargs(self):
-        pk_key = "pandas_kwargs"
-        assert pk_key not in self.data, f"{pk_key} is deprecated in {self.data['type']} parameter"
+    rule_schema = {
+        "Dataframe": {"rule": "rule_nopandas_kwargs", "forbidden": ["pandas_kwargs"], "fuzzy": True,
+                      "message": "pandas_kwargs is deprecated in {type} parameter"}
+    }
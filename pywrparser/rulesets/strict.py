@@ -1,5 +1,6 @@
 from pywrparser.types.node import PywrNode
 from pywrparser.types.parameter import PywrParameter
+from pywrparser.utils import batch
 
 __key__ = "strict"
 __ruleset_name__ = "Strict Ruleset"
@@ -20,8 +21,9 @@ class StrictNode(PywrNode):
         if self.name:
             assert not self.name.lower().startswith(' '), "StrictNode name may not begin with space character"
 
-    def rule_node_name_min_len(self):
-        assert self.name and len(self.name) > 1, "Node name too short, at least four chars required"
+    @batch("Node name too short, at least four chars required")
+    def rule_node_name_min_len(cls, nodes):
+        return [idx for idx, name in enumerate(nodes.names) if not (name and len(name) > 1)]
 
 
 class StrictParameter(PywrParameter):
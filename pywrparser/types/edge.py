@@ -1,4 +1,5 @@
 from .base import PywrType
+from pywrparser.utils import fail
 
 
 class PywrEdge(PywrType):
@@ -25,8 +26,9 @@ class PywrEdge(PywrType):
     """ Validation rules """
 
     def rule_target_required(self):
-        assert len(self) > 1, "Edge has no target"
+        if len(self) < 2:
+            return fail("Edge has no target")
 
     def rule_source_and_target_distinct(self):
-        if len(self) > 1:
-            assert self.data[0] != self.data[1], "Edge source and target are the same"
+        if len(self) > 1 and self.data[0] == self.data[1]:
+            return fail("Edge source and target are the same")
@@ -1,3 +1,5 @@
+import copyreg
+
 from .warnings import PywrParserWarning
 
 
@@ -11,6 +13,11 @@ class PywrParserException(Exception):
     def __repr__(self):
         return f"{self.__class__.__qualname__}({self.message})"
 
+    def __reduce__(self):
+        # Subclass arguments are not passed to the base initialiser, so
+        # instances are restored from their attributes rather than `args`
+        return (copyreg.__newobj__, (self.__class__,), self.__dict__)
+
 
 class PywrTypeValidationError(PywrParserException):
     desc_text = "[FAILURE]"
@@ -19,7 +26,12 @@ class PywrTypeValidationError(PywrParserException):
         self.component = component
         self.rule = rule
         self.exc = exc
-        self.valuetext = valuetext
+        self._valuetext = valuetext
+
+    @property
+    def valuetext(self):
+        # May be rendered on first use from a :class:`pywrparser.utils.ValueText`
+        return str(self._valuetext)
 
     def __str__(self):
         return f"{self.desc_text} {self.component} '{self.rule}' -> {self.exc}:\n          {self.valuetext}"
@@ -0,0 +1,83 @@
+from collections.abc import MutableMapping
+
+from pywrparser.types.exceptions import PywrParserException
+
+
+class LazyComponentMap(MutableMapping):
+    """
+    A mapping from name to network component, in which each component is
+    built, and so validated, from its decoded data only when first accessed.
+
+    Errors and warnings resulting from validation are recorded by the `build`
+    callable. Accessing a component which failed validation raises a
+    :class:`PywrParserException`.
+    """
+    def __init__(self, section, members, build):
+        """
+        Args:
+            section (str): The network section containing the components
+            members (Dict[str, Dict]): A mapping from the name of each
+                component to its decoded data
+            build (Callable): Invoked as `build(name, data)` to return a
+                validated component, or None if validation fails
+        """
+        self.section = section
+        self._members = members
+        self._build = build
+        self._built = {}
+
+
+    def __getitem__(self, name):
+        try:
+            component = self._built[name]
+        except KeyError:
+            component = self._built[name] = self._build(name, self._members[name])
+
+        if component is None:
+            raise PywrParserException(f"Invalid {self.section} component <{name}>")
+
+        return component
+
+
+    def __setitem__(self, name, component):
+        self._members[name] = None
+        self._built[name] = component
+
+
+    def __delitem__(self, name):
+        del self._members[name]
+        self._built.pop(name, None)
+
+
+    def __iter__(self):
+        return iter(self._members)
+
+
+    def __len__(self):
+        return len(self._members)
+
+
+    def __contains__(self, name):
+        return name in self._members
+
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}({self.section}, {len(self._built)}/{len(self)} built)"
+
+
+    @property
+    def pending(self):
+        """
+        Returns:
+            int: The number of components which have not yet been built
+        """
+        return len(self._members) - len(self._built)
+
+
+    def build_all(self):
+        """
+        Builds every component which has not yet been accessed.
+        """
+        for name, data in self._members.items():
+            if name not in self._built:
+                self._built[name] = self._build(name, data)
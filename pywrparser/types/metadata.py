@@ -1,4 +1,5 @@
 from .base import PywrType
+from pywrparser.utils import fail
 
 
 class PywrMetadata(PywrType):
@@ -18,4 +19,5 @@ class PywrMetadata(PywrType):
     """ Validation rules """
 
     def rule_title_required(self):
-        assert isinstance(self.title, str), "Metadata does not define 'title' key"
+        if not isinstance(self.title, str):
+            return fail("Metadata does not define 'title' key")
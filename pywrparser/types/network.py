@@ -1,20 +1,33 @@
 import io
 import logging
+import mmap
+import os
 
 from collections import Counter, defaultdict
 from functools import partialmethod
 
-from pywrparser.parsers import PywrJSONParser
-
-from pywrparser.types import (
-    PywrParameter,
-    PywrRecorder
+from pywrparser import rules
+from pywrparser.parsers import (
+    PywrJSONParser,
+    PywrJSONRangeParser,
+    PywrJSONStreamParser
 )
+
+from pywrparser.types.parameter import PywrParameter
+from pywrparser.types.recorder import PywrRecorder
 from pywrparser.types.exceptions import PywrParserException
 
 from pywrparser.utils import (
+    DECOMPRESSION_ERRORS,
+    HashingReader,
+    InputDigest,
+    RuleMemo,
     canonical_name,
+    deferred_validation,
+    detect_compression,
+    open_input,
     parse_reference_key,
+    trusted_construction
 )
 
 log = logging.getLogger(__name__)
@@ -35,11 +48,20 @@ class PywrNetwork():
         self.edges = parser.edges
         self.parameters = parser.parameters
         self.recorders = parser.recorders
+        self.digest = None
+        # The key and types of the ruleset applied by the parser
+        self.ruleset = parser.ruleset
+        self.typemap = parser.typemap
+        # Retained to validate any components not yet built
+        self._lazy_parser = parser if parser.lazy else None
 
     @classmethod
     def from_file(cls, filename, raise_on_parser_error=False,
                   raise_on_parser_warning=False, ignore_warnings=False,
-                  allow_duplicate_edges=True, ruleset=None):
+                  allow_duplicate_edges=True, ruleset=None, stream=False,
+                  digest=None, cache=None, sections=None, max_errors=None,
+                  lazy=False, memoize=False, profile=None, workers=None,
+                  decode_in_workers=False):
         """
         Returns either the valid PywrNetwork contained in the file denoted
         by the `filename` argument, or corresponding errors encountered during
@@ -47,7 +69,8 @@ class PywrNetwork():
 
         Args:
             filename (str): The filename of a file containing a JSON definition
-                of a Pywr network.
+                of a Pywr network, or an open file object. Files compressed with
+                gzip, bzip2, xz or zip are decompressed as they are read.
             raise_on_parser_error (bool): Specifies whether parsing errors should
                 be raised immediately as exceptions or collected in the `errors` return
                 value.
@@ -58,6 +81,38 @@ class PywrNetwork():
                 considered as errors or are permitted in a valid networks.
             ruleset (str): The `key` of a valid ruleset. This ruleset will then be
                 applied during parsing.
+            sections (Iterable[str]): The names of the sections of the network,
+                e.g. "nodes" and "edges", which are to be parsed. Other sections
+                are omitted from the network and are not validated.
+            max_errors (int): If specified, parsing ends once this many errors have
+                been found, and a network error reports that validation is incomplete.
+            lazy (bool): If ``True``, the nodes, parameters, recorders and tables of
+                the network are built and validated only when first accessed. Errors
+                in these components are then reported by :meth:`validate_all`.
+            memoize (bool): If ``True``, the outcomes of rules are reused for
+                components whose data, other than their name, is identical to that
+                of a component already validated.
+            profile (:class:`pywrparser.utils.RuleProfile`): If provided, this is
+                updated with the number of calls to each rule and warning, their
+                failures and the time taken.
+            workers (int): If greater than 1, the parameters, recorders and nodes
+                of large networks are validated in this many worker processes.
+            decode_in_workers (bool): If ``True``, the file is parsed by a
+                :class:`pywrparser.parsers.PywrJSONRangeParser`, such that the
+                parameters, recorders and nodes validated by workers are also
+                decoded by them. Workers map an uncompressed file directly. This
+                is not used if `stream` is ``True``.
+            stream (bool): Specifies whether the file is read incrementally, with
+                each component validated as it is decoded, rather than read and
+                decoded in full before parsing.
+            digest (:class:`pywrparser.utils.InputDigest`): If provided, this is
+                updated with the content of the file as it is read, and its value
+                is then available as the `digest` attribute of the network.
+            cache (:class:`pywrparser.cache.ValidationCache`): If provided, results
+                previously cached for identical input are returned without parsing,
+                and new results are added to the cache. The cache is not used when
+                errors or warnings are to be raised, for lazy parsing, when profiling,
+                nor for file objects.
 
         Returns:
             network, errors, warnings (:class:`Tuple[PywrNetwork, Dict, Dict]`):
@@ -65,43 +120,164 @@ class PywrNetwork():
                 be present in either case.
 
         """
+        parse_args = {
+            "raise_on_parser_error": raise_on_parser_error,
+            "raise_on_parser_warning": raise_on_parser_warning,
+            "ignore_warnings": ignore_warnings,
+            "allow_duplicate_edges": allow_duplicate_edges,
+            "sections": sections,
+            "max_errors": max_errors,
+            "lazy": lazy,
+            "memoize": memoize,
+            "profile": profile,
+            "workers": workers
+        }
+        # The streaming parser does not decode unselected sections
+        stream = stream or (sections is not None and not decode_in_workers)
+        parser_cls = PywrJSONRangeParser if decode_in_workers else PywrJSONParser
+
+        cached = cache is not None and not hasattr(filename, "read") and not lazy and profile is None \
+            and not (raise_on_parser_error or raise_on_parser_warning)
+        if cached:
+            digest = digest or InputDigest()
+
+        if hasattr(filename, "read"):
+            if stream:
+                fp = HashingReader(filename, digest) if digest else filename
+                result = cls._from_parser(PywrJSONStreamParser, (fp, ruleset), **parse_args)
+                if digest:
+                    # Read any content not consumed by the parser, hashed by the reader
+                    while fp.read(64 * 1024):
+                        pass
+                return cls._with_digest(result, digest)
+            json_src = filename.read()
+            if digest:
+                digest.update(json_src)
+            return cls._with_digest(
+                cls._from_parser(parser_cls, (json_src, ruleset), **parse_args), digest)
+
         try:
-            if isinstance(filename, io.StringIO):
-                json_src = filename.read()
-            else:
-                with open(filename, 'r') as fp:
-                    json_src = fp.read()
-        except OSError as err:
-            err_txt = f"Unable to read input file: {err}"
-            log.error(err_txt)
-            exc = PywrParserException(err_txt)
-            if raise_on_parser_error:
-                raise exc from None
-            else:
-                return None, {"network": [exc]}, None
+            if stream and not cached:
+                with open_input(filename, digest=digest) as fp:
+                    result = cls._from_parser(PywrJSONStreamParser, (fp, ruleset), **parse_args)
+                    if digest:
+                        while fp.read(64 * 1024):
+                            pass
+                    return cls._with_digest(result, digest)
+            # The digest of cached input is found before parsing, from the same buffer
+            buf = cls._read_file(filename, digest)
+        except DECOMPRESSION_ERRORS as err:
+            return cls._read_error(err, raise_on_parser_error)
 
         try:
-            parser = PywrJSONParser(json_src, ruleset)
-        except PywrParserException as exc:
-            if raise_on_parser_error:
-                raise exc from None
+            if cached:
+                key = cache.key(digest.hexdigest(), ruleset,
+                                ignore_warnings=ignore_warnings,
+                                allow_duplicate_edges=allow_duplicate_edges,
+                                sections=sorted(sections) if sections is not None else None,
+                                max_errors=max_errors)
+                if (result := cache.get(key)) is not None:
+                    return cls._with_digest(result, digest)
+            if stream:
+                fp = buf if isinstance(buf, mmap.mmap) else io.BytesIO(buf)
+                result = cls._from_parser(PywrJSONStreamParser, (fp, ruleset), **parse_args)
+            elif decode_in_workers and isinstance(buf, mmap.mmap):
+                # Workers map the file itself rather than a copy of its content
+                result = cls._from_parser(PywrJSONRangeParser, (buf, ruleset, True, os.fspath(filename)),
+                                          **parse_args)
             else:
-                return None, {"network": [exc]}, None
+                result = cls._from_parser(parser_cls, (buf, ruleset), **parse_args)
+            if cached:
+                cache.put(key, result)
+            return cls._with_digest(result, digest)
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+    @staticmethod
+    def _read_file(filename, digest=None):
+        """
+        Returns the content of the file `filename`, decompressed if required,
+        as either a read-only memory map or bytes. The `digest`, if provided,
+        is updated with the content.
+        """
+        if detect_compression(filename):
+            with open_input(filename, digest=digest) as fp:
+                return fp.read()
 
-        parser.parse(raise_on_error=raise_on_parser_error,
-                     raise_on_warning=raise_on_parser_warning,
-                     ignore_warnings=ignore_warnings,
-                     allow_duplicate_edges=allow_duplicate_edges)
-        ret_warnings = parser.warnings if parser.has_warnings else None
-        if parser.has_errors:
-            return None, parser.errors, ret_warnings
+        with open(filename, 'rb') as fp:
+            try:
+                buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and non-regular files cannot be mapped
+                buf = fp.read()
+        if digest:
+            digest.update(buf)
+        return buf
 
-        return cls(parser), None, parser.warnings
+    @classmethod
+    def from_bytes(cls, json_src, raise_on_parser_error=False,
+                   raise_on_parser_warning=False, ignore_warnings=False,
+                   allow_duplicate_edges=True, ruleset=None, sections=None,
+                   max_errors=None, lazy=False, memoize=False, profile=None, workers=None):
+        """
+        Returns either the valid PywrNetwork represented by the JSON document
+        contained in the `json_src` buffer, or corresponding errors encountered
+        during parsing.
+
+        Args:
+            json_src (bytes | bytearray | memoryview): A buffer containing a JSON
+                encoded representation of a Pywr network, in UTF-8, UTF-16 or UTF-32.
+            raise_on_parser_error (bool): Specifies whether parsing errors should
+                be raised immediately as exceptions or collected in the `errors` return
+                value.
+            raise_on_parser_warning (bool): Specifies whether warnings encountered
+                during parsing should be raised immediately as exceptions or collected
+                in the `warnings` return value.
+            allow_duplicate_edges (bool): Specifies whether duplicate edges are
+                considered as errors or are permitted in a valid networks.
+            ruleset (str): The `key` of a valid ruleset. This ruleset will then be
+                applied during parsing.
+            sections (Iterable[str]): The names of the sections of the network,
+                e.g. "nodes" and "edges", which are to be parsed. Other sections
+                are omitted from the network and are not validated.
+            max_errors (int): If specified, parsing ends once this many errors have
+                been found, and a network error reports that validation is incomplete.
+            lazy (bool): If ``True``, the nodes, parameters, recorders and tables of
+                the network are built and validated only when first accessed. Errors
+                in these components are then reported by :meth:`validate_all`.
+            memoize (bool): If ``True``, the outcomes of rules are reused for
+                components whose data, other than their name, is identical to that
+                of a component already validated.
+            profile (:class:`pywrparser.utils.RuleProfile`): If provided, this is
+                updated with the number of calls to each rule and warning, their
+                failures and the time taken.
+            workers (int): If greater than 1, the parameters, recorders and nodes
+                of large networks are validated in this many worker processes.
+
+        Returns:
+            network, errors, warnings (:class:`Tuple[PywrNetwork, Dict, Dict]`):
+                in which either one of `network` or `errors` is not None. `warnings` may
+                be present in either case.
+
+        """
+        return cls._from_parser(PywrJSONParser, (json_src, ruleset),
+                                raise_on_parser_error=raise_on_parser_error,
+                                raise_on_parser_warning=raise_on_parser_warning,
+                                ignore_warnings=ignore_warnings,
+                                allow_duplicate_edges=allow_duplicate_edges,
+                                sections=sections,
+                                max_errors=max_errors,
+                                lazy=lazy,
+                                memoize=memoize,
+                                profile=profile,
+                                workers=workers)
 
     @classmethod
     def from_json(cls, json_src, raise_on_parser_error=False,
                   raise_on_parser_warning=False, ignore_warnings=False,
-                  allow_duplicate_edges=True, ruleset=None):
+                  allow_duplicate_edges=True, ruleset=None, cache=None, sections=None,
+                  max_errors=None, lazy=False, memoize=False, profile=None, workers=None):
         """
         Returns either the valid PywrNetwork represented by the JSON encoded string
         contained in the `json_src` argument, or corresponding errors encountered
@@ -120,6 +296,26 @@ class PywrNetwork():
                 considered as errors or are permitted in a valid networks.
             ruleset (str): The `key` of a valid ruleset. This ruleset will then be
                 applied during parsing.
+            sections (Iterable[str]): The names of the sections of the network,
+                e.g. "nodes" and "edges", which are to be parsed. Other sections
+                are omitted from the network and are not validated.
+            max_errors (int): If specified, parsing ends once this many errors have
+                been found, and a network error reports that validation is incomplete.
+            lazy (bool): If ``True``, the nodes, parameters, recorders and tables of
+                the network are built and validated only when first accessed. Errors
+                in these components are then reported by :meth:`validate_all`.
+            memoize (bool): If ``True``, the outcomes of rules are reused for
+                components whose data, other than their name, is identical to that
+                of a component already validated.
+            profile (:class:`pywrparser.utils.RuleProfile`): If provided, this is
+                updated with the number of calls to each rule and warning, their
+                failures and the time taken.
+            workers (int): If greater than 1, the parameters, recorders and nodes
+                of large networks are validated in this many worker processes.
+            cache (:class:`pywrparser.cache.ValidationCache`): If provided, results
+                previously cached for identical input are returned without parsing,
+                and new results are added to the cache. The cache is not used when
+                errors or warnings are to be raised, for lazy parsing, nor when profiling.
 
         Returns:
             network, errors, warnings (:class:`Tuple[PywrNetwork, Dict, Dict]`):
@@ -127,17 +323,215 @@ class PywrNetwork():
                 be present in either case.
 
         """
+        if cache is not None and not lazy and profile is None \
+                and not (raise_on_parser_error or raise_on_parser_warning):
+            digest = InputDigest()
+            digest.update(json_src)
+            key = cache.key(digest.hexdigest(), ruleset,
+                            ignore_warnings=ignore_warnings,
+                            allow_duplicate_edges=allow_duplicate_edges,
+                            sections=sorted(sections) if sections is not None else None,
+                            max_errors=max_errors)
+            if (result := cache.get(key)) is None:
+                result = cls.from_json(json_src, ruleset=ruleset,
+                                       ignore_warnings=ignore_warnings,
+                                       allow_duplicate_edges=allow_duplicate_edges,
+                                       sections=sections,
+                                       max_errors=max_errors,
+                                       memoize=memoize,
+                                       profile=profile,
+                                       workers=workers)
+                cache.put(key, result)
+            return result
+
         parser = PywrJSONParser(json_src, ruleset=ruleset)
         parser.parse(raise_on_error=raise_on_parser_error,
                      raise_on_warning=raise_on_parser_warning,
                      ignore_warnings=ignore_warnings,
-                     allow_duplicate_edges=allow_duplicate_edges)
+                     allow_duplicate_edges=allow_duplicate_edges,
+                     sections=sections,
+                     max_errors=max_errors,
+                     lazy=lazy,
+                     memoize=memoize,
+                     profile=profile,
+                     workers=workers)
         ret_warnings = parser.warnings if parser.has_warnings else None
         if parser.has_errors:
             return None, parser.errors, ret_warnings
 
         return cls(parser), None, parser.warnings
 
+    @classmethod
+    def from_file_rulesets(cls, filename, rulesets, raise_on_parser_error=False,
+                           raise_on_parser_warning=False, ignore_warnings=False,
+                           allow_duplicate_edges=True, digest=None, cache=None, sections=None,
+                           max_errors=None, memoize=False, profile=None, workers=None):
+        """
+        Validates the Pywr network contained in the file denoted by the
+        `filename` argument against each of several rulesets. The file is read
+        and decoded once, and the components of each ruleset are built from
+        the same decoded document, so that this is faster than a call of
+        :meth:`from_file` for each ruleset. Networks returned for different
+        rulesets share the data of their components other than nodes, which
+        should not be modified.
+
+        Args:
+            filename (str): The filename of a file containing a JSON definition
+                of a Pywr network, or an open file object.
+            rulesets (Iterable[str]): The keys of the rulesets to be applied,
+                where None denotes the default rules.
+            raise_on_parser_error (bool): Specifies whether parsing errors should
+                be raised immediately as exceptions or collected in the `errors` return
+                value.
+            raise_on_parser_warning (bool): Specifies whether warnings encountered
+                during parsing should be raised immediately as exceptions or collected
+                in the `warnings` return value.
+            allow_duplicate_edges (bool): Specifies whether duplicate edges are
+                considered as errors or are permitted in a valid networks.
+            digest (:class:`pywrparser.utils.InputDigest`): If provided, this is
+                updated with the content of the file as it is read, and its value
+                is then available as the `digest` attribute of each network.
+            cache (:class:`pywrparser.cache.ValidationCache`): If provided, the
+                results of each ruleset are cached as by :meth:`from_file`, and
+                the document is decoded only if those of some ruleset are not.
+            sections (Iterable[str]): The names of the sections of the network,
+                e.g. "nodes" and "edges", which are to be parsed.
+            max_errors (int): If specified, parsing for each ruleset ends once
+                this many errors have been found.
+            memoize (bool | RuleMemo): If ``True``, the outcomes of rules are
+                reused for components whose data, other than their name, is
+                identical to that of a component already validated, including
+                components of a type shared by several of the rulesets.
+            profile (:class:`pywrparser.utils.RuleProfile`): If provided, this is
+                updated with the calls, failures and time taken of the rules of
+                every ruleset.
+            workers (int): If greater than 1, the parameters, recorders and nodes
+                of large networks are validated in this many worker processes.
+
+        Returns:
+            Dict: A mapping from each key in `rulesets` to the `(network, errors,
+                warnings)` result of applying that ruleset, as by :meth:`from_file`.
+
+        Raises:
+            PywrParserException: If there is no ruleset with one of the keys
+                in `rulesets`
+        """
+        rulesets = list(dict.fromkeys(rulesets))
+        for ruleset in rulesets:
+            rules.get_typemap(ruleset)
+
+        parse_args = {
+            "raise_on_parser_error": raise_on_parser_error,
+            "raise_on_parser_warning": raise_on_parser_warning,
+            "ignore_warnings": ignore_warnings,
+            "allow_duplicate_edges": allow_duplicate_edges,
+            "sections": sections,
+            "max_errors": max_errors,
+            "memoize": memoize if isinstance(memoize, RuleMemo) else RuleMemo() if memoize else False,
+            "profile": profile,
+            "workers": workers
+        }
+
+        if cache is not None and (hasattr(filename, "read") or profile is not None
+                                  or raise_on_parser_error or raise_on_parser_warning):
+            cache = None
+        if cache is not None:
+            digest = digest or InputDigest()
+
+        try:
+            if hasattr(filename, "read"):
+                json_src = filename.read()
+                if digest:
+                    digest.update(json_src)
+            else:
+                with open_input(filename, digest=digest) as fp:
+                    json_src = fp.read()
+        except DECOMPRESSION_ERRORS as err:
+            result = cls._read_error(err, raise_on_parser_error)
+            return {ruleset: result for ruleset in rulesets}
+
+        results = {}
+        keys = {}
+        if cache is not None:
+            for ruleset in rulesets:
+                keys[ruleset] = cache.key(digest.hexdigest(), ruleset,
+                                          ignore_warnings=ignore_warnings,
+                                          allow_duplicate_edges=allow_duplicate_edges,
+                                          sections=sorted(sections) if sections is not None else None,
+                                          max_errors=max_errors)
+                if (result := cache.get(keys[ruleset])) is not None:
+                    results[ruleset] = result
+
+        if len(results) < len(rulesets):
+            try:
+                document = PywrJSONParser(json_src)
+            except PywrParserException as exc:
+                if raise_on_parser_error:
+                    raise exc from None
+                return {ruleset: (None, {"network": [exc]}, None) for ruleset in rulesets}
+
+            for ruleset in rulesets:
+                if ruleset not in results:
+                    results[ruleset] = cls._from_parser(document.for_ruleset, (ruleset,), **parse_args)
+                    if cache is not None:
+                        cache.put(keys[ruleset], results[ruleset])
+
+        return {ruleset: cls._with_digest(results[ruleset], digest) for ruleset in rulesets}
+
+    @classmethod
+    def _from_parser(cls, parser_cls, parser_args, raise_on_parser_error=False,
+                     raise_on_parser_warning=False, ignore_warnings=False,
+                     allow_duplicate_edges=True, sections=None, max_errors=None,
+                     lazy=False, memoize=False, profile=None, workers=None):
+        """
+        Creates a parser of type `parser_cls` from `parser_args` and parses
+        its input, returning results in the form of :meth:`from_file`.
+        Invalid JSON is reported as a network error whether encountered
+        when the parser is created or, for streaming parsers, during parsing.
+        """
+        try:
+            parser = parser_cls(*parser_args)
+            parser.parse(raise_on_error=raise_on_parser_error,
+                         raise_on_warning=raise_on_parser_warning,
+                         ignore_warnings=ignore_warnings,
+                         allow_duplicate_edges=allow_duplicate_edges,
+                         sections=sections,
+                         max_errors=max_errors,
+                         lazy=lazy,
+                         memoize=memoize,
+                         profile=profile,
+                         workers=workers)
+        except PywrParserException as exc:
+            if type(exc) is not PywrParserException:
+                # Component errors raised at the caller's request
+                raise
+            if raise_on_parser_error:
+                raise exc from None
+            return None, {"network": [exc]}, None
+
+        ret_warnings = parser.warnings if parser.has_warnings else None
+        if parser.has_errors:
+            return None, parser.errors, ret_warnings
+
+        return cls(parser), None, parser.warnings
+
+    @staticmethod
+    def _with_digest(result, digest):
+        network = result[0]
+        if network and digest:
+            network.digest = digest.hexdigest()
+        return result
+
+    @staticmethod
+    def _read_error(err, raise_on_parser_error):
+        err_txt = f"Unable to read input file: {err}"
+        log.error(err_txt)
+        exc = PywrParserException(err_txt)
+        if raise_on_parser_error:
+            raise exc from None
+        else:
+            return None, {"network": [exc]}, None
+
 
     def as_dict(self):
         """
@@ -145,12 +539,14 @@ class PywrNetwork():
             network (dict): A dict representation of the :class:`PywrNetwork`
                 instance.
         """
-        network = {
-            "metadata": self.metadata.as_dict(),
-            "timestepper": self.timestepper.as_dict(),
-            "nodes": [node.as_dict() for node in self.nodes.values()],
-            "edges": [edge.as_dict() for edge in self.edges]
-        }
+        network = {}
+        # Either may be absent where only a subset of sections was parsed
+        if self.metadata is not None:
+            network["metadata"] = self.metadata.as_dict()
+        if self.timestepper is not None:
+            network["timestepper"] = self.timestepper.as_dict()
+        network["nodes"] = [node.as_dict() for node in self.nodes.values()]
+        network["edges"] = [edge.as_dict() for edge in self.edges]
         if len(self.parameters) > 0:
             network["parameters"] = {n: p.as_dict() for n, p in self.parameters.items()}
 
@@ -179,6 +575,27 @@ class PywrNetwork():
         return json.dumps(self.as_dict(), indent=2)
 
 
+    def validate_all(self):
+        """
+        Builds and validates every component of a lazily parsed network
+        which has not yet been accessed.
+
+        Returns:
+            errors, warnings (:class:`Tuple[Dict, Dict]`): All errors and warnings
+                found in the network, each of which is None if there are none.
+                Both are None for networks which were not parsed lazily, as these
+                are validated in full when created.
+        """
+        parser = self._lazy_parser
+        if parser is None:
+            return None, None
+
+        parser.validate_all()
+        errors = parser.errors if parser.has_errors else None
+        warnings = parser.warnings if parser.has_warnings else None
+        return errors, warnings
+
+
     def validate(self):
         """
           Currently unused.
@@ -189,7 +606,7 @@ class PywrNetwork():
         pass
 
 
-    def promote_inline_parameters(self):
+    def promote_inline_parameters(self, trusted=False):
         """
           Promotes inline parameter definitions to instances of
           :class:`PywrParameter`.
@@ -197,8 +614,30 @@ class PywrNetwork():
           Any values of attrs in a node which can be interpreted as
           an inline (i.e. dict) parameter definition are instantiated
           as parameters and the attr value replaced with the instance.
+          The parameters are validated together once all are created.
+
+          Args:
+            trusted (bool): If ``True``, the parameters are not validated,
+              as where their definitions are known to be valid
+
+          Raises:
+            PywrTypeValidationErrorBundle: Containing the errors of all
+              invalid inline parameters, in which case no node is modified
+        """
+        with self._inline_validation(trusted) as deferred:
+            promoted = self._inline_parameters()
+        if deferred is not None:
+            deferred.check()
+        for node, attr, parameter in promoted:
+            node.data[attr] = parameter
+
+    def _inline_parameters(self):
+        """
+        Returns a `(node, attr, parameter)` tuple for each inline parameter
+        definition in the nodes of the network.
         """
         exclude = ("name", "type")
+        promoted = []
         for node in self.nodes.values():
             for attr, value in node.data.items():
                 if isinstance(value, dict):
@@ -212,10 +651,11 @@ class PywrNetwork():
                     if param_name in self.parameters:
                         # Node inline param has same name as global param
                         raise ValueError(f"Unable to set {attr} on node {node.name} - specified parameter as a global parameter. Parameter {param_name} is already defined as a parameter.")
-                    param = PywrParameter(param_name, value)
-                    node.data[attr] = param
+                    param = self.typemap["PywrParameter"](param_name, value)
+                    promoted.append((node, attr, param))
+        return promoted
 
-    def promote_inline_recorders(self):
+    def promote_inline_recorders(self, trusted=False):
         """
           Promotes inline recorder definitions to instances of
           :class:`PywrRecorder`.
@@ -223,8 +663,30 @@ class PywrNetwork():
           Any values of attrs in a node which can be interpreted as
           an inline (i.e. dict) recorder definition are instantiated
           as recorders and the attr value replaced with the instance.
+          The recorders are validated together once all are created.
+
+          Args:
+            trusted (bool): If ``True``, the recorders are not validated,
+              as where their definitions are known to be valid
+
+          Raises:
+            PywrTypeValidationErrorBundle: Containing the errors of all
+              invalid inline recorders, in which case no node is modified
+        """
+        with self._inline_validation(trusted) as deferred:
+            promoted = self._inline_recorders()
+        if deferred is not None:
+            deferred.check()
+        for node, attr, recorder in promoted:
+            node.data[attr] = recorder
+
+    def _inline_recorders(self):
+        """
+        Returns a `(node, attr, recorder)` tuple for each inline recorder
+        definition in the nodes of the network.
         """
         exclude = ("name", "type")
+        promoted = []
         for node in self.nodes.values():
             for attr, value in node.data.items():
                 if isinstance(value, dict):
@@ -238,8 +700,17 @@ class PywrNetwork():
                     if rec_name in self.recorders:
                         # Node inline recorder has same name as global recorder
                         raise ValueError("inline dups global recorder")
-                    recorder = PywrRecorder(rec_name, value)
-                    node.data[attr] = recorder
+                    recorder = self.typemap["PywrRecorder"](rec_name, value)
+                    promoted.append((node, attr, recorder))
+        return promoted
+
+    @staticmethod
+    def _inline_validation(trusted):
+        """
+        Returns a context in which inline components are either trusted
+        or have their validation deferred.
+        """
+        return trusted_construction() if trusted else deferred_validation()
 
     def attach_reference_parameters(self):
         """
@@ -435,7 +906,9 @@ class PywrNetwork():
     def verbose_report(self,):
         report = self.report()
 
-        rep_lines = {"Title": self.title}
+        rep_lines = {}
+        if self.title is not None:
+            rep_lines["Title"] = self.title
         if self.description:
             rep_lines["Description"] = self.description
         for component, count in report.items():
@@ -446,12 +919,12 @@ class PywrNetwork():
 
     @property
     def title(self):
-        return self.metadata.data["title"]
+        return self.metadata.data["title"] if self.metadata else None
 
 
     @property
     def description(self):
-        return self.metadata.data.get("description")
+        return self.metadata.data.get("description") if self.metadata else None
 
 
     @property
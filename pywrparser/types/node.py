@@ -1,7 +1,7 @@
 import copy
 
 from .base import PywrType
-from pywrparser.utils import match
+from pywrparser.utils import batch, fail, fatal
 
 
 class PywrNode(PywrType):
@@ -44,22 +44,25 @@ class PywrNode(PywrType):
 
     """ Validation rules """
 
+    @fatal
     def rule_node_has_name(self):
-        assert self.name is not None, "Missing node name"
+        if self.name is None:
+            return fail("Missing node name")
 
+    @fatal
     def rule_node_has_type(self):
-        assert "type" in self.data, "Node does not define type"
+        if "type" not in self.data:
+            return fail("Node does not define type")
 
-    def warn_node_name_min_len(self):
-        assert self.name and len(self.name) > 1, "Node name too short"
+    @batch("Node name too short")
+    def warn_node_name_min_len(cls, nodes):
+        return [idx for idx, name in enumerate(nodes.names) if not (name and len(name) > 1)]
 
     """ Type-specific rules """
 
-    @match("proportionalinput")
-    def warn_proportionalinput_has_proportion(self):
-        assert "proportion" in self.data, "<proportionalinput> node does not define 'proportion'"
-
-
-    @match("storage")
-    def warn_storage_has_max_volume(self):
-        assert "max_volume" in self.data, "<storage> node does not define 'max_volume'"
+    warn_schema = {
+        "proportionalinput": {"rule": "warn_proportionalinput_has_proportion", "required": ["proportion"],
+                              "message": "<proportionalinput> node does not define 'proportion'"},
+        "storage": {"rule": "warn_storage_has_max_volume", "required": ["max_volume"],
+                    "message": "<storage> node does not define 'max_volume'"}
+    }
@@ -1,5 +1,5 @@
 from .base import PywrType
-from pywrparser.utils import match
+from pywrparser.utils import fail, fatal, match
 
 
 class PywrParameter(PywrType):
@@ -20,34 +20,33 @@ class PywrParameter(PywrType):
 
     """ Validation rules """
 
+    @fatal
     def rule_type_required(self):
-        assert isinstance(self.type, str), f"Parameter <{self.name}> does not define type"
+        if not isinstance(self.type, str):
+            return fail(f"Parameter <{self.name}> does not define type")
 
 
     """ Type-specific rules """
 
-    @match("aggregatedparameter")
-    def rule_aggregated_has_agg_func(self):
-        assert "agg_func" in self.data, f"AggregatedParameter <{self.name}> does not define 'agg_func'"
-
-    @match("aggregatedparameter")
-    def rule_aggregated_has_parameters(self):
-        assert "parameters" in self.data, f"AggregatedParameter <{self.name}> does not define 'parameters'"
-
-    @match("aggregatedparameter")
-    def rule_aggregated_has_paramlist(self):
-        assert "parameters" in self.data and isinstance(self.data["parameters"], list),\
-            f"AggregatedParameter <{self.name}> has invalid parameters"
-
-    @match("controlcurveparameter")
-    def rule_cc_has_storage(self):
-        assert "storage_node" in self.data, f"ControlCurveParameter <{self.name}> does not define 'storage_node'"
+    rule_schema = {
+        "aggregatedparameter": [
+            {"rule": "rule_aggregated_has_agg_func", "required": ["agg_func"],
+             "message": "AggregatedParameter <{name}> does not define 'agg_func'"},
+            {"rule": "rule_aggregated_has_parameters", "required": ["parameters"],
+             "message": "AggregatedParameter <{name}> does not define 'parameters'"},
+            {"rule": "rule_aggregated_has_paramlist", "required": ["parameters"], "kinds": {"parameters": list},
+             "message": "AggregatedParameter <{name}> has invalid parameters"}
+        ],
+        "controlcurveparameter": {"rule": "rule_cc_has_storage", "required": ["storage_node"],
+                                  "message": "ControlCurveParameter <{name}> does not define 'storage_node'"}
+    }
+
+    warn_schema = {
+        "dataframe": {"rule": "warn_outdated_pandas", "forbidden": ["pandas_kwargs"], "fuzzy": True,
+                      "message": "Dataframe <{name}> uses outdated 'pandas_kwargs' key"}
+    }
 
     @match("monthlyprofileparameter")
     def warn_monthlyprofile_has_profile(self):
-        assert "values" in self.data and isinstance(self.data["values"], list) and len(self.data["values"]) == 12,\
-            f"MonthlyProfileParameter <{self.name}> has invalid profile values"
-
-    @match("dataframe", fuzzy=True)
-    def warn_outdated_pandas(self):
-        assert "pandas_kwargs" not in self.data, f"Dataframe <{self.name}> uses outdated 'pandas_kwargs' key"
+        if not ("values" in self.data and isinstance(self.data["values"], list) and len(self.data["values"]) == 12):
+            return fail(f"MonthlyProfileParameter <{self.name}> has invalid profile values")
@@ -1,4 +1,5 @@
 from .base import PywrType
+from pywrparser.utils import fail, fatal
 
 
 class PywrRecorder(PywrType):
@@ -19,5 +20,7 @@ class PywrRecorder(PywrType):
 
     """ Validation rules """
 
+    @fatal
     def rule_type_required(self):
-        assert isinstance(self.type, str), f"Recorder <{self.name}> does not define type"
+        if not isinstance(self.type, str):
+            return fail(f"Recorder <{self.name}> does not define type")
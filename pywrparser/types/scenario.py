@@ -1,4 +1,5 @@
 from .base import PywrType
+from pywrparser.utils import fail
 
 
 class PywrScenario(PywrType):
@@ -14,7 +15,8 @@ class PywrScenario(PywrType):
     """ Validation rules """
 
     def rule_name_required(self):
-        assert isinstance(self.name, str), "Scenario has invalid name"
+        if not isinstance(self.name, str):
+            return fail("Scenario has invalid name")
 
 
 
@@ -26,4 +28,5 @@ class PywrScenarioCombination(PywrType):
     """ Validation rules """
 
     def rule_name_required(self):
-        assert isinstance(self.data, list), "Scenario combination must be a list of scenario numbers"
+        if not isinstance(self.data, list):
+            return fail("Scenario combination must be a list of scenario numbers")
@@ -1,4 +1,5 @@
 from .base import PywrType
+from pywrparser.utils import fail
 
 
 class PywrTable(PywrType):
@@ -20,7 +21,10 @@ class PywrTable(PywrType):
     """ Validation rules """
 
     def rule_name_required(self):
-        assert isinstance(self.name, str), "Invalid table name"
+        if not isinstance(self.name, str):
+            return fail("Invalid table name")
 
-    def rule_url_required(self):
-        assert "url" in self.data, "Table <{self.name}> does not include url"
+    rule_schema = {
+        "*": {"rule": "rule_url_required", "required": ["url"],
+              "message": "Table <{name}> does not include url"}
+    }
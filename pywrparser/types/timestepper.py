@@ -6,11 +6,14 @@ class PywrTimestepper(PywrType):
         self.data = data
 
     """ Validation rules """
-    def rule_start_required(self):
-        assert "start" in self.data, "Timestepper does not define 'start' key"
-
-    def rule_end_required(self):
-        assert "end" in self.data, "Timestepper does not define 'end' key"
+    rule_schema = {
+        "*": [
+            {"rule": "rule_start_required", "required": ["start"],
+             "message": "Timestepper does not define 'start' key"},
+            {"rule": "rule_end_required", "required": ["end"],
+             "message": "Timestepper does not define 'end' key"}
+        ]
+    }
 
     def rule_start_before_end(self):
         pass
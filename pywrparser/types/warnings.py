@@ -1,3 +1,6 @@
+import copyreg
+
+
 class PywrParserWarning(Warning):
     def __init__(self, message):
         self.message = message
@@ -8,6 +11,11 @@ class PywrParserWarning(Warning):
     def __repr__(self):
         return f"{self.__class__.__qualname__}({self.message})"
 
+    def __reduce__(self):
+        # Subclass arguments are not passed to the base initialiser, so
+        # instances are restored from their attributes rather than `args`
+        return (copyreg.__newobj__, (self.__class__,), self.__dict__)
+
 
 class PywrTypeValidationWarning(PywrParserWarning):
 
@@ -17,7 +25,12 @@ class PywrTypeValidationWarning(PywrParserWarning):
         self.component = component
         self.warning = warning
         self.exc = exc
-        self.valuetext = valuetext
+        self._valuetext = valuetext
+
+    @property
+    def valuetext(self):
+        # May be rendered on first use from a :class:`pywrparser.utils.ValueText`
+        return str(self._valuetext)
 
     def __str__(self):
         return f"{self.desc_text} {self.component} '{self.warning}' -> {self.exc}:\n          {self.valuetext}"
@@ -1,12 +1,22 @@
 from __future__ import annotations
+import bz2
 import functools
+import gzip
 import inspect
 import json
+import lzma
 import re
+import time
+import zipfile
+import zlib
 
-from typing import Tuple
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Tuple
 
 from pywrparser.types.exceptions import (
+    PywrParserException,
     PywrTypeValidationError,
     PywrTypeValidationErrorBundle
 )
@@ -46,8 +56,12 @@ class raiseorpush():
         If a successfully created instance has warnings, either raise
         or push to the destination as appropriate
         """
-        if inst.has_warnings and not self.ignore_warnings:
-            for warning in inst.warnings:
+        if inst.has_warnings:
+            self.push_warnings(inst.warnings)
+
+    def push_warnings(self, warnings):
+        if not self.ignore_warnings:
+            for warning in warnings:
                 if self.raise_warning:
                     raise warning from None
                 else:
@@ -72,6 +86,686 @@ def parse_reference_key(key: str) -> Tuple[str, str]:
     return name.strip('_'), attr
 
 
+class RuleFailure():
+    """
+    The failure of a rule or warning, which may be returned by the method
+    implementing it rather than raising an :class:`AssertionError`. This
+    avoids the cost of raising an exception for each failure, and unlike
+    an assertion is not removed when Python is run with ``-O``.
+    """
+    __slots__ = ("message",)
+
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}({self.message})"
+
+
+def fail(message: str) -> RuleFailure:
+    """
+    Returns a :class:`RuleFailure` with the given `message`, e.g.::
+
+        def rule_has_type(self):
+            if "type" not in self.data:
+                return fail("Node does not define type")
+    """
+    return RuleFailure(message)
+
+
+# Results of a rule or warning method which indicate failure
+FAILURE_TYPES = (RuleFailure, AssertionError)
+
+
+def batch(message):
+    """
+    Decorator defines a rule or warning which is applied to every component
+    of a section in a single call, rather than to each instance in turn.
+
+    The decorated method is a classmethod which receives a :class:`ComponentBatch`
+    and returns the indices of those components which fail, or a dict mapping
+    the index of each failing component to a message. Failures are otherwise
+    reported with the `message` argument, e.g.::
+
+        @batch("Node name too short")
+        def warn_node_name_min_len(cls, components):
+            return [i for i, name in enumerate(components.names) if not (name and len(name) > 1)]
+
+    Batch rules are applied to those components which pass their other rules.
+    A component created outside of a parser is validated as a batch of one.
+    """
+    def batch_wrapper(func):
+        func.batch_message = message
+        return classmethod(func)
+    return batch_wrapper
+
+
+class ComponentBatch():
+    """
+    The components of a section which are validated together by batch rules,
+    with their attributes available as parallel sequences.
+    """
+    def __init__(self, components):
+        self.components = components
+
+    def __len__(self):
+        return len(self.components)
+
+    @functools.cached_property
+    def names(self):
+        return [getattr(c, "name", None) for c in self.components]
+
+    @functools.cached_property
+    def types(self):
+        return [getattr(c, "type", None) for c in self.components]
+
+    @functools.cached_property
+    def data(self):
+        return [c.data for c in self.components]
+
+    @functools.cached_property
+    def keys(self):
+        return [d.keys() if isinstance(d, dict) else frozenset() for d in self.data]
+
+    def column(self, key, default=None):
+        """
+        Returns:
+            List: The value of `key` in the data of each component, or `default`
+                where a component does not define `key`
+        """
+        return [d.get(key, default) if isinstance(d, dict) else default for d in self.data]
+
+    def array(self, key, default=float("nan"), dtype=float):
+        """
+        Returns:
+            numpy.ndarray: The value of `key` in the data of each component as
+                an array of `dtype`. Requires NumPy to be installed.
+        """
+        import numpy as np
+        return np.fromiter(self.column(key, default), dtype=dtype, count=len(self))
+
+
+def uses_name(func):
+    """
+    Decorator marks a rule or warning whose outcome depends upon the name
+    of the component, where this is not apparent from the rule's own code,
+    e.g. as the name is accessed by a helper. The outcomes of such rules are
+    not shared by components with identical data under :class:`RuleMemo`.
+    """
+    func.uses_name = True
+    return func
+
+
+def depends_on_name(func):
+    """
+    Returns ``True`` if `func` is marked with :func:`uses_name` or refers
+    to a `name` attribute or key in its own code.
+    """
+    if getattr(func, "uses_name", False):
+        return True
+    code = getattr(inspect.unwrap(getattr(func, "__func__", func)), "__code__", None)
+    if code is None:
+        return True
+    return "name" in code.co_names or "name" in code.co_consts
+
+
+# The default maximum number of component payloads in a RuleMemo
+DEFAULT_MEMO_SIZE = 16384
+
+
+class RuleMemo():
+    """
+    A bounded record of the outcomes of rules and warnings by component
+    class and the content of the component's data, other than its `name`
+    key. Rules applied to a component whose data is identical to that of a
+    component already validated reuse the earlier outcomes, excepting those
+    rules whose outcome depends upon the component's name. As each ruleset
+    specialises the component classes, a memo may be shared by rulesets.
+
+    The least recently used payloads are discarded once `max_size` are held.
+    """
+
+    def __init__(self, max_size=DEFAULT_MEMO_SIZE):
+        self.max_size = max_size
+        self.outcomes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def key(self, inst, value):
+        if isinstance(value, dict) and "name" in value:
+            value = {k: v for k, v in value.items() if k != "name"}
+        # Identical payloads decoded from JSON have identical representations
+        return (inst.__class__, repr(value))
+
+    def get(self, key):
+        try:
+            outcomes = self.outcomes[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.outcomes.move_to_end(key)
+        self.hits += 1
+        return outcomes
+
+    def put(self, key, outcomes):
+        self.outcomes[key] = outcomes
+        if len(self.outcomes) > self.max_size:
+            self.outcomes.popitem(last=False)
+
+    def clear(self):
+        self.outcomes.clear()
+
+
+# The RuleMemo, if any, used by validation in the current context
+active_memo = ContextVar("active_memo", default=None)
+
+
+@contextmanager
+def rule_memo(memo):
+    """
+    Within this context, rule outcomes are recorded in and reused from
+    the :class:`RuleMemo` `memo`.
+    """
+    token = active_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        active_memo.reset(token)
+
+
+class RuleStats():
+    """
+    The number of calls to a rule or warning, the number of these which
+    failed and the total and longest time taken by a call, in seconds.
+    Outcomes reused by a :class:`RuleMemo` are counted as `hits`.
+    """
+    __slots__ = ("calls", "hits", "failures", "total_time", "max_time")
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class RuleProfile():
+    """
+    Records a :class:`RuleStats` for each rule and warning applied during
+    validation, keyed by the qualified name of the component class and the
+    name of the rule.
+    """
+    def __init__(self):
+        self.stats = {}
+
+    def __len__(self):
+        return len(self.stats)
+
+    def record(self, component, rule, elapsed, failures, hit=False):
+        try:
+            stats = self.stats[(component, rule)]
+        except KeyError:
+            stats = self.stats[(component, rule)] = RuleStats()
+        if hit:
+            stats.hits += 1
+        else:
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+        stats.failures += failures
+
+    def merge(self, other):
+        """
+        Adds the statistics recorded by the :class:`RuleProfile` `other`,
+        e.g. in a worker process, to those of this profile.
+        """
+        for key, theirs in other.stats.items():
+            try:
+                stats = self.stats[key]
+            except KeyError:
+                stats = self.stats[key] = RuleStats()
+            stats.calls += theirs.calls
+            stats.hits += theirs.hits
+            stats.failures += theirs.failures
+            stats.total_time += theirs.total_time
+            stats.max_time = max(stats.max_time, theirs.max_time)
+
+    def as_dict(self):
+        """
+        Returns:
+            List[Dict]: The statistics of each rule, in descending order
+                of the total time taken
+        """
+        ranked = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+        return [{
+            "component": component,
+            "rule": rule,
+            "calls": stats.calls,
+            "hits": stats.hits,
+            "failures": stats.failures,
+            "total_time": stats.total_time,
+            "max_time": stats.max_time
+        } for (component, rule), stats in ranked]
+
+
+# The RuleProfile, if any, used by validation in the current context
+active_profile = ContextVar("active_profile", default=None)
+
+
+@contextmanager
+def profile_rules(profile):
+    """
+    Within this context, the calls to each rule are recorded in the
+    :class:`RuleProfile` `profile`.
+    """
+    token = active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        active_profile.reset(token)
+
+
+class DeferredValidation():
+    """
+    Components whose validation is deferred, such that all may be validated
+    together by :meth:`validate`, with the batch rules of each class applied
+    in a single call.
+    """
+    def __init__(self, components=None):
+        """
+        Args:
+            components (Iterable[PywrType]): Existing components which are to
+                be validated again, e.g. after their data has been modified
+        """
+        self.components = list(components) if components is not None else []
+
+    def __len__(self):
+        return len(self.components)
+
+    def validate(self):
+        """
+        Validates each pending component. The warnings of each component
+        are then its `warnings` attribute.
+
+        Returns:
+            List[Tuple[PywrType, PywrTypeValidationErrorBundle]]: Each
+                component which failed validation, with its errors
+        """
+        failures = []
+        valid = defaultdict(list)
+        with batch_validation():
+            for inst in self.components:
+                validator = inspect.getattr_static(inst.__class__, "data")
+                try:
+                    validator.validate(inst, inst.data)
+                except PywrTypeValidationErrorBundle as bundle:
+                    failures.append((inst, bundle))
+                else:
+                    valid[inst.__class__].append(inst)
+
+        for component_type, components in valid.items():
+            validator = inspect.getattr_static(component_type, "data")
+            for idx, bundle in validator.validate_batch(components).items():
+                if bundle.errors:
+                    failures.append((components[idx], bundle))
+
+        self.components = []
+        return failures
+
+    def check(self):
+        """
+        Validates each pending component.
+
+        Raises:
+            PywrTypeValidationErrorBundle: Containing the errors of every
+                component which failed validation
+        """
+        if failures := self.validate():
+            errors = [error for _, bundle in failures for error in bundle.errors]
+            raise PywrTypeValidationErrorBundle(f"{len(failures)} deferred rule failures", errors)
+
+
+# The DeferredValidation, if any, of components created in the current context
+active_deferral = ContextVar("active_deferral", default=None)
+# True while components are created from data known to be valid
+trusted = ContextVar("trusted", default=False)
+
+
+@contextmanager
+def deferred_validation():
+    """
+    Components created within this context are not validated when their
+    data is assigned, but are added to the :class:`DeferredValidation`
+    which is returned, e.g.::
+
+        with deferred_validation() as deferred:
+            params = [PywrParameter(name, data) for name, data in definitions]
+        deferred.check()
+    """
+    token = active_deferral.set(DeferredValidation())
+    try:
+        yield active_deferral.get()
+    finally:
+        active_deferral.reset(token)
+
+
+@contextmanager
+def trusted_construction():
+    """
+    Components created within this context are not validated, as their
+    data is known to have been validated already, e.g. when components
+    are rebuilt from the data of existing components.
+    """
+    token = trusted.set(True)
+    try:
+        yield
+    finally:
+        trusted.reset(token)
+
+
+# True while the components of a section are validated as a batch
+batching = ContextVar("batching", default=False)
+
+
+@contextmanager
+def batch_validation():
+    """
+    Within this context, batch rules are not applied to components as
+    they are created, but are left to :meth:`PywrTypeValidator.validate_batch`.
+    """
+    token = batching.set(True)
+    try:
+        yield
+    finally:
+        batching.reset(token)
+
+
+@contextmanager
+def immediate_validation():
+    """
+    Components created within this context are validated in full as their
+    data is assigned, whether or not the context is itself within that of
+    :func:`deferred_validation`, :func:`trusted_construction` or
+    :func:`batch_validation`, e.g. when components of a lazily parsed
+    network are built on first access.
+    """
+    tokens = (active_deferral.set(None), trusted.set(False), batching.set(False))
+    try:
+        yield
+    finally:
+        for var, token in zip((active_deferral, trusted, batching), tokens):
+            var.reset(token)
+
+
+class RulePlan():
+    """
+    The rule and warning methods of a component class, discovered once
+    and applied to each instance of that class.
+
+    Methods decorated with :func:`match` apply only to components of
+    certain types, as do the entries of the `rule_schema` and `warn_schema`
+    class attributes. The methods and schema entries applicable to each
+    distinct type are resolved when that type is first encountered.
+
+    Rules are applied in name order, except that each rule follows any
+    prerequisites declared with :func:`requires`, and :func:`fatal` rules
+    precede others where possible. Warnings are applied only to components
+    which pass every rule.
+    """
+    # Plans by class, which are shared by all parsers
+    plans = {}
+
+    def __init__(self, component_type):
+        self.rules = []
+        self.warnings = []
+        self.batch_rules = []
+        self.batch_warnings = []
+        self.fatal = set()
+        self.requires = {}
+        self._resolved = {}
+        self._memoizable = {}
+        self.rule_schema = merge_schemas(component_type, "rule_schema")
+        self.warn_schema = merge_schemas(component_type, "warn_schema")
+        schema_names = {rule for _, rule, _ in self.rule_schema + self.warn_schema}
+        # Rules whose outcome may differ between components with identical data.
+        # The messages of schema entries are formatted for each component.
+        self.name_dependent = set()
+        for name, member in inspect.getmembers(component_type):
+            if name.startswith("rule"):
+                dest = self.rules
+            elif name.startswith("warn"):
+                dest = self.warnings
+            else:
+                continue
+
+            if depends_on_name(member):
+                self.name_dependent.add(name)
+            if getattr(member, "fatal", False):
+                self.fatal.add(name)
+            if prerequisites := getattr(member, "requires", None):
+                self.requires[name] = frozenset(prerequisites)
+
+            if hasattr(member, "batch_message"):
+                dest = self.batch_rules if dest is self.rules else self.batch_warnings
+                dest.append((name, member))
+            elif inspect.isfunction(member):
+                dest.append((name, member))
+            elif inspect.ismethod(member):
+                # Classmethods are already bound
+                dest.append((name, lambda inst, method=member: method()))
+
+        known = {name for name, _ in self.rules + self.warnings} | schema_names
+        for name, prerequisites in self.requires.items():
+            if unknown := prerequisites - known:
+                raise PywrParserException(f"{component_type.__qualname__}.{name} requires"
+                                          f" unknown rules: {', '.join(sorted(unknown))}")
+
+
+    @classmethod
+    def for_class(cls, component_type):
+        try:
+            return cls.plans[component_type]
+        except KeyError:
+            plan = cls.plans[component_type] = cls(component_type)
+            return plan
+
+
+    @classmethod
+    def clear(cls):
+        cls.plans.clear()
+
+
+    def resolve(self, component_type):
+        """
+        Returns:
+            warnings, rules (Tuple[List, List]): The `(name, function)` pairs of
+                those warnings and rules which apply to a component whose `type`
+                is `component_type`
+        """
+        if not isinstance(component_type, str):
+            component_type = None
+        try:
+            return self._resolved[component_type]
+        except KeyError:
+            pass
+
+        resolved = self._resolved[component_type] = (
+            self._ordered(self._applicable(self.warnings, component_type, self.warn_schema)),
+            self._ordered(self._applicable(self.rules, component_type, self.rule_schema))
+        )
+        return resolved
+
+
+    def memoizable(self, component_type):
+        """
+        Returns:
+            bool: ``True`` if the outcome of any rule or warning which applies
+                to a component whose `type` is `component_type` may be shared
+                by components with identical data under :class:`RuleMemo`
+        """
+        if not isinstance(component_type, str):
+            component_type = None
+        try:
+            return self._memoizable[component_type]
+        except KeyError:
+            pass
+
+        warnings, rules = self.resolve(component_type)
+        memoizable = self._memoizable[component_type] = \
+            any(name not in self.name_dependent for name, _ in warnings + rules)
+        return memoizable
+
+
+    def _ordered(self, applicable):
+        """
+        Orders the `applicable` rules such that each follows its applicable
+        prerequisites, and fatal rules precede others where possible.
+
+        Raises:
+            PywrParserException: If the prerequisites of rules are circular
+        """
+        if not (self.fatal or self.requires):
+            return applicable
+
+        names = {name for name, _ in applicable}
+        pending = sorted(applicable, key=lambda rule: (rule[0] not in self.fatal, rule[0]))
+        ordered = []
+        placed = set()
+        while pending:
+            for idx, (name, _) in enumerate(pending):
+                if all(req in placed or req not in names for req in self.requires.get(name, ())):
+                    ordered.append(pending.pop(idx))
+                    placed.add(name)
+                    break
+            else:
+                raise PywrParserException(f"Circular rule prerequisites: {', '.join(name for name, _ in pending)}")
+
+        return ordered
+
+
+    @staticmethod
+    def _applicable(funcs, component_type, schema):
+        applicable = []
+        for name, func in funcs:
+            typename = getattr(func, "match_typename", None)
+            if typename is None:
+                applicable.append((name, func))
+            elif component_type and type_matches(typename, func.match_fuzzy, component_type):
+                # The type is known to match, so the wrapper is bypassed
+                applicable.append((name, func.__wrapped__))
+
+        checks = {}
+        for typename, name, entry in schema:
+            if typename == SCHEMA_ANY_TYPE or \
+                    component_type and type_matches(typename, entry.get("fuzzy", False), component_type):
+                checks.setdefault(name, SchemaCheck()).add(entry)
+        if checks:
+            applicable.extend((name, check) for name, check in checks.items() if check)
+            applicable.sort(key=lambda rule: rule[0])
+
+        return applicable
+
+
+# The schema entry which applies to every component of a class
+SCHEMA_ANY_TYPE = "*"
+
+
+def merge_schemas(component_type, attr):
+    """
+    Returns the entries of the schemas held in the `attr` attribute of
+    `component_type` and each of its base classes, as `(typename, name, entry)`
+    tuples in which `name` is that under which failures of the entry are
+    reported: its `rule` if given, else `attr`.
+    """
+    merged = []
+    for base in reversed(component_type.__mro__):
+        for typename, entries in vars(base).get(attr, {}).items():
+            if isinstance(entries, dict):
+                entries = [entries]
+            for entry in entries:
+                merged.append((typename, entry.get("rule", attr), entry))
+
+    return merged
+
+
+class SchemaCheck():
+    """
+    Compares the keys of a component's data with the combined `required`
+    keys, `forbidden` keys and value `kinds` of the schema entries for its
+    type, returning a single :class:`RuleFailure`. This has the `message` of
+    the entries if given, formatted with the `name` and `type` of the
+    component, and otherwise describes every discrepancy.
+
+    The discrepancies depend only upon the data of the component, so are
+    shared by components with identical data under :class:`RuleMemo`, and
+    only the message is formatted for each component.
+    """
+    def __init__(self):
+        self.required = frozenset()
+        self.forbidden = frozenset()
+        self.kinds = {}
+        self.message = None
+
+    def __bool__(self):
+        return bool(self.required or self.forbidden or self.kinds)
+
+    def add(self, entry):
+        self.required |= frozenset(entry.get("required", ()))
+        self.forbidden |= frozenset(entry.get("forbidden", ()))
+        self.kinds.update(entry.get("kinds", {}))
+        self.message = entry.get("message", self.message)
+
+    def __call__(self, inst):
+        return self.failure(inst, self.discrepancies(inst.data))
+
+    def discrepancies(self, data):
+        """
+        Returns a tuple describing each discrepancy between `data` and the
+        entries, or None if there are none.
+        """
+        if not isinstance(data, dict):
+            return None
+
+        keys = data.keys()
+        failures = []
+        if missing := self.required - keys:
+            failures.append(f"does not define {quoted_keys(missing)}")
+        if present := self.forbidden & keys:
+            failures.append(f"must not define {quoted_keys(present)}")
+        for key, kind in self.kinds.items():
+            if key in data and not isinstance(data[key], kind):
+                failures.append(f"has invalid '{key}' of type {type(data[key]).__name__}")
+
+        return tuple(failures) or None
+
+    def failure(self, inst, failures):
+        """
+        Returns the :class:`RuleFailure` of `inst` for the discrepancies
+        `failures`, or None if there are none.
+        """
+        if not failures:
+            return None
+
+        component_type = getattr(inst, "type", None)
+        name = getattr(inst, "name", None)
+        if self.message:
+            return fail(self.message.format(name=name, type=component_type))
+        subject = component_type if isinstance(component_type, str) else inst.__class__.__qualname__
+        if name:
+            subject += f" <{name}>"
+        return fail(f"{subject} {', and '.join(failures)}")
+
+
+def quoted_keys(keys):
+    return ", ".join(f"'{key}'" for key in sorted(keys, key=str))
+
+
 class PywrTypeValidator():
 
     def __init__(self, max_value_len=200, store_passed_rules=False):
@@ -89,31 +783,56 @@ class PywrTypeValidator():
 
     def __set__(self, inst: PywrType, value: dict):
         setattr(inst, self.instattr, value)
-        self.validate(inst, value)
+        if trusted.get():
+            inst.warnings = []
+        elif (deferred := active_deferral.get()) is not None:
+            inst.warnings = []
+            deferred.components.append(inst)
+        else:
+            self.validate(inst, value)
 
 
     def validate(self, inst: PywrType, value: dict):
-        ifuncs = inspect.getmembers(inst, inspect.ismethod)
-        irules = {n: f for n, f in ifuncs if n.startswith("rule")}
-        iwarns = {n: f for n, f in ifuncs if n.startswith("warn")}
+        plan = RulePlan.for_class(inst.__class__)
+        warnings, rules = plan.resolve(getattr(inst, "type", None))
 
         rules_passed = []
         exc_bundle = []
         warn_bundle = []
 
-        for w, f in iwarns.items():
-            try:
-                f()
-            except AssertionError as e:
-                value_text = self.trim_value(value)
-                warn_bundle.append(PywrTypeValidationWarning(inst.__class__.__qualname__, w, e, value_text))
+        memo = active_memo.get()
+        outcomes = None
+        # The payload is not compared where no outcome could be reused
+        if memo is not None and plan.memoizable(getattr(inst, "type", None)):
+            key = memo.key(inst, value)
+            if (outcomes := memo.get(key)) is None:
+                outcomes = {}
+                memo.put(key, outcomes)
+        profile = active_profile.get()
+        instrumented = outcomes is not None or profile is not None
 
-        for r, f in irules.items():
-            try:
-                rules_passed.append(f"[PASSED] {r} -> {f()}")
-            except AssertionError as e:
-                value_text = self.trim_value(value)
-                exc_bundle.append(PywrTypeValidationError(inst.__class__.__qualname__, r, e, value_text))
+        value_text = None
+        # Rules which failed, or were skipped as their prerequisites failed
+        unmet = set()
+        for r, f in rules:
+            if unmet and not unmet.isdisjoint(plan.requires.get(r, ())):
+                unmet.add(r)
+                continue
+            if not instrumented:
+                try:
+                    result = f(inst)
+                except AssertionError as e:
+                    result = e
+            else:
+                result = self.apply_rule(inst, r, f, outcomes, plan, profile)
+            if isinstance(result, FAILURE_TYPES):
+                value_text = value_text or self.trim_value(value)
+                exc_bundle.append(PywrTypeValidationError(inst.__class__.__qualname__, r, result, value_text))
+                if r in plan.fatal:
+                    break
+                unmet.add(r)
+            else:
+                rules_passed.append(f"[PASSED] {r} -> {result}")
 
         if self.store_passed_rules:
             inst.rules_passed = rules_passed
@@ -122,17 +841,259 @@ class PywrTypeValidator():
             pveb = PywrTypeValidationErrorBundle(f"{inst.__class__.__qualname__} rule failures", exc_bundle)
             raise pveb
 
+        for w, f in warnings:
+            if unmet and not unmet.isdisjoint(plan.requires.get(w, ())):
+                unmet.add(w)
+                continue
+            if not instrumented:
+                try:
+                    result = f(inst)
+                except AssertionError as e:
+                    result = e
+            else:
+                result = self.apply_rule(inst, w, f, outcomes, plan, profile)
+            if isinstance(result, FAILURE_TYPES):
+                value_text = value_text or self.trim_value(value)
+                warn_bundle.append(PywrTypeValidationWarning(inst.__class__.__qualname__, w, result, value_text))
+                if w in plan.fatal:
+                    break
+                unmet.add(w)
+
         inst.warnings = warn_bundle
 
+        if (plan.batch_rules or plan.batch_warnings) and not batching.get():
+            bundle = self.validate_batch([inst]).get(0)
+            if bundle and bundle.errors:
+                raise bundle
+
+
+    @staticmethod
+    def apply_rule(inst, name, func, outcomes, plan, profile):
+        """
+        Returns the result of the rule or warning `func` for `inst`, which
+        is taken from or added to any memoized `outcomes`. The call is
+        recorded in the `profile` if this is not None.
+
+        The discrepancies found by a :class:`SchemaCheck` are memoized in
+        place of its result, from which the message of each component is
+        then formatted.
+        """
+        schema = isinstance(func, SchemaCheck)
+        if outcomes is not None and name in outcomes:
+            result = outcomes[name]
+            if schema:
+                result = func.failure(inst, result)
+            if profile is not None:
+                profile.record(inst.__class__.__qualname__, name, 0.0,
+                               isinstance(result, FAILURE_TYPES), hit=True)
+            return result
+
+        start = time.perf_counter()
+        if schema:
+            outcome = func.discrepancies(inst.data)
+            result = func.failure(inst, outcome)
+        else:
+            try:
+                outcome = result = func(inst)
+            except AssertionError as e:
+                # The traceback would retain the component
+                outcome = result = e.with_traceback(None)
+
+        if profile is not None:
+            profile.record(inst.__class__.__qualname__, name, time.perf_counter() - start,
+                           isinstance(result, FAILURE_TYPES))
+        if outcomes is not None and name not in plan.name_dependent:
+            outcomes[name] = outcome
+        return result
+
+
+    def validate_batch(self, components):
+        """
+        Applies the batch rules and warnings of the class of `components`
+        to them in a single call each. Warnings are also added to those of
+        the failing components, in name order among their own warnings.
+
+        Args:
+            components (List[PywrType]): Validated instances of a single class
+
+        Returns:
+            Dict[int, PywrTypeValidationErrorBundle]: The warnings and errors
+                of each component failing a batch rule, by index
+        """
+        if not components:
+            return {}
+
+        component_type = components[0].__class__
+        plan = RulePlan.for_class(component_type)
+        components_batch = ComponentBatch(components)
+        component = component_type.__qualname__
+
+        bundles = {}
+        for w, method in plan.batch_warnings:
+            for idx, result in self.batch_failures(component, w, method, components_batch):
+                inst = components[idx]
+                warning = PywrTypeValidationWarning(component, w, result, self.trim_value(inst.data))
+                # As if applied with the instance's own warnings, in name order
+                pos = next((i for i, other in enumerate(inst.warnings) if other.warning > w), len(inst.warnings))
+                inst.warnings.insert(pos, warning)
+                bundles.setdefault(idx, []).append(warning)
+
+        for r, method in plan.batch_rules:
+            for idx, result in self.batch_failures(component, r, method, components_batch):
+                inst = components[idx]
+                error = PywrTypeValidationError(component, r, result, self.trim_value(inst.data))
+                bundles.setdefault(idx, []).append(error)
+
+        return {
+            idx: PywrTypeValidationErrorBundle(f"{component} rule failures", bundle)
+            for idx, bundle in bundles.items()
+        }
+
+
+    @staticmethod
+    def batch_failures(component, name, method, components_batch):
+        """
+        Returns an `(index, failure)` pair for each component failing the
+        batch rule `method`.
+        """
+        start = time.perf_counter()
+        failed = method(components_batch)
+        if failed is None:
+            failures = []
+        elif isinstance(failed, dict):
+            failures = [(idx, message if isinstance(message, FAILURE_TYPES) else fail(message))
+                        for idx, message in failed.items()]
+        else:
+            failures = [(idx, fail(method.batch_message)) for idx in failed]
+
+        if (profile := active_profile.get()) is not None:
+            profile.record(component, name, time.perf_counter() - start, len(failures))
+        return failures
+
 
     def trim_value(self, value):
-        value_text = json.dumps(value)
-        remainder = len(value_text) - self.max_value_len
-        if remainder > 0:
-            s = "s" if remainder > 1 else ""
-            value_text = value_text[:self.max_value_len] + f"...[+{remainder} char{s}]"
+        return ValueText(value, self.max_value_len)
+
+
+class ValueText():
+    """
+    The JSON text of a component's value, as included in errors and warnings.
+    The text is rendered only when first used, from a shallow copy of a dict
+    value such that keys later replaced in the component's data, e.g. by
+    resolved parameters, are reported as they were. Text exceeding `max_len`
+    characters is truncated, with the number of characters omitted. Values of
+    more than `max_len` items are instead serialized incrementally, ending
+    once the text exceeds `max_len` characters.
+    """
+    encoder = json.JSONEncoder(default=lambda o: o.as_dict() if hasattr(o, "as_dict") else str(o))
+
+    def __init__(self, value, max_len=200):
+        self.value = dict(value) if isinstance(value, dict) else value
+        self.max_len = max_len
+        self.text = None
+
 
-        return value_text
+    def __str__(self):
+        if self.text is None:
+            self.text = self.render()
+            self.value = None
+        return self.text
+
+
+    def __reduce__(self):
+        return (str, (str(self),))
+
+
+    def render(self):
+        if not self.exceeds(self.value, self.max_len):
+            text = self.encoder.encode(self.value)
+            remainder = len(text) - self.max_len
+            if remainder > 0:
+                s = "s" if remainder > 1 else ""
+                return text[:self.max_len] + f"...[+{remainder} char{s}]"
+            return text
+
+        chunks = []
+        length = 0
+        for chunk in self.encoder.iterencode(self.value):
+            chunks.append(chunk)
+            length += len(chunk)
+            if length > self.max_len:
+                return "".join(chunks)[:self.max_len] + "...[truncated]"
+
+        return "".join(chunks)
+
+
+    @staticmethod
+    def exceeds(value, limit):
+        """
+        Returns ``True`` if the containers of `value` hold more than `limit`
+        items in total, in which case its text is also longer than `limit`.
+        """
+        total = 0
+        pending = [value] if isinstance(value, (dict, list, tuple)) else []
+        while pending:
+            items = pending.pop()
+            if isinstance(items, dict):
+                items = items.values()
+            total += len(items)
+            if total > limit:
+                return True
+            for item in items:
+                if isinstance(item, (dict, list, tuple)):
+                    pending.append(item)
+
+        return False
+
+
+def type_matches(typename, fuzzy, component_type):
+    """
+    Returns ``True`` if a rule decorated with `match(typename, fuzzy)`
+    applies to a component whose `type` is `component_type`.
+    """
+    typename = typename.lower()
+    component_type = component_type.lower()
+    if fuzzy:
+        return typename in component_type
+    elif not component_type.endswith("parameter"):
+        if typename.endswith("parameter"):
+            basematch = typename[:-9]
+        else:
+            basematch = typename
+
+        return basematch == component_type
+    else:
+        return typename == component_type
+
+
+def fatal(func):
+    """
+    Decorator marks a rule whose failure ends the validation of a component,
+    such that its remaining rules are not applied. Fatal rules are applied
+    before others, subject to any prerequisites. A fatal warning likewise
+    ends the application of warnings.
+    """
+    func.fatal = True
+    return func
+
+
+def requires(*names):
+    """
+    Decorator applies a rule or warning only if none of the rules or
+    warnings named in `names` failed or were themselves skipped, and
+    ensures that it is applied after them, e.g.::
+
+        @requires("rule_node_has_type")
+        def rule_known_type(self):
+            ...
+
+    Warnings are applied after all rules, such that a warning may require
+    a rule but not the reverse.
+    """
+    def requires_wrapper(func):
+        func.requires = names
+        return func
+    return requires_wrapper
 
 
 def match(typename, fuzzy=False):
@@ -152,36 +1113,154 @@ def match(typename, fuzzy=False):
         def wrapper(self, *args, **kwargs):
             if not (hasattr(self, "type") and self.type):
                 return
-            if fuzzy:
-                is_match = typename.lower() in self.type.lower()
-            elif not self.type.lower().endswith("parameter"):
-                if typename.lower().endswith("parameter"):
-                    basematch = typename.lower()[:-9]
-                else:
-                    basematch = typename.lower()
 
-                is_match = basematch == self.type.lower()
-            else:
-                is_match = typename.lower() == self.type.lower()
-
-            if is_match:
+            if type_matches(typename, fuzzy, self.type):
                 return func(self, *args, **kwargs)
 
+        # Allows validation to select rules by type without invoking the wrapper
+        wrapper.match_typename = typename
+        wrapper.match_fuzzy = fuzzy
         return wrapper
     return type_wrapper
 
 
-def sha256digest(filename: str) -> str:
-    import hashlib
+COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"PK\x03\x04": "zip"
+}
+
+# Raised by the decompressors when reading corrupt or truncated input
+DECOMPRESSION_ERRORS = (OSError, EOFError, lzma.LZMAError, zlib.error, zipfile.BadZipFile)
 
-    bufsz = 64 * 1024
-    sha256 = hashlib.sha256()
 
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Identifies the compression format of a file from its leading bytes.
+
+    Returns:
+        str: One of "gzip", "bz2", "xz" or "zip", or None if the
+            file is not compressed in a supported format
+    """
     with open(filename, 'rb') as fp:
-        while True:
-            buf = fp.read(bufsz)
-            if not buf:
-                break
-            sha256.update(buf)
+        head = fp.read(max(len(magic) for magic in COMPRESSION_MAGIC))
+
+    for magic, compression in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+
+
+class InputDigest():
+    """
+    Accumulates the sha256 digest of an input as it is read, such that
+    the input need not be read a second time to be hashed.
+    """
+    def __init__(self, decompressed: bool = False):
+        """
+        Args:
+            decompressed (bool): If ``True``, compressed input is hashed
+                after decompression. Otherwise the stored bytes are hashed.
+        """
+        import hashlib
+        self.decompressed = decompressed
+        self.sha256 = hashlib.sha256()
+
+    def update(self, buf):
+        if isinstance(buf, str):
+            buf = buf.encode()
+        self.sha256.update(buf)
+
+    def update_from(self, fp, bufsz=64*1024):
+        """ Reads `fp` to its end, hashing its content """
+        while buf := fp.read(bufsz):
+            self.update(buf)
+
+    def hexdigest(self) -> str:
+        return self.sha256.hexdigest()
+
+
+class HashingReader():
+    """
+    Wraps the binary file object `fp` such that all data read
+    is added to the `digest`.
+    """
+    def __init__(self, fp, digest: InputDigest):
+        self.fp = fp
+        self.digest = digest
+
+    def read(self, size=-1):
+        buf = self.fp.read(size)
+        self.digest.update(buf)
+        return buf
+
+    def readable(self):
+        return True
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def open_input(filename: str, digest: Optional[InputDigest] = None):
+    """
+    Context manager which opens `filename` for reading in binary mode.
+    Compressed files are decompressed transparently as they are read.
+    A zip archive must contain a single file, or a single '.json' file.
+
+    If a `digest` is provided, this is updated with the content of the file
+    as it is read. When hashing the stored bytes of a zip archive, which is
+    not read sequentially, the archive is read in full for this purpose.
+    """
+    compression = detect_compression(filename)
+    # Uncompressed input is the same whether stored or decompressed
+    hash_decompressed = digest is not None and digest.decompressed and compression is not None
+    hash_stored = digest is not None and not hash_decompressed
+
+    if compression == "zip":
+        if hash_stored:
+            with open(filename, 'rb') as raw:
+                digest.update_from(raw)
+        with zipfile.ZipFile(filename) as archive:
+            members = [m for m in archive.namelist() if not m.endswith('/')]
+            if len(members) > 1:
+                members = [m for m in members if m.lower().endswith(".json")]
+            if len(members) != 1:
+                raise zipfile.BadZipFile(f"Zip archive {filename} does not contain a single JSON file")
+            with archive.open(members[0]) as fp:
+                yield HashingReader(fp, digest) if hash_decompressed else fp
+        return
+
+    decompressor = {
+        "gzip": gzip.GzipFile,
+        "bz2": bz2.BZ2File,
+        "xz": lzma.LZMAFile
+    }.get(compression)
+
+    with open(filename, 'rb') as raw:
+        fp = HashingReader(raw, digest) if hash_stored else raw
+        if not decompressor:
+            yield fp
+        else:
+            with decompressor(fileobj=fp) if compression == "gzip" else decompressor(fp) as dfp:
+                yield HashingReader(dfp, digest) if hash_decompressed else dfp
+        if hash_stored:
+            # Include any trailing bytes not consumed by the decompressor
+            digest.update_from(raw)
+
+
+def sha256digest(filename: str, decompress: bool = False) -> str:
+    """
+    Returns the hex digest of the contents of `filename`.
+
+    Args:
+        filename (str): The file to be hashed
+        decompress (bool): If ``True``, a compressed file is hashed after
+            decompression. Otherwise the stored bytes are hashed.
+    """
+    digest = InputDigest(decompressed=decompress)
+    with open_input(filename, digest=digest) as fp:
+        while fp.read(64 * 1024):
+            pass
 
-    return sha256.hexdigest()
+    return digest.hexdigest()
@@ -0,0 +1,137 @@
+import os
+import pickle
+import pytest
+
+from pywrparser.cache import ValidationCache
+from pywrparser.parsers import PywrJSONParser
+from pywrparser.types.network import PywrNetwork
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ValidationCache(str(tmp_path / "cache"))
+
+
+def test_cache_hit_skips_parsing(valid_network_file, cache, monkeypatch):
+    """
+    Is a cached network returned without the input being parsed?
+    """
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, cache=cache)
+    assert errors is None
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Input parsed despite cached result")
+    monkeypatch.setattr(PywrJSONParser, "parse", fail)
+
+    cached, errors, warnings = PywrNetwork.from_file(valid_network_file, cache=cache)
+    assert errors is None
+    assert cached.as_dict() == network.as_dict()
+    assert cached.digest == network.digest
+
+
+@pytest.mark.parametrize("sections", [None, ["nodes", "edges"]])
+def test_cache_miss_reads_once(valid_network_file, cache, sections, monkeypatch):
+    """
+    Is input which is not cached read once, both to find its digest and to parse it?
+    """
+    from pywrparser.types import network as network_module
+    from pywrparser.utils import sha256digest
+
+    reads = []
+    read_file = PywrNetwork._read_file
+    monkeypatch.setattr(PywrNetwork, "_read_file",
+                        staticmethod(lambda *args: reads.append(args) or read_file(*args)))
+    monkeypatch.setattr(network_module, "open_input", None)
+
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, cache=cache, sections=sections)
+    assert errors is None and len(network.nodes) == 6
+    assert len(reads) == 1
+    assert network.digest == sha256digest(valid_network_file)
+
+
+def test_cache_invalid_network(invalid_network_file, cache):
+    """
+    Are errors and warnings restored intact from the cache?
+    """
+    _, errors, warnings = PywrNetwork.from_file(invalid_network_file, cache=cache)
+    network, cached_errors, cached_warnings = PywrNetwork.from_file(invalid_network_file, cache=cache)
+    assert network is None
+    for component, errs in errors.items():
+        assert [e.as_dict() for e in cached_errors[component]] == [e.as_dict() for e in errs]
+    assert repr(cached_warnings) == repr(warnings)
+
+
+def test_cache_rulesets(valid_network_file, cache, monkeypatch):
+    """
+    Are the results of each of several rulesets cached, and shared with
+    those of single rulesets?
+    """
+    PywrNetwork.from_file(valid_network_file, cache=cache, ruleset="strict")
+    results = PywrNetwork.from_file_rulesets(valid_network_file, [None, "strict"], cache=cache)
+    assert all(errors is None for _, errors, _ in results.values())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Input parsed despite cached result")
+    monkeypatch.setattr(PywrJSONParser, "parse", fail)
+
+    cached = PywrNetwork.from_file_rulesets(valid_network_file, [None, "strict"], cache=cache)
+    for ruleset, (network, errors, warnings) in cached.items():
+        assert network.as_dict() == results[ruleset][0].as_dict()
+        assert network.digest == results[ruleset][0].digest
+
+
+def test_cache_key_identifies_ruleset_and_options():
+    digest = "0" * 64
+    keys = {
+        ValidationCache.key(digest),
+        ValidationCache.key(digest, "strict"),
+        ValidationCache.key(digest, allow_duplicate_edges=False),
+        ValidationCache.key("1" * 64)
+    }
+    assert len(keys) == 4
+    assert ValidationCache.key(digest, "strict") == ValidationCache.key(digest, "strict")
+
+
+def test_cache_from_json(valid_network_file, cache):
+    with open(valid_network_file, 'r') as fp:
+        json_src = fp.read()
+
+    PywrNetwork.from_json(json_src, cache=cache)
+    assert len(os.listdir(cache.directory)) == 1
+    network, errors, warnings = PywrNetwork.from_json(json_src, cache=cache)
+    assert len(network.nodes) == 6
+    assert len(os.listdir(cache.directory)) == 1
+
+
+def test_cache_eviction(tmp_path):
+    """
+    Are the least recently used entries evicted when the cache is full?
+    """
+    cache = ValidationCache(str(tmp_path), max_size=3500)
+    for idx, key in enumerate(("a", "b", "c")):
+        cache.put(key, (None, {"network": ["x" * 1000]}, None))
+        path = cache._path(key)
+        os.utime(path, (idx, idx))
+
+    cache.get("a")
+    cache.put("d", (None, {"network": ["x" * 1000]}, None))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("d") is not None
+
+
+def test_cache_unreadable_entry(tmp_path):
+    cache = ValidationCache(str(tmp_path))
+    with open(cache._path("bad"), 'wb') as fp:
+        fp.write(b"not a pickle")
+
+    assert cache.get("bad") is None
+    assert not os.path.exists(cache._path("bad"))
+
+
+def test_exceptions_pickle(invalid_network):
+    """
+    Are validation errors and warnings picklable?
+    """
+    restored = pickle.loads(pickle.dumps((invalid_network.errors, invalid_network.warnings)))
+    assert repr(restored) == repr((invalid_network.errors, invalid_network.warnings))
@@ -1,3 +1,4 @@
+import os
 import pytest
 
 from pywrparser import parse
@@ -20,3 +21,46 @@ def test_version(capsys):
     assert exc.type == SystemExit
     version = capsys.readouterr().out
     assert version == __version__ + '\n'  # print adds newline
+
+
+@pytest.mark.parametrize("sections", ["nodes,edges", "parameters"])
+def test_partial_sections_report(valid_network_file, sections, capsys):
+    """ A subset of sections without metadata is reported """
+    args = parse.configure_args(["-f", valid_network_file, "--sections", sections, "--no-colour"])
+    parse.handle_args(args)
+    report = capsys.readouterr().out
+    assert "Title" not in report
+    assert ("Parameters: 5" in report) == (sections == "parameters")
+
+
+def test_rulesets_report(valid_network_file, tmp_path, capsys):
+    """
+    Is the network of each of several rulesets reported as that of a single
+    ruleset, with the cache used where given?
+    """
+    def report(*options):
+        args = parse.configure_args(["-f", valid_network_file, "--no-colour", "--no-digest", *options])
+        parse.handle_args(args)
+        return capsys.readouterr().out
+
+    # The report of a single ruleset, following the name of the file
+    single = report().split("\n", 1)[1]
+    several = report("--use-ruleset", "default", "--use-ruleset", "strict")
+    assert several.count(single) == 2
+
+    cache_options = ("--use-ruleset", "default", "--use-ruleset", "strict", "--cache-dir", str(tmp_path))
+    assert report(*cache_options) == several
+    assert len(os.listdir(tmp_path)) == 2
+    assert report(*cache_options) == several
+
+
+def test_decode_in_workers_report(valid_network_file, capsys):
+    """ Is the report unchanged where members are decoded by workers? """
+    def report(*options):
+        args = parse.configure_args(["-f", valid_network_file, "--no-colour", *options])
+        parse.handle_args(args)
+        return capsys.readouterr().out
+
+    assert report("--workers", "2", "--decode-in-workers") == report()
+    with pytest.raises(SystemExit):
+        report("--decode-in-workers", "--use-ruleset", "default", "--use-ruleset", "strict")
@@ -47,3 +47,14 @@ def test_results_as_dict(valid_network, valid_network_file):
         assert "errors" in output
     if warnings:
         assert "warnings" in output
+
+
+def test_results_ruleset(valid_network_file):
+    """ Is the ruleset applied by the parser that reported? """
+    from pywrparser.types.network import PywrNetwork
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, ruleset="strict")
+    assert network.ruleset == "strict"
+    output = results_as_dict(valid_network_file, errors, warnings, ruleset=network.ruleset)
+    assert output["parse_results"]["ruleset"] == "Strict Ruleset"
+    output = results_as_dict(valid_network_file, errors, warnings)
+    assert output["parse_results"]["ruleset"] == "Default"
@@ -62,6 +62,32 @@ def test_network_promote_inline_parameters(valid_network_file):
     network.promote_inline_parameters()
     assert isinstance(node.data["max_flow"], PywrParameter)
 
+def test_network_promote_invalid_inline_parameters():
+    """
+    Are all invalid inline parameters reported together, and not
+    validated when trusted?
+    """
+    from pywrparser.types.exceptions import PywrTypeValidationErrorBundle
+
+    inline = {"type": "aggregated", "parameters": []}
+    src = json.dumps({
+        "nodes": [
+            {"name": "in", "type": "input", "max_flow": dict(inline)},
+            {"name": "out", "type": "output", "cost": dict(inline)}
+        ],
+        "edges": [["in", "out"]]
+    })
+    network, errors, warnings = PywrNetwork.from_json(src)
+    with pytest.raises(PywrTypeValidationErrorBundle) as excinfo:
+        network.promote_inline_parameters()
+    assert len(excinfo.value.errors) == 2
+    # No node is modified where any inline parameter is invalid
+    assert network.nodes["in"].data["max_flow"] == inline
+
+    network, errors, warnings = PywrNetwork.from_json(src)
+    network.promote_inline_parameters(trusted=True)
+    assert isinstance(network.nodes["out"].data["cost"], PywrParameter)
+
 def test_network_detach_parameters(valid_network_file):
     network, errors, warnings = PywrNetwork.from_file(valid_network_file)
     node = network.nodes["Node_1"]
@@ -84,3 +110,200 @@ def test_network_promote_inline_recorders(valid_network_file):
     assert not isinstance(node.data["max_flow"], PywrRecorder)
     network.promote_inline_recorders()
     assert isinstance(node.data["max_flow"], PywrRecorder)
+
+def test_network_from_bytes_is_valid(valid_network_file):
+    """
+    Valid network bytes and memoryviews return a network instance and have no errors
+    """
+    with open(valid_network_file, 'rb') as fp:
+        src = fp.read()
+    for buf in (src, memoryview(src)):
+        network, errors, warnings = PywrNetwork.from_bytes(buf)
+        assert network is not None
+        assert errors is None
+
+def test_network_from_bytes_invalid_json():
+    network, errors, warnings = PywrNetwork.from_bytes(b'{"nodes": [}')
+    assert network is None
+    assert len(errors["network"]) == 1
+
+def test_network_from_empty_file(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.touch()
+    network, errors, warnings = PywrNetwork.from_file(str(empty))
+    assert network is None
+    assert len(errors["network"]) == 1
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz", "zip"])
+def test_network_from_compressed_file(valid_network_file, tmp_path, compression, stream):
+    """
+    Compressed files are identified and decompressed as they are read
+    """
+    import bz2, gzip, lzma, zipfile
+    with open(valid_network_file, 'rb') as fp:
+        src = fp.read()
+
+    compressed = tmp_path / "network.json.compressed"
+    if compression == "zip":
+        with zipfile.ZipFile(compressed, 'w') as archive:
+            archive.writestr("network.json", src)
+    else:
+        opener = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}[compression]
+        with opener(compressed, 'wb') as fp:
+            fp.write(src)
+
+    network, errors, warnings = PywrNetwork.from_file(str(compressed), stream=stream)
+    assert errors is None
+    assert len(network.nodes) == 6
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("decompressed", [False, True])
+def test_network_from_file_digest(valid_network_file, tmp_path, decompressed, stream):
+    """
+    The digest calculated while reading input matches that of a separate read
+    """
+    import gzip
+    from pywrparser.utils import InputDigest, sha256digest
+    compressed = tmp_path / "network.json.gz"
+    with open(valid_network_file, 'rb') as src, gzip.open(compressed, 'wb') as dest:
+        dest.write(src.read())
+
+    for filename in (valid_network_file, str(compressed)):
+        digest = InputDigest(decompressed=decompressed)
+        network, errors, warnings = PywrNetwork.from_file(filename, stream=stream, digest=digest)
+        assert network.digest == sha256digest(filename, decompress=decompressed)
+
+    with open(valid_network_file, 'rb') as fp:
+        digest = InputDigest()
+        network, errors, warnings = PywrNetwork.from_file(fp, stream=stream, digest=digest)
+    assert network.digest == sha256digest(valid_network_file)
+
+def test_network_from_file_digest_early_stop(tmp_path):
+    """
+    The digest includes input left unread when parsing stops early, hashed once
+    """
+    import hashlib
+    from pywrparser.utils import InputDigest
+    src = {
+        "metadata": {"title": "Early stop"},
+        "timestepper": {"start": "2000-01-01", "end": "2000-12-31", "timestep": 1},
+        "nodes": [{"name": "n1"}],
+        "edges": [],
+        "parameters": {f"p{i}": {"type": "constant", "value": i} for i in range(20000)}
+    }
+    filename = tmp_path / "network.json"
+    filename.write_text(json.dumps(src))
+    expected = hashlib.sha256(filename.read_bytes()).hexdigest()
+
+    digest = InputDigest()
+    network, errors, warnings = PywrNetwork.from_file(str(filename), stream=True, digest=digest, max_errors=1)
+    assert errors and digest.hexdigest() == expected
+
+    digest = InputDigest()
+    with open(filename, 'rb') as fp:
+        network, errors, warnings = PywrNetwork.from_file(fp, stream=True, digest=digest, max_errors=1)
+    assert errors and digest.hexdigest() == expected
+
+def test_network_from_file_sections(valid_network_file):
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, sections=["nodes", "edges"])
+    assert errors is None
+    assert len(network.nodes) == 6
+    assert not network.parameters and not network.recorders
+
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, sections=["parameters"])
+    assert errors is None
+    assert network.parameters and not network.nodes
+
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, sections=["nodes", "unknown"])
+    assert network is None
+    assert len(errors["network"]) == 1
+
+def test_network_lazy(valid_network_file):
+    """
+    Are components of a lazy network built only when accessed?
+    """
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, lazy=True)
+    assert errors is None
+    assert len(network.nodes) == 6
+    assert network.nodes.pending == 6
+
+    name = next(iter(network.nodes))
+    assert network.nodes[name].name == name
+    assert network.nodes.pending == 5
+
+    assert network.validate_all() == (None, None)
+    assert network.nodes.pending == 0
+    expected, _, _ = PywrNetwork.from_file(valid_network_file)
+    assert network.as_dict() == expected.as_dict()
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_network_lazy_promote_invalid_node(trusted):
+    """
+    Are nodes first built while inline parameters are promoted validated
+    in full, with their errors reported as for any other access?
+    """
+    from pywrparser.types.exceptions import PywrParserException
+    src = {
+        "metadata": {"title": "Lazy", "minimum_version": "1.0"},
+        "timestepper": {"start": "2020-01-01", "end": "2020-12-31", "timestep": 1},
+        "nodes": [
+            {"name": "n1", "type": "input", "max_flow": {"type": "constant", "value": 1}},
+            {"name": "n2"}
+        ],
+        "edges": [["n1", "n2"]]
+    }
+    network, errors, warnings = PywrNetwork.from_json(json.dumps(src), lazy=True)
+    assert errors is None
+
+    with pytest.raises(PywrParserException, match="n2"):
+        network.promote_inline_parameters(trusted=trusted)
+    with pytest.raises(PywrParserException):
+        network.nodes["n2"]
+
+    lazy_errors, _ = network.validate_all()
+    _, expected_errors, _ = PywrNetwork.from_json(json.dumps(src))
+    assert repr(lazy_errors["nodes"]) == repr(expected_errors["nodes"])
+
+def test_network_lazy_invalid_component(valid_network_file):
+    """
+    Are errors in lazily built components reported on access and by validate_all?
+    """
+    from pywrparser.types.exceptions import PywrParserException
+    with open(valid_network_file, 'r') as fp:
+        src = json.load(fp)
+    name = src["nodes"][0]["name"]
+    del src["nodes"][0]["type"]
+    json_src = json.dumps(src)
+
+    network, errors, warnings = PywrNetwork.from_json(json_src, lazy=True)
+    assert errors is None
+    with pytest.raises(PywrParserException):
+        network.nodes[name]
+
+    lazy_errors, lazy_warnings = network.validate_all()
+    _, expected_errors, _ = PywrNetwork.from_json(json_src)
+    assert repr(lazy_errors) == repr(expected_errors)
+
+
+def test_warning_value_after_resolution():
+    """
+    Is the value of a node's warning that of its input, where it is rendered
+    after parameter references of the node have been resolved?
+    """
+    src = {
+        "metadata": {"title": "Refs", "minimum_version": "1.0"},
+        "timestepper": {"start": "2020-01-01", "end": "2020-12-31", "timestep": 1},
+        "nodes": [
+            {"name": "in", "type": "input"},
+            {"name": "st", "type": "storage", "cost": "cost_p"}
+        ],
+        "edges": [["in", "st"]],
+        "parameters": {"cost_p": {"type": "constant", "value": 1}}
+    }
+    network, errors, warnings = PywrNetwork.from_json(json.dumps(src))
+    assert errors is None
+    network.attach_reference_parameters()
+    assert network.nodes["st"].data["cost"] is not None
+    [warning] = [w for w in warnings["nodes"] if '"st"' in w.valuetext]
+    assert json.loads(warning.valuetext)["cost"] == "cost_p"
@@ -0,0 +1,132 @@
+import json
+import pytest
+
+from pywrparser.parsers import (
+    PywrJSONParser,
+    PywrJSONRangeParser,
+    parallel,
+    pywrjsonrangeparser
+)
+from pywrparser.types.exceptions import PywrParserException
+from pywrparser.types.network import PywrNetwork
+
+
+def error_summary(errors):
+    return {component: sorted(repr(e) for e in errs) for component, errs in errors.items()}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_range_parser_matches_parser(invalid_network_file, workers, monkeypatch):
+    """
+    The range parser identifies the same errors as the standard parser,
+    whether members are validated by workers or by the parser itself
+    """
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1)
+    with open(invalid_network_file, 'rb') as fp:
+        json_src = fp.read()
+    parser = PywrJSONParser(json_src)
+    parser.parse()
+
+    range_parser = PywrJSONRangeParser(json_src)
+    range_parser.parse(workers=workers)
+
+    assert error_summary(range_parser.errors) == error_summary(parser.errors)
+    assert error_summary(range_parser.warnings) == error_summary(parser.warnings)
+    assert range_parser.parameters.keys() == parser.parameters.keys()
+    assert list(range_parser.nodes) == list(parser.nodes)
+    assert sorted(range_parser.duplicate_keys) == sorted(parser.duplicate_keys)
+
+
+def test_range_parser_without_components(invalid_network_file, monkeypatch):
+    """
+    Parameters and recorders are validated but not retained where
+    components are not requested
+    """
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1)
+    with open(invalid_network_file, 'r') as fp:
+        json_src = fp.read()
+    parser = PywrJSONParser(json_src)
+    parser.parse()
+
+    range_parser = PywrJSONRangeParser(json_src, components=False)
+    range_parser.parse(workers=2)
+
+    assert error_summary(range_parser.errors) == error_summary(parser.errors)
+    assert not range_parser.parameters and not range_parser.recorders
+    assert list(range_parser.nodes) == list(parser.nodes)
+
+
+def test_range_parser_encodings():
+    """
+    Members are located correctly in documents containing multi-byte
+    characters, and in encodings other than UTF-8
+    """
+    doc = {
+        "nodes": [{"name": "né", "type": "input"}, {"name": "水", "type": "output"}],
+        "edges": [["né", "水"]],
+        "parameters": {
+            "pü": {"type": "constant", "value": [[[[[1]]]]], "comment": "}\\\""},
+            "p\"2": {"type": "constant", "value": 2}
+        }
+    }
+    text = json.dumps(doc, ensure_ascii=False, indent=2)
+    for json_src in (text, text.encode("utf-8"), text.encode("utf-8-sig"), text.encode("utf-16")):
+        parser = PywrJSONRangeParser(json_src)
+        parser.parse(workers=1)
+        assert not parser.errors
+        assert {name: p.data for name, p in parser.parameters.items()} == doc["parameters"]
+        assert [n.data for n in parser.nodes.values()] == doc["nodes"]
+
+
+def test_range_parser_invalid_json():
+    """
+    Malformed members are reported when decoded during parsing, and
+    a malformed structure on creation
+    """
+    parser = PywrJSONRangeParser('{"nodes": [{"name": "n1", "type": input}]}')
+    with pytest.raises(PywrParserException, match="Invalid JSON document"):
+        parser.parse()
+
+    with pytest.raises(PywrParserException, match="Invalid JSON document"):
+        PywrJSONRangeParser('{"nodes": [{"name": "n1"} {"name": "n2"}]}')
+    with pytest.raises(PywrParserException, match="Extra data"):
+        PywrJSONRangeParser('{"nodes": []} []')
+
+
+def test_range_parser_shared_source(invalid_network_file, monkeypatch):
+    """
+    Workers map the file at the path given rather than a temporary copy,
+    and no copy is written when members are not validated by workers
+    """
+    def no_copy(*args, **kwargs):
+        raise AssertionError("Temporary copy of the document written")
+
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1)
+    monkeypatch.setattr(pywrjsonrangeparser.tempfile, "NamedTemporaryFile", no_copy)
+    with open(invalid_network_file, 'rb') as fp:
+        json_src = fp.read()
+    parser = PywrJSONParser(json_src)
+    parser.parse()
+
+    range_parser = PywrJSONRangeParser(json_src, path=invalid_network_file)
+    range_parser.parse(workers=2)
+    assert error_summary(range_parser.errors) == error_summary(parser.errors)
+
+    range_parser = PywrJSONRangeParser(json_src)
+    range_parser.parse()
+    assert range_parser._executor is None
+    assert error_summary(range_parser.errors) == error_summary(parser.errors)
+
+
+def test_network_decode_in_workers(invalid_network_file, monkeypatch):
+    """ Networks parsed by the range parser have the same outcome """
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1)
+    _, errors, warnings = PywrNetwork.from_file(invalid_network_file)
+    _, range_errors, range_warnings = PywrNetwork.from_file(invalid_network_file, workers=2,
+                                                            decode_in_workers=True)
+    assert error_summary(range_errors) == error_summary(errors)
+    assert error_summary(range_warnings or {}) == error_summary(warnings or {})
+
+    with open(invalid_network_file, 'rb') as fp:
+        _, range_errors, _ = PywrNetwork.from_file(fp, decode_in_workers=True)
+    assert error_summary(range_errors) == error_summary(errors)
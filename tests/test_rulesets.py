@@ -1,6 +1,7 @@
 import pytest
 
 from pywrparser import rules
+from pywrparser.types.exceptions import PywrParserException
 
 
 def test_all_rulesets_complete():
@@ -14,3 +15,151 @@ def test_all_rulesets_complete():
         assert data["name"] == ruleset_mod.__ruleset_name__
         assert data["version"] == ruleset_mod.__version__
         assert data["description"] == ruleset_mod.__description__
+
+
+def test_rule_plan_per_class(valid_network_file):
+    """
+    Are the rules of each class discovered once, and retained when
+    another ruleset is applied?
+    """
+    from pywrparser.parsers import PywrJSONParser
+    from pywrparser.utils import RulePlan
+
+    with open(valid_network_file, 'r') as fp:
+        json_src = fp.read()
+
+    parser = PywrJSONParser(json_src, ruleset="strict")
+    parser.parse()
+    node_type = type(next(iter(parser.nodes.values())))
+    assert node_type.__qualname__ == "StrictNode"
+    plan = RulePlan.for_class(node_type)
+    assert "rule_no_undersstart" in [name for name, _ in plan.rules]
+    assert [name for name, _ in plan.rules] == sorted(name for name, _ in plan.rules)
+
+    PywrJSONParser(json_src, ruleset="pywrmaster").parse()
+    assert RulePlan.for_class(node_type) is plan
+
+
+def test_concurrent_rulesets(valid_network_file):
+    """
+    Do parsers applying different rulesets in the same process each
+    use only their own ruleset's types?
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from pywrparser.parsers import PywrJSONParser
+
+    with open(valid_network_file, 'r') as fp:
+        json_src = fp.read()
+
+    def node_types(ruleset):
+        parser = PywrJSONParser(json_src, ruleset=ruleset)
+        parser.parse()
+        return {type(node).__qualname__ for node in parser.nodes.values()}
+
+    keys = ["strict", "pywrmaster", None] * 4
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(node_types, keys))
+
+    expected = {"strict": {"StrictNode"}, "pywrmaster": {"MasterNode"}, None: {"PywrNode"}}
+    assert results == [expected[key] for key in keys]
+
+
+def test_multiple_rulesets(invalid_network_file, monkeypatch):
+    """
+    Is a document decoded once when validated against several rulesets,
+    with the same results as validating it against each in turn?
+    """
+    from pywrparser.parsers import PywrJSONParser
+    from pywrparser.types.network import PywrNetwork
+    from pywrparser.utils import InputDigest
+
+    decode = PywrJSONParser.decode
+    decoded = []
+
+    def counting_decode(self, json_src):
+        decoded.append(json_src)
+        return decode(self, json_src)
+
+    monkeypatch.setattr(PywrJSONParser, "decode", counting_decode)
+    digest = InputDigest()
+    keys = [None, "strict", "pywrmaster"]
+    results = PywrNetwork.from_file_rulesets(invalid_network_file, keys, digest=digest)
+    assert len(decoded) == 1
+    assert list(results) == keys
+
+    for key in keys:
+        network, errors, warnings = results[key]
+        _, expected_errors, expected_warnings = PywrNetwork.from_file(invalid_network_file, ruleset=key)
+        assert network is None
+        assert {section: [str(err) for err in errs] for section, errs in errors.items()} == \
+               {section: [str(err) for err in errs] for section, errs in expected_errors.items()}
+        assert bool(warnings) == bool(expected_warnings)
+
+    with pytest.raises(PywrParserException, match="No ruleset with key"):
+        PywrNetwork.from_file_rulesets(invalid_network_file, [None, "undefined"])
+
+
+def test_parser_for_ruleset(valid_network_file):
+    from pywrparser.parsers import PywrJSONParser, PywrJSONStreamParser
+
+    with open(valid_network_file, 'r') as fp:
+        parser = PywrJSONParser(fp.read())
+    strict = parser.for_ruleset("strict")
+    strict.parse()
+    parser.parse()
+    assert strict.src["parameters"] is parser.src["parameters"]
+    # Each parser has its own node data, which is modified by promoting parameters
+    assert strict.src["nodes"] == parser.src["nodes"]
+    assert not any(a is b for a, b in zip(strict.src["nodes"], parser.src["nodes"]))
+    assert {type(node).__qualname__ for node in strict.nodes.values()} == {"StrictNode"}
+    assert {type(node).__qualname__ for node in parser.nodes.values()} == {"PywrNode"}
+
+    with open(valid_network_file, 'rb') as fp:
+        with pytest.raises(PywrParserException, match="no decoded document"):
+            PywrJSONStreamParser(fp).for_ruleset("strict")
+
+
+def test_unknown_ruleset():
+    from pywrparser.parsers import PywrJSONParser
+
+    with pytest.raises(PywrParserException, match="No ruleset with key"):
+        PywrJSONParser("{}", ruleset="undefined")
+
+
+def test_entry_point_rulesets(tmp_path, monkeypatch):
+    """
+    Are rulesets registered by entry points discovered, and imported
+    only when used?
+    """
+    import sys
+    from importlib.metadata import EntryPoint
+
+    (tmp_path / "inhouse_rules.py").write_text(
+        "from pywrparser.types.node import PywrNode\n"
+        "__key__ = 'inhouse'\n"
+        "__ruleset_name__ = 'In-house Ruleset'\n"
+        "__version__ = '1.0'\n"
+        "__description__ = 'A third-party ruleset'\n"
+        "class InhouseNode(PywrNode):\n"
+        "    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    entry_point = EntryPoint(name="inhouse", value="inhouse_rules", group=rules.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(rules, "ruleset_entry_points", lambda: [entry_point])
+    rules.reset_registry()
+    try:
+        assert "inhouse" in rules.get_registry()
+        assert "strict" in rules.get_registry()
+        assert "inhouse_rules" not in sys.modules
+
+        typemap = rules.get_typemap("inhouse")
+        assert typemap["PywrNode"].__qualname__ == "InhouseNode"
+        assert rules.get_ruleset("inhouse")["version"] == "1.0"
+    finally:
+        # The registry is process-wide, so must not retain the entry point ruleset
+        monkeypatch.undo()
+        rules.reset_registry()
+        sys.modules.pop("inhouse_rules", None)
+
+    assert "inhouse" not in rules.get_registry()
+    assert "inhouse" not in rules.get_rulesets()
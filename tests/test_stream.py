@@ -0,0 +1,110 @@
+import io
+import pytest
+
+from pywrparser.parsers import (
+    PywrJSONParser,
+    PywrJSONStreamParser
+)
+from pywrparser.parsers.pywrjsonparser import DuplicateKey
+from pywrparser.types.exceptions import PywrParserException
+from pywrparser.types.network import PywrNetwork
+
+
+def error_summary(errors):
+    return {component: sorted(repr(e) for e in errs) for component, errs in errors.items()}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 64*1024])
+def test_stream_parser_matches_parser(invalid_network_file, chunk_size):
+    """
+    The streaming parser identifies the same errors as the standard parser,
+    irrespective of where chunk boundaries fall
+    """
+    with open(invalid_network_file, 'r') as fp:
+        parser = PywrJSONParser(fp.read())
+    parser.parse()
+
+    with open(invalid_network_file, 'rb') as fp:
+        stream_parser = PywrJSONStreamParser(fp, chunk_size=chunk_size)
+        stream_parser.parse()
+
+    assert error_summary(stream_parser.errors) == error_summary(parser.errors)
+    assert stream_parser.parameters.keys() == parser.parameters.keys()
+    assert stream_parser.src is None
+
+
+def test_stream_parser_invalid_json():
+    """
+    Malformed input is reported when encountered during parsing
+    """
+    parser = PywrJSONStreamParser(io.StringIO('{"nodes": [{"name": "n1"} {"name": "n2"}]}'))
+    with pytest.raises(PywrParserException):
+        parser.parse()
+
+
+def test_stream_parser_trailing_data():
+    parser = PywrJSONStreamParser(io.StringIO('{"nodes": [], "edges": []} []'))
+    with pytest.raises(PywrParserException, match="Extra data"):
+        parser.parse()
+
+
+def test_stream_parser_repeated_sections():
+    """
+    Repeated top-level sections are recorded, and a repeated section
+    which is parsed is an error
+    """
+    src = '{"nodes": [{"name": "n1", "type": "input"}], "edges": [], "tables": {}, "tables": {}}'
+    parser = PywrJSONStreamParser(io.StringIO(src))
+    parser.parse(sections=["nodes", "edges"])
+    assert not parser.errors
+    assert parser.duplicate_keys == [DuplicateKey(None, "tables", "")]
+
+    parser = PywrJSONStreamParser(io.StringIO(src))
+    with pytest.raises(PywrParserException, match="'tables' occurs more than once"):
+        parser.parse()
+
+
+def test_network_from_file_stream(valid_network_file):
+    """
+    A streamed valid network is equal to one read in full
+    """
+    network, errors, warnings = PywrNetwork.from_file(valid_network_file, stream=True)
+    assert errors is None
+    expected, _, _ = PywrNetwork.from_file(valid_network_file)
+    assert network.as_dict() == expected.as_dict()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 64*1024])
+def test_stream_parser_sections(invalid_network_file, chunk_size):
+    """
+    Only the selected sections are parsed, and others are skipped
+    irrespective of where chunk boundaries fall
+    """
+    sections = ("nodes", "edges")
+    with open(invalid_network_file, 'r') as fp:
+        parser = PywrJSONParser(fp.read())
+    parser.parse(sections=sections)
+
+    with open(invalid_network_file, 'rb') as fp:
+        stream_parser = PywrJSONStreamParser(fp, chunk_size=chunk_size)
+        stream_parser.parse(sections=sections)
+
+    assert error_summary(stream_parser.errors) == error_summary(parser.errors)
+    assert set(parser.errors) <= {"nodes", "edges", "network"}
+    assert not stream_parser.parameters and stream_parser.metadata is None
+    assert len(stream_parser.nodes) == len(parser.nodes) > 0
+
+
+def test_stream_skip_value():
+    src = '{"a": {"s": "}]\\\\\\"{", "b": [[1, {}], "x"]}, "c": 2}'
+    from pywrparser.parsers.jsonstream import JSONStreamReader
+    for chunk_size in (1, 3, 64):
+        reader = JSONStreamReader(io.StringIO(src), chunk_size=chunk_size)
+        keys = []
+        for key in reader.iter_members():
+            keys.append(key)
+            if key == "a":
+                reader.skip_value()
+            else:
+                assert reader.read_value() == 2
+        assert keys == ["a", "c"]
@@ -1,7 +1,10 @@
+import json
 import pytest
 from pywrparser.utils import (
+    ValueText,
     canonical_name,
-    parse_reference_key
+    parse_reference_key,
+    sha256digest
 )
 
 @pytest.mark.parametrize(
@@ -27,3 +30,58 @@ def test_canonical_names(input_node, input_attr, expected):
     Are references correctly generated in canonical format?
     """
     assert canonical_name(input_node, input_attr) == expected
+
+
+def test_sha256digest_decompressed(valid_network_file, tmp_path):
+    """
+    A compressed file may be hashed as stored or after decompression
+    """
+    import gzip
+    compressed = tmp_path / "network.json.gz"
+    with open(valid_network_file, 'rb') as src, gzip.open(compressed, 'wb') as dest:
+        dest.write(src.read())
+
+    assert sha256digest(str(compressed), decompress=True) == sha256digest(valid_network_file)
+    assert sha256digest(str(compressed)) != sha256digest(valid_network_file)
+
+
+def test_value_text_deferred():
+    """
+    Is value text rendered only when used, and truncated at its maximum length?
+    """
+    value = {"values": list(range(100000))}
+    text = ValueText(value, max_len=40)
+    assert text.text is None
+
+    rendered = str(text)
+    assert rendered == json.dumps(value)[:40] + "...[truncated]"
+    assert text.value is None
+    assert str(ValueText({"type": "constant"})) == '{"type": "constant"}'
+
+
+def test_value_text_encoding():
+    """
+    Is the text of small and large values, including nested containers,
+    identical to that of the complete encoding?
+    """
+    small = {"type": "constant", "value": [1.5, 2.5], "comment": "é" * 300}
+    nested = {"type": "dataframe", "data": {"col": [list(range(10))] * 50}}
+    assert not ValueText.exceeds(small, 200)
+    assert ValueText.exceeds(nested, 200)
+    for value in ("text", 1.0, None):
+        assert str(ValueText(value)) == json.dumps(value)
+    # The number of characters omitted is known where the value is encoded in full
+    text = json.dumps(small)
+    assert str(ValueText(small)) == text[:200] + f"...[+{len(text) - 200} chars]"
+    assert str(ValueText(list(range(60)))) == json.dumps(list(range(60)))[:200] + "...[+30 chars]"
+    assert str(ValueText(nested)) == json.dumps(nested)[:200] + "...[truncated]"
+
+
+def test_value_text_snapshot():
+    """
+    Is the value reported as it was, where keys of the data are replaced later?
+    """
+    data = {"name": "st", "type": "storage", "cost": "cost_p"}
+    text = ValueText(data)
+    data["cost"] = {"type": "constant", "value": 1}
+    assert str(text) == '{"name": "st", "type": "storage", "cost": "cost_p"}'
@@ -116,3 +116,444 @@ def test_duplicate_edges(invalid_network):
     assert len(invalid_network.duplicate_edges) == 1
     key = next(iter(invalid_network.duplicate_edges))
     assert invalid_network.duplicate_edges[key] == 2
+
+
+def test_duplicate_keys_side_table(invalid_network):
+    """
+    Repeated component names are recorded in the side table, with
+    no altered names among the parsed components
+    """
+    duplicates = {(d.section, d.name, d.location) for d in invalid_network.duplicate_keys}
+    assert duplicates == {
+        ("parameters", "Duplicate parameter", "/parameters"),
+        ("recorders", "Duplicate recorder", "/recorders")
+    }
+    assert set(invalid_network.parameters) == {"Valid parameter", "Duplicate parameter"}
+
+
+def test_nested_duplicate_key_location():
+    src = '{"nodes": [{"name": "n1", "type": "input"}, {"name": "n2", "type": "input", "type": "output"}]}'
+    parser = PywrJSONParser(src)
+    parser.parse()
+    assert [tuple(d) for d in parser.duplicate_keys] == [("nodes", "type", "/nodes/1")]
+    assert parser.nodes["n2"].type == "output"
+
+
+def test_duplicate_table_names():
+    """
+    Repeated table names are recorded but, unlike repeated parameter names,
+    are not an error, with the last table taking precedence
+    """
+    src = ('{"tables": {"t": {"url": "a.csv"}, "t": {"url": "b.csv"}},'
+           ' "parameters": {"p": {"type": "constant", "value": 1}, "p": {"type": "constant", "value": 2}}}')
+    parser = PywrJSONParser(src)
+    parser.parse()
+    assert [tuple(d) for d in parser.duplicate_keys] == [("tables", "t", "/tables"), ("parameters", "p", "/parameters")]
+    assert parser.tables["t"].data["url"] == "b.csv"
+    assert [e.message for e in parser.errors["network"] if "Duplicate" in e.message] == ["Duplicate parameter name <p>"]
+
+
+@pytest.mark.parametrize("max_errors", [1, 2, 5])
+def test_max_errors(invalid_network_file, max_errors):
+    """
+    Does parsing end once the error budget is exhausted?
+    """
+    with open(invalid_network_file, 'r') as fp:
+        parser = PywrJSONParser(fp.read())
+    parser.parse(max_errors=max_errors)
+
+    assert parser.truncated
+    marker = parser.errors["network"][-1]
+    assert "Parsing ended" in marker.message
+    assert max_errors <= parser.error_count - 1 < max_errors + 2
+
+
+@pytest.mark.parametrize("max_errors", [1, 2, 3])
+def test_max_errors_across_sections(max_errors):
+    """
+    Does parsing end where the error budget is exhausted by earlier sections,
+    before any member of a later section is built?
+    """
+    bad = {
+        "metadata": {},
+        "timestepper": {},
+        "parameters": {f"p{i}": {} for i in range(10)},
+        "nodes": [{}] * 10,
+        "edges": []
+    }
+    parser = PywrJSONParser(json.dumps(bad))
+    parser.parse(max_errors=max_errors)
+
+    assert parser.truncated
+    assert "Parsing ended" in parser.errors["network"][-1].message
+    assert "nodes" not in parser.errors
+    assert not any("no nodes" in e.message for e in parser.errors["network"])
+
+
+def test_max_errors_not_reached(invalid_network, invalid_network_file):
+    with open(invalid_network_file, 'r') as fp:
+        parser = PywrJSONParser(fp.read())
+    parser.parse(max_errors=1000)
+
+    assert not parser.truncated
+    assert parser.error_count == invalid_network.error_count
+
+
+@pytest.mark.parametrize(
+    ("component_type", "expected"), [
+        ("aggregatedparameter", {"rule_aggregated_has_agg_func", "rule_aggregated_has_parameters",
+                                 "rule_aggregated_has_paramlist"}),
+        ("Aggregated", {"rule_aggregated_has_agg_func", "rule_aggregated_has_parameters",
+                        "rule_aggregated_has_paramlist"}),
+        ("AggregatedParameterX", set()),
+        ("MonthlyProfile", {"warn_monthlyprofile_has_profile"}),
+        ("tablesdataframeparameter", {"warn_outdated_pandas"}),
+        ("constant", set()),
+        (None, set())
+    ]
+)
+def test_match_rules_by_type(component_type, expected):
+    """
+    Are only the typed rules matching a component's type applied to it?
+    """
+    from pywrparser.types.parameter import PywrParameter
+    from pywrparser.utils import RulePlan
+
+    plan = RulePlan.for_class(PywrParameter)
+    generic = {name for name, _ in plan.resolve(None)[0] + plan.resolve(None)[1]}
+    warnings, rules = plan.resolve(component_type)
+    assert {name for name, _ in warnings + rules} - generic == expected
+
+
+def test_rule_failure_styles():
+    """
+    Are failures both returned and raised by rules reported alike?
+    """
+    from pywrparser.types.node import PywrNode
+    from pywrparser.types.exceptions import PywrTypeValidationErrorBundle
+    from pywrparser.utils import fail
+
+    class StyledNode(PywrNode):
+        def rule_returned(self):
+            return fail(f"Node <{self.name}> returned failure")
+
+        def rule_raised(self):
+            raise AssertionError(f"Node <{self.name}> raised failure")
+
+        def warn_returned(self):
+            return fail("Warning returned")
+
+    with pytest.raises(PywrTypeValidationErrorBundle) as excinfo:
+        StyledNode({"name": "node", "type": "input"})
+
+    errors = {err.rule: str(err.exc) for err in excinfo.value.errors}
+    assert errors == {
+        "rule_raised": "Node <node> raised failure",
+        "rule_returned": "Node <node> returned failure"
+    }
+
+
+def test_rule_schema():
+    """
+    Are schemas merged across subclasses, with unnamed entries applied
+    as a single check and named entries reported as their own rules?
+    """
+    from pywrparser.types.parameter import PywrParameter
+    from pywrparser.types.exceptions import PywrTypeValidationErrorBundle
+    from pywrparser.utils import fail, requires
+
+    class SchemaParameter(PywrParameter):
+        rule_schema = {
+            "*": {"forbidden": ["comment"]},
+            "aggregatedparameter": {"required": ["weights"], "kinds": {"agg_func": str}}
+        }
+
+        @requires("rule_cc_has_storage")
+        def rule_cc_has_curves(self):
+            if self.type == "controlcurve" and "control_curves" not in self.data:
+                return fail("No control curves")
+
+    with pytest.raises(PywrTypeValidationErrorBundle) as excinfo:
+        SchemaParameter("agg", {"type": "aggregated", "parameters": "p1", "agg_func": 1, "comment": ""})
+
+    errors = {err.rule: str(err.exc) for err in excinfo.value.errors}
+    assert errors == {
+        "rule_aggregated_has_paramlist": "AggregatedParameter <agg> has invalid parameters",
+        "rule_schema": "aggregated <agg> does not define 'weights', "
+                       "and must not define 'comment', "
+                       "and has invalid 'agg_func' of type int"
+    }
+
+    with pytest.raises(PywrTypeValidationErrorBundle) as excinfo:
+        SchemaParameter("cc", {"type": "controlcurve"})
+    errors = {err.rule: str(err.exc) for err in excinfo.value.errors}
+    assert errors == {"rule_cc_has_storage": "ControlCurveParameter <cc> does not define 'storage_node'"}
+
+    param = SchemaParameter("df", {"type": "tablesdataframe", "pandas_kwargs": {}})
+    assert [w.warning for w in param.warnings] == ["warn_outdated_pandas"]
+
+
+def test_batch_rules():
+    """
+    Are batch rules applied once per section by the parser, and to
+    components created individually?
+    """
+    from pywrparser.types.node import PywrNode
+    from pywrparser.types.exceptions import PywrTypeValidationErrorBundle
+    from pywrparser.utils import batch
+
+    calls = []
+
+    class BatchNode(PywrNode):
+        @batch("Node name contains a space")
+        def rule_name_no_space(cls, nodes):
+            calls.append(len(nodes))
+            return [idx for idx, name in enumerate(nodes.names) if " " in name]
+
+        @batch("Unused")
+        def warn_cost(cls, nodes):
+            return {idx: f"Node <{nodes.names[idx]}> has negative cost"
+                    for idx, cost in enumerate(nodes.column("cost", 0)) if cost < 0}
+
+    src = json.dumps({"nodes": [
+        {"name": "in put", "type": "input"},
+        {"name": "output", "type": "output", "cost": -1},
+        {"name": "in store", "type": "storage"},
+        {"name": "store", "type": "storage"},
+        {"name": "link", "type": "link"}
+    ]})
+    parser = PywrJSONParser(src)
+    parser.typemap = {**parser.typemap, "PywrNode": BatchNode}
+    parser.parse()
+
+    assert calls == [5]
+    assert set(parser.nodes) == {"output", "store", "link"}
+    assert [str(e.exc) for e in parser.errors["nodes"]] == ["Node name contains a space"] * 2
+    # Components failing batch rules report no warnings, and others report theirs in turn
+    assert [str(w.exc) for w in parser.warnings["nodes"]] == [
+        "Node <output> has negative cost",
+        "<storage> node does not define 'max_volume'"
+    ]
+
+    with pytest.raises(PywrTypeValidationErrorBundle):
+        BatchNode({"name": "in put", "type": "input"})
+    node = BatchNode({"name": "output", "type": "output", "cost": -1})
+    assert [w.warning for w in node.warnings] == ["warn_cost"]
+
+
+def test_rule_memo():
+    """
+    Are rule outcomes reused for components with identical data, other
+    than those of rules which depend upon the component's name?
+    """
+    from pywrparser.types.parameter import PywrParameter
+    from pywrparser.utils import RuleMemo, fail
+
+    calls = []
+
+    class MemoParameter(PywrParameter):
+        def rule_values_positive(self):
+            calls.append("values")
+            if min(self.data.get("values", [0])) < 0:
+                return fail("Parameter has negative values")
+
+        def rule_name_prefix(self):
+            calls.append("name")
+            if not self.name.startswith("p"):
+                return fail(f"Parameter <{self.name}> is not prefixed")
+
+    params = {f"{prefix}{idx}": {"type": "constant", "values": [-1]}
+              for idx, prefix in enumerate("ppq")}
+    memo = RuleMemo()
+    parser = PywrJSONParser(json.dumps({"parameters": params}))
+    parser.typemap = {**parser.typemap, "PywrParameter": MemoParameter}
+    parser.parse(memoize=memo)
+
+    assert calls.count("values") == 1
+    assert calls.count("name") == 3
+    assert (memo.hits, memo.misses) == (2, 1)
+    assert [str(e.exc) for e in parser.errors["parameters"]] == [
+        "Parameter has negative values",
+        "Parameter has negative values",
+        "Parameter <q2> is not prefixed",
+        "Parameter has negative values"
+    ]
+
+    memo.clear()
+    assert len(memo) == 0
+
+
+def test_rule_memo_schema():
+    """
+    Are the outcomes of the built-in schema rules reused for parameters with
+    identical data, with the message of each naming its own parameter?
+    """
+    from pywrparser.utils import RuleMemo, RuleProfile
+
+    params = {f"agg{idx}": {"type": "aggregatedparameter", "parameters": "p"} for idx in range(1000)}
+    profile = RuleProfile()
+    parser = PywrJSONParser(json.dumps({"parameters": params}))
+    parser.parse(memoize=RuleMemo(), profile=profile)
+
+    stats = profile.stats
+    for rule in ("rule_aggregated_has_agg_func", "rule_aggregated_has_paramlist"):
+        assert (stats[("PywrParameter", rule)].calls, stats[("PywrParameter", rule)].hits) == (1, 999)
+        assert stats[("PywrParameter", rule)].failures == 1000
+    messages = [str(e.exc) for e in parser.errors["parameters"]]
+    assert messages[:2] == [
+        "AggregatedParameter <agg0> does not define 'agg_func'",
+        "AggregatedParameter <agg0> has invalid parameters"
+    ]
+    assert messages[-1] == "AggregatedParameter <agg999> has invalid parameters"
+
+
+def test_rule_profile(invalid_network_file):
+    """
+    Are the calls and failures of each rule recorded when profiling?
+    """
+    from pywrparser.utils import RuleProfile
+
+    with open(invalid_network_file, 'r') as fp:
+        parser = PywrJSONParser(fp.read())
+    profile = RuleProfile()
+    parser.parse(profile=profile)
+
+    assert parser.rule_profile is profile
+    stats = {s["rule"]: s for s in profile.as_dict() if s["component"] in ("PywrNode", "PywrEdge")}
+    assert stats["rule_source_and_target_distinct"]["failures"] == 1
+    assert stats["warn_node_name_min_len"]["calls"] == 1
+    assert stats["rule_node_has_name"]["calls"] == len(parser.src["nodes"])
+    times = [s["total_time"] for s in profile.as_dict()]
+    assert times == sorted(times, reverse=True)
+
+
+def test_deferred_validation():
+    """
+    Are components created with deferred validation validated together
+    only when requested?
+    """
+    from pywrparser.types.node import PywrNode
+    from pywrparser.utils import DeferredValidation, deferred_validation
+
+    with deferred_validation() as deferred:
+        nodes = [PywrNode({"name": "a", "type": "input"}), PywrNode({"name": "b"})]
+    assert len(deferred) == 2
+
+    failures = deferred.validate()
+    assert [inst for inst, _ in failures] == [nodes[1]]
+    assert [w.warning for w in nodes[0].warnings] == ["warn_node_name_min_len"]
+
+    nodes[1].data["type"] = "output"
+    assert DeferredValidation(nodes).validate() == []
+
+
+def test_rule_prerequisites():
+    """
+    Are rules skipped after a fatal rule fails or when their prerequisites
+    fail, and applied after their prerequisites?
+    """
+    from pywrparser.types.exceptions import PywrParserException
+    from pywrparser.types.node import PywrNode
+    from pywrparser.types.exceptions import PywrTypeValidationErrorBundle
+    from pywrparser.utils import RulePlan, fail, requires
+
+    class DependentNode(PywrNode):
+        def rule_a_cost(self):
+            if "cost" not in self.data:
+                return fail("No cost")
+
+        @requires("rule_a_cost")
+        def rule_cost_positive(self):
+            if self.data["cost"] < 0:
+                return fail("Negative cost")
+
+        @requires("rule_z_first")
+        def rule_b_second(self):
+            pass
+
+        def rule_z_first(self):
+            pass
+
+    _, rules = RulePlan.for_class(DependentNode).resolve("input")
+    names = [name for name, _ in rules]
+    assert names[:2] == ["rule_node_has_name", "rule_node_has_type"]
+    assert names.index("rule_z_first") < names.index("rule_b_second")
+
+    with pytest.raises(PywrTypeValidationErrorBundle) as excinfo:
+        DependentNode({"name": "node", "type": "input"})
+    assert [err.rule for err in excinfo.value.errors] == ["rule_a_cost"]
+
+    with pytest.raises(PywrTypeValidationErrorBundle) as excinfo:
+        DependentNode({"name": "node"})
+    assert [err.rule for err in excinfo.value.errors] == ["rule_node_has_type"]
+
+    class CircularNode(PywrNode):
+        @requires("rule_y")
+        def rule_x(self):
+            pass
+
+        @requires("rule_x")
+        def rule_y(self):
+            pass
+
+    with pytest.raises(PywrParserException, match="Circular"):
+        RulePlan.for_class(CircularNode).resolve(None)
+
+    class UnknownNode(PywrNode):
+        @requires("rule_missing")
+        def rule_x(self):
+            pass
+
+    with pytest.raises(PywrParserException, match="unknown rules: rule_missing"):
+        RulePlan.for_class(UnknownNode)
+
+
+def test_parallel_validation(monkeypatch):
+    """
+    Are the results of validation in worker processes identical to
+    those of validation by the parser alone?
+    """
+    from pywrparser.parsers import parallel
+    from pywrparser.utils import RuleProfile
+
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 10)
+    nodes = [{"name": f"n{i}", "type": "input"} if i % 7 else {"name": f"n{i}"} for i in range(100)]
+    nodes.extend([{"name": "n", "type": "output"}, {"name": "store", "type": "storage"}])
+    parameters = {f"p{i}": {"type": "constant", "value": i} if i % 9 else {"value": i} for i in range(100)}
+    json_src = json.dumps({
+        "metadata": {"title": "Parallel", "minimum_version": "0.1"},
+        "timestepper": {"start": "2000-01-01", "end": "2000-12-31", "timestep": 1},
+        "nodes": nodes,
+        "edges": [[f"n{i}", f"n{i+1}"] for i in range(99)],
+        "parameters": parameters
+    })
+
+    def results(**kwargs):
+        parser = PywrJSONParser(json_src, ruleset="strict")
+        parser.parse(**kwargs)
+        errors = {section: [str(e) for e in errs] for section, errs in parser.errors.items()}
+        warnings = {section: [str(w) for w in warns] for section, warns in parser.warnings.items()}
+        return errors, warnings, list(parser.nodes), list(parser.parameters)
+
+    serial = results()
+    assert serial[0]["nodes"] and serial[0]["parameters"] and serial[1]["nodes"]
+    assert results(workers=2) == serial
+    assert results(workers=2, max_errors=5) == results(max_errors=5)
+
+    serial_profile, parallel_profile = RuleProfile(), RuleProfile()
+    results(profile=serial_profile)
+    results(profile=parallel_profile, workers=2)
+    calls = lambda profile: {key: stats.calls for key, stats in profile.stats.items()}
+    assert calls(parallel_profile) == calls(serial_profile)
+
+
+def test_batch_warning_order():
+    """
+    Are the warnings of batch rules reported in name order among those of
+    each node, as where all warnings are applied to each node in turn?
+    """
+    src = {"nodes": [{"name": "s", "type": "storage"}, {"name": "in", "type": "input"}], "edges": [["in", "s"]]}
+    parser = PywrJSONParser(json.dumps(src))
+    parser.parse()
+    assert [w.warning for w in parser.warnings["nodes"]] == ["warn_node_name_min_len", "warn_storage_has_max_volume"]
+    assert [w.warning for w in parser.nodes["s"].warnings] == ["warn_node_name_min_len", "warn_storage_has_max_volume"]